@@ -0,0 +1,122 @@
+"""
+Synthetic Journal Corpus
+Generates journal-like texts with a realistic (log-normal) length distribution
+"""
+
+import math
+import random
+from typing import Dict, List, Optional
+
+OPENERS = [
+    "Today was", "This morning felt", "Work was", "The evening was", "I woke up feeling",
+    "Lunch with my friend was", "The meeting went", "My run this afternoon was",
+    "Talking to my family was", "Getting through the day was"
+]
+
+POSITIVE = [
+    "really good", "calm and productive", "better than expected", "a lot of fun",
+    "peaceful", "energizing", "surprisingly great", "relaxed"
+]
+
+NEGATIVE = [
+    "exhausting", "stressful", "pretty lonely", "overwhelming", "frustrating",
+    "harder than I hoped", "anxious", "draining"
+]
+
+NEUTRAL = [
+    "okay I guess", "mostly routine", "uneventful", "fine", "a bit of a blur",
+    "about the same as yesterday"
+]
+
+DETAILS = [
+    "I keep thinking about the deadline next week.",
+    "I slept around six hours which is not enough.",
+    "We talked about moving to a new apartment.",
+    "My manager gave some feedback on the project.",
+    "I tried the breathing exercise before bed.",
+    "The weather was grey and it rained all afternoon.",
+    "I cooked dinner at home for the first time in a while.",
+    "A friend called and we caught up for an hour.",
+    "I skipped the gym again and feel guilty about it.",
+    "I finally finished the book I started last month.",
+    "Money has been tight and I worry about rent.",
+    "My sister and I argued about the holidays."
+]
+
+# Word-count buckets used by the benchmark sweeps
+LENGTH_BUCKETS = {
+    "short": (5, 40),
+    "medium": (40, 200),
+    "long": (200, 1200)
+}
+
+
+def _sentence(rng: random.Random) -> str:
+    tone = rng.choice([POSITIVE, NEGATIVE, NEUTRAL])
+    if rng.random() < 0.4:
+        return f"{rng.choice(OPENERS)} {rng.choice(tone)}."
+    return rng.choice(DETAILS)
+
+
+def journal_entry(n_words: int, rng: random.Random) -> str:
+    """
+    Build one synthetic journal entry
+
+    Args:
+        n_words: Approximate word count
+        rng: Random source
+
+    Returns:
+        Entry text
+    """
+    sentences = []
+    words = 0
+    while words < n_words:
+        sentence = _sentence(rng)
+        sentences.append(sentence)
+        words += len(sentence.split())
+    return " ".join(sentences)
+
+
+def generate_corpus(n_texts: int = 500, seed: int = 42,
+                    median_words: int = 60, sigma: float = 0.9) -> List[str]:
+    """
+    Generate entries whose word counts follow a log-normal distribution
+
+    Args:
+        n_texts: Number of entries
+        seed: Random seed
+        median_words: Median entry length in words
+        sigma: Log-normal shape (larger = longer tail)
+
+    Returns:
+        List of entries
+    """
+    rng = random.Random(seed)
+    mu = math.log(median_words)
+    return [
+        journal_entry(max(3, int(rng.lognormvariate(mu, sigma))), rng)
+        for _ in range(n_texts)
+    ]
+
+
+def bucket_corpus(corpus: List[str], buckets: Optional[Dict[str, tuple]] = None) -> Dict[str, List[str]]:
+    """
+    Split a corpus into length buckets
+
+    Args:
+        corpus: Entries
+        buckets: Name -> (min words, max words)
+
+    Returns:
+        Name -> entries in that bucket
+    """
+    buckets = buckets or LENGTH_BUCKETS
+    grouped: Dict[str, List[str]] = {name: [] for name in buckets}
+    for text in corpus:
+        n_words = len(text.split())
+        for name, (low, high) in buckets.items():
+            if low <= n_words < high:
+                grouped[name].append(text)
+                break
+    return grouped
@@ -0,0 +1,340 @@
+"""
+Mood Forecast Backtest and Latency Benchmark
+Runs rolling-origin backtests of MoodPredictor.train_model and predict_mood over
+synthetic users and reports forecast error, fit/predict latency and model memory
+per model variant.
+
+Usage:
+    python -m benchmarks.forecast_bench --output bench_forecast.json --csv bench_forecast.csv
+    python -m benchmarks.forecast_bench --profile small --variants ladder,baseline
+"""
+
+import argparse
+import csv
+import json
+import multiprocessing
+import os
+import pickle
+import platform
+import tempfile
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+from benchmarks.mood_histories import generate_mood_histories
+from benchmarks.sentiment_bench import peak_rss_mb
+
+# Simulated population per profile
+PROFILES = {
+    "small": {"n_users": 12, "days": 42, "step": 7},
+    "full": {"n_users": 2000, "days": 120, "step": 7}
+}
+
+
+def _ridge_candidates() -> Dict[str, Any]:
+    from src.ai.forecast_models import RidgeForecaster
+    from src.ai.mood_predictor import TARGET_WEEKDAY_COLUMN
+
+    return {"ridge_3": RidgeForecaster(alpha=3.0, weekday_column=TARGET_WEEKDAY_COLUMN)}
+
+
+def _gbm_candidates() -> Dict[str, Any]:
+    from sklearn.ensemble import GradientBoostingRegressor
+
+    # The model every user got before the forecast_models ladder
+    return {"gbm": GradientBoostingRegressor(n_estimators=100, learning_rate=0.1, max_depth=3, random_state=42)}
+
+
+def _hist_gbm_candidates() -> Dict[str, Any]:
+    from src.ai.forecast_models import candidate_models, LONG_HISTORY_ENTRIES
+
+    return {"hist_gbm": candidate_models(LONG_HISTORY_ENTRIES)["hist_gbm"]}
+
+
+# Variant name -> factory of fit_mood_model candidates (None = no model, baseline forecasts only)
+VARIANTS: Dict[str, Optional[Callable[[], Optional[Dict[str, Any]]]]] = {
+    "ladder": lambda: None,
+    "ridge": _ridge_candidates,
+    "gbm": _gbm_candidates,
+    "hist_gbm": _hist_gbm_candidates,
+    "baseline": None
+}
+
+
+def build_predictor(variant: str, store_dir: Path):
+    """
+    MoodPredictor that fits the given variant into its own model store
+
+    Args:
+        variant: Key of VARIANTS
+        store_dir: Directory for the variant's models
+
+    Returns:
+        MoodPredictor instance
+    """
+    from src.ai.mood_model_store import MoodModelStore
+    from src.ai.mood_predictor import MoodPredictor, fit_mood_model
+
+    factory = VARIANTS[variant]
+
+    class VariantPredictor(MoodPredictor):
+        def _fit(self, df):
+            if factory is None:
+                return None
+            return fit_mood_model(df, self.forecast_days, factory())
+
+    return VariantPredictor(store=MoodModelStore(store_dir=store_dir / variant))
+
+
+def backtest_users(histories: Dict[str, List[Dict[str, Any]]], variants: List[str],
+                   min_train: int, step: int, horizon: int) -> Dict[str, Any]:
+    """
+    Rolling-origin backtest of a group of users (runs in a worker process)
+
+    At every origin the variant is trained on the entries before it and
+    forecasts the next `horizon` days, which are compared with the entries
+    actually logged.
+
+    Args:
+        histories: Mapping of user ID to daily mood entries, oldest first
+        variants: Variants to run
+        min_train: Entries before the first origin
+        step: Entries between origins
+        horizon: Days forecast at each origin
+
+    Returns:
+        Raw per-variant errors and timings, plus this process's peak RSS
+    """
+    raw = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for variant in variants:
+            predictor = build_predictor(variant, Path(tmp))
+            errors: List[List[float]] = [[] for _ in range(horizon)]
+            fit_seconds, predict_seconds, model_bytes = [], [], []
+            baseline_forecasts = 0
+
+            for uid, history in histories.items():
+                for origin in range(min_train, len(history) - horizon + 1, step):
+                    train = history[:origin]
+                    actual = [e['mood_score'] for e in history[origin:origin + horizon]]
+
+                    t0 = time.perf_counter()
+                    predictor.train_model(train, uid)
+                    fit_seconds.append(time.perf_counter() - t0)
+
+                    t0 = time.perf_counter()
+                    result = predictor.predict_mood(train, days_ahead=horizon, uid=uid, train_inline=True)
+                    predict_seconds.append(time.perf_counter() - t0)
+
+                    if not result or not result['success']:
+                        continue
+                    baseline_forecasts += int(result['baseline'])
+                    for h, (prediction, score) in enumerate(zip(result['predictions'], actual)):
+                        errors[h].append(abs(prediction['predicted_mood'] - score))
+
+                artifact = predictor.store.get(uid)
+                if artifact is not None:
+                    model_bytes.append(len(pickle.dumps(artifact['model'])))
+                predictor.store.evict(uid)
+
+            raw[variant] = {
+                "errors": errors,
+                "fit_seconds": fit_seconds,
+                "predict_seconds": predict_seconds,
+                "model_bytes": model_bytes,
+                "baseline_forecasts": baseline_forecasts
+            }
+
+    return {"variants": raw, "peak_rss_mb": peak_rss_mb()}
+
+
+def measure_fit_memory(histories: Dict[str, List[Dict[str, Any]]], variants: List[str],
+                       horizon: int) -> Dict[str, float]:
+    """
+    Peak Python allocations of one train_model + predict_mood call per variant
+
+    Measured in a separate pass because tracemalloc slows the timed runs.
+
+    Returns:
+        Variant -> largest peak in KB across the sampled users
+    """
+    peaks = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for variant in variants:
+            predictor = build_predictor(variant, Path(tmp))
+            peak = 0
+            for uid, history in histories.items():
+                tracemalloc.start()
+                predictor.train_model(history, uid)
+                predictor.predict_mood(history, days_ahead=horizon, uid=uid, train_inline=True)
+                peak = max(peak, tracemalloc.get_traced_memory()[1])
+                tracemalloc.stop()
+            peaks[variant] = round(peak / 1024, 1)
+    return peaks
+
+
+def _ms_stats(seconds: List[float], prefix: str) -> Dict[str, Optional[float]]:
+    """p50/p95/mean of a list of durations, in ms"""
+    if not seconds:
+        return {f"{prefix}_p50_ms": None, f"{prefix}_p95_ms": None, f"{prefix}_mean_ms": None}
+    ms = np.asarray(seconds) * 1000
+    return {
+        f"{prefix}_p50_ms": round(float(np.percentile(ms, 50)), 3),
+        f"{prefix}_p95_ms": round(float(np.percentile(ms, 95)), 3),
+        f"{prefix}_mean_ms": round(float(ms.mean()), 3)
+    }
+
+
+def summarize_variant(variant: str, parts: List[Dict[str, Any]], peak_fit_kb: Optional[float]) -> Dict[str, Any]:
+    """
+    Merge worker results for one variant
+
+    Args:
+        variant: Variant name
+        parts: Raw results of backtest_users for this variant
+        peak_fit_kb: Result of measure_fit_memory (None if skipped)
+
+    Returns:
+        One result row
+    """
+    horizon = len(parts[0]["errors"])
+    errors = [sum((p["errors"][h] for p in parts), []) for h in range(horizon)]
+    all_errors = sum(errors, [])
+    fit_seconds = sum((p["fit_seconds"] for p in parts), [])
+    predict_seconds = sum((p["predict_seconds"] for p in parts), [])
+    model_bytes = sum((p["model_bytes"] for p in parts), [])
+
+    return {
+        "variant": variant,
+        "forecasts": len(predict_seconds),
+        "baseline_forecasts": sum(p["baseline_forecasts"] for p in parts),
+        "mae": round(float(np.mean(all_errors)), 4) if all_errors else None,
+        "mae_by_horizon": [round(float(np.mean(e)), 4) if e else None for e in errors],
+        **_ms_stats(fit_seconds, "fit"),
+        **_ms_stats(predict_seconds, "predict"),
+        "model_kb": round(float(np.mean(model_bytes)) / 1024, 2) if model_bytes else None,
+        "peak_fit_kb": peak_fit_kb
+    }
+
+
+def run_benchmark(profile: str = "full",
+                  variants: List[str] = ("ladder", "ridge", "gbm", "baseline"),
+                  n_users: Optional[int] = None,
+                  days: Optional[int] = None,
+                  step: Optional[int] = None,
+                  min_train: int = 14,
+                  horizon: int = 7,
+                  workers: int = 1,
+                  memory_sample: int = 10,
+                  seed: int = 42) -> Dict[str, Any]:
+    """
+    Run the backtest for every variant
+
+    Returns:
+        Machine-readable results with run metadata
+    """
+    config = {**PROFILES[profile]}
+    config.update({k: v for k, v in (("n_users", n_users), ("days", days), ("step", step)) if v})
+
+    histories = generate_mood_histories(config["n_users"], config["days"], seed)
+    uids = list(histories)
+    args = (list(variants), min_train, config["step"], horizon)
+
+    start = time.perf_counter()
+    if workers > 1:
+        # A few groups of users per worker
+        n_chunks = min(len(uids), workers * 4)
+        chunks = [uids[i::n_chunks] for i in range(n_chunks)]
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn')) as pool:
+            futures = [
+                pool.submit(backtest_users, {uid: histories[uid] for uid in chunk}, *args)
+                for chunk in chunks
+            ]
+            parts = [future.result() for future in futures]
+    else:
+        parts = [backtest_users(histories, *args)]
+    wall_seconds = time.perf_counter() - start
+
+    memory = (
+        measure_fit_memory({uid: histories[uid] for uid in uids[:memory_sample]}, list(variants), horizon)
+        if memory_sample else {}
+    )
+
+    results = [
+        summarize_variant(variant, [part["variants"][variant] for part in parts], memory.get(variant))
+        for variant in variants
+    ]
+    for row in results:
+        print(json.dumps(row))
+
+    import sklearn
+
+    return {
+        "meta": {
+            "timestamp": datetime.utcnow().isoformat(),
+            "profile": profile,
+            **config,
+            "min_train": min_train,
+            "horizon": horizon,
+            "workers": workers,
+            "wall_seconds": round(wall_seconds, 2),
+            "peak_rss_mb": max(part["peak_rss_mb"] for part in parts),
+            "sklearn_version": sklearn.__version__,
+            "python_version": platform.python_version(),
+            "cpu_count": os.cpu_count(),
+            "seed": seed
+        },
+        "results": results
+    }
+
+
+def write_csv(report: Dict[str, Any], path: str):
+    """Write one row per variant, with per-horizon MAE as mae_h1..mae_hN"""
+    rows = []
+    for result in report["results"]:
+        row = {k: v for k, v in result.items() if k != "mae_by_horizon"}
+        row.update({f"mae_h{h}": mae for h, mae in enumerate(result["mae_by_horizon"], start=1)})
+        rows.append(row)
+
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Mood forecast backtest and latency benchmark")
+    parser.add_argument("--profile", default="full", choices=sorted(PROFILES))
+    parser.add_argument("--variants", default="ladder,ridge,gbm,baseline",
+                        help=f"Comma-separated subset of {','.join(VARIANTS)}")
+    parser.add_argument("--users", type=int, default=None, help="Override the profile's user count")
+    parser.add_argument("--days", type=int, default=None, help="Override the profile's history length")
+    parser.add_argument("--step", type=int, default=None, help="Entries between backtest origins")
+    parser.add_argument("--horizon", type=int, default=7)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--memory-sample", type=int, default=10, help="Users in the memory pass (0 = skip)")
+    parser.add_argument("--output", default="bench_forecast.json")
+    parser.add_argument("--csv", default=None, help="Also write a CSV summary")
+    args = parser.parse_args()
+
+    report = run_benchmark(
+        profile=args.profile,
+        variants=[v for v in args.variants.split(",") if v],
+        n_users=args.users,
+        days=args.days,
+        step=args.step,
+        horizon=args.horizon,
+        workers=args.workers,
+        memory_sample=args.memory_sample
+    )
+
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    if args.csv:
+        write_csv(report, args.csv)
+    print(f"Wrote {len(report['results'])} results to {args.output}")
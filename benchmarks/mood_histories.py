@@ -0,0 +1,59 @@
+"""
+Synthetic Mood Histories
+Generates per-user daily mood entries with weekly seasonality, trends and noise
+"""
+
+from datetime import datetime, timedelta
+from typing import Any, Dict, List
+
+import numpy as np
+
+
+def generate_mood_history(rng: np.random.Generator, days: int,
+                          start: datetime = datetime(2024, 1, 1)) -> List[Dict[str, Any]]:
+    """
+    One user's daily mood entries, oldest first
+
+    Each user gets their own base level, weekend dip or lift, slow trend,
+    noise level and logging hour, and some users shift level part-way through.
+
+    Args:
+        rng: Random generator
+        days: Number of daily entries
+        start: Date of the first entry
+
+    Returns:
+        Mood entries with mood_score and created_at
+    """
+    t = np.arange(days)
+    level = rng.uniform(4, 8)
+    weekly = rng.normal(0, 1.2, size=7) * rng.uniform(0, 1)
+    trend = rng.normal(0, 0.02)
+    noise = rng.uniform(0.5, 1.5)
+
+    scores = level + weekly[(t + start.weekday()) % 7] + trend * t + rng.normal(0, noise, size=days)
+    if rng.random() < 0.2:
+        scores[rng.integers(days // 2, days):] += rng.choice([-2.0, 2.0])
+    scores = np.clip(np.round(scores), 1, 10)
+
+    hour = int(rng.integers(7, 23))
+    return [
+        {'mood_score': int(score), 'created_at': start + timedelta(days=int(day), hours=hour)}
+        for day, score in zip(t, scores)
+    ]
+
+
+def generate_mood_histories(n_users: int, days: int, seed: int = 42) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Histories for many simulated users
+
+    Args:
+        n_users: Number of users
+        days: Daily entries per user
+        seed: Random seed
+
+    Returns:
+        Mapping of user ID to mood entries
+    """
+    rng = np.random.default_rng(seed)
+    return {f"user_{i:05d}": generate_mood_history(rng, days) for i in range(n_users)}
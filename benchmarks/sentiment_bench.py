@@ -0,0 +1,262 @@
+"""
+Sentiment / NLI Throughput Benchmark
+Measures SentimentAnalyzer.analyze_text, extract_emotions and detect_triggers
+across batch sizes, torch thread counts and text lengths.
+
+Runs offline by default (HF_HUB_OFFLINE=1) against tiny or locally cached models.
+
+Usage:
+    python -m benchmarks.sentiment_bench --output bench_sentiment.json
+    python -m benchmarks.sentiment_bench --batch-sizes 1,8,32 --threads 1,4 --lengths short,long
+"""
+
+import argparse
+import json
+import os
+import platform
+import resource
+import sys
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+from benchmarks.corpus import generate_corpus, bucket_corpus
+
+# Tiny checkpoints keep the suite fast; pass --sentiment-model/--zero-shot-model for real ones
+DEFAULT_SENTIMENT_MODEL = "sshleifer/tiny-distilbert-base-uncased-finetuned-sst-2-english"
+DEFAULT_ZERO_SHOT_MODEL = "hf-internal-testing/tiny-random-BartForSequenceClassification"
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process in MB (over its whole lifetime)"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS and kilobytes on Linux
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def current_rss_mb() -> float:
+    """Current resident set size of this process in MB"""
+    if PSUTIL_AVAILABLE:
+        return psutil.Process().memory_info().rss / (1024 * 1024)
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError, IndexError):
+        # No way to read the current value here (e.g. macOS without psutil)
+        return peak_rss_mb()
+
+
+def summarize(latencies: List[float], n_texts: int, wall_seconds: float,
+              rss_before_mb: Optional[float] = None) -> Dict[str, Any]:
+    """
+    Summarize per-call latencies
+
+    Args:
+        latencies: Seconds per call
+        n_texts: Texts processed across all calls
+        wall_seconds: Total elapsed time
+        rss_before_mb: current_rss_mb() before the configuration started
+
+    Returns:
+        Percentiles (ms), throughput, RSS after the configuration and its
+        change during it (models loaded, buffers grown)
+    """
+    ms = np.asarray(latencies) * 1000
+    rss_mb = current_rss_mb()
+    return {
+        "calls": len(latencies),
+        "texts": n_texts,
+        "p50_ms": round(float(np.percentile(ms, 50)), 3),
+        "p95_ms": round(float(np.percentile(ms, 95)), 3),
+        "p99_ms": round(float(np.percentile(ms, 99)), 3),
+        "mean_ms": round(float(ms.mean()), 3),
+        "texts_per_sec": round(n_texts / wall_seconds, 2) if wall_seconds > 0 else 0.0,
+        "rss_mb": round(rss_mb, 1),
+        "rss_delta_mb": round(rss_mb - rss_before_mb, 1) if rss_before_mb is not None else None
+    }
+
+
+def build_analyzer(sentiment_model: str, zero_shot_model: str, backend: str,
+                   zero_shot_mode: str = "nli", offline: bool = True):
+    """
+    Build an in-process SentimentAnalyzer with caching and the cascade disabled
+
+    Args:
+        sentiment_model: Sentiment model identifier
+        zero_shot_model: Zero-shot NLI model identifier
+        backend: Sentiment backend (torch, onnx, onnx-int8)
+        zero_shot_mode: Zero-shot mode (nli or embedding)
+        offline: Forbid network access to the model hub
+
+    Returns:
+        SentimentAnalyzer instance
+    """
+    if offline:
+        os.environ["HF_HUB_OFFLINE"] = "1"
+        os.environ["TRANSFORMERS_OFFLINE"] = "1"
+
+    from src.config import settings
+
+    settings.SENTIMENT_MODEL = sentiment_model
+    settings.ZERO_SHOT_MODEL = zero_shot_model
+    settings.SENTIMENT_BACKEND = backend
+    settings.ZERO_SHOT_MODE = zero_shot_mode
+    settings.ENABLE_SENTIMENT_CACHE = False
+    settings.ENABLE_SENTIMENT_CASCADE = False
+
+    from src.ai.sentiment_analyzer import SentimentAnalyzer
+
+    return SentimentAnalyzer(local=True)
+
+
+def time_calls(fn: Callable[[Any], Any], inputs: List[Any]) -> Dict[str, Any]:
+    """Call fn once per input and record latencies"""
+    latencies = []
+    start = time.perf_counter()
+    for item in inputs:
+        t0 = time.perf_counter()
+        fn(item)
+        latencies.append(time.perf_counter() - t0)
+    return {"latencies": latencies, "wall": time.perf_counter() - start}
+
+
+def bench_sentiment(analyzer, texts: List[str], batch_size: int) -> Dict[str, Any]:
+    """Benchmark analyze_text (batch size 1) or analyze_texts (batch size > 1)"""
+    rss_before = current_rss_mb()
+    analyzer.batch_size = batch_size
+
+    if batch_size == 1:
+        analyzer.analyze_text(texts[0])  # warm-up
+        timing = time_calls(analyzer.analyze_text, texts)
+    else:
+        batches = [texts[i:i + batch_size] for i in range(0, len(texts), batch_size)]
+        analyzer.analyze_texts(batches[0])  # warm-up
+        timing = time_calls(analyzer.analyze_texts, batches)
+
+    return summarize(timing["latencies"], len(texts), timing["wall"], rss_before)
+
+
+def bench_zero_shot(analyzer, texts: List[str], method: str) -> Dict[str, Any]:
+    """Benchmark one zero-shot method per text"""
+    rss_before = current_rss_mb()
+    fn = getattr(analyzer, method)
+    fn(texts[0])  # warm-up (also loads the model)
+    timing = time_calls(fn, texts)
+    return summarize(timing["latencies"], len(texts), timing["wall"], rss_before)
+
+
+def run_benchmark(sentiment_model: str = DEFAULT_SENTIMENT_MODEL,
+                  zero_shot_model: str = DEFAULT_ZERO_SHOT_MODEL,
+                  backend: str = "torch",
+                  zero_shot_mode: str = "nli",
+                  batch_sizes: List[int] = (1, 8, 32),
+                  threads: List[int] = (1,),
+                  lengths: List[str] = ("short", "medium", "long"),
+                  texts_per_bucket: int = 64,
+                  zero_shot: bool = True,
+                  offline: bool = True,
+                  seed: int = 42) -> Dict[str, Any]:
+    """
+    Run the full sweep
+
+    Returns:
+        Machine-readable results with run metadata
+    """
+    import torch
+
+    analyzer = build_analyzer(sentiment_model, zero_shot_model, backend, zero_shot_mode, offline)
+    buckets = bucket_corpus(generate_corpus(n_texts=texts_per_bucket * 12, seed=seed))
+
+    results = []
+    for n_threads in threads:
+        torch.set_num_threads(n_threads)
+
+        for length in lengths:
+            texts = buckets[length][:texts_per_bucket]
+            if not texts:
+                continue
+
+            for batch_size in batch_sizes:
+                row = {
+                    "task": "sentiment",
+                    "threads": n_threads,
+                    "length": length,
+                    "batch_size": batch_size,
+                    **bench_sentiment(analyzer, texts, batch_size)
+                }
+                results.append(row)
+                print(json.dumps(row))
+
+            if zero_shot:
+                for method in ("extract_emotions", "detect_triggers", "analyze_affect"):
+                    row = {
+                        "task": method,
+                        "threads": n_threads,
+                        "length": length,
+                        "batch_size": 1,
+                        **bench_zero_shot(analyzer, texts, method)
+                    }
+                    results.append(row)
+                    print(json.dumps(row))
+
+    return {
+        "meta": {
+            "timestamp": datetime.utcnow().isoformat(),
+            "sentiment_model": sentiment_model,
+            "zero_shot_model": zero_shot_model,
+            "backend": backend,
+            "zero_shot_mode": zero_shot_mode,
+            "torch_version": torch.__version__,
+            "python_version": platform.python_version(),
+            "cpu_count": os.cpu_count(),
+            "texts_per_bucket": texts_per_bucket,
+            "seed": seed,
+            "peak_rss_mb": round(peak_rss_mb(), 1)
+        },
+        "results": results
+    }
+
+
+def _int_list(value: str) -> List[int]:
+    return [int(v) for v in value.split(",") if v]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Sentiment / NLI throughput benchmark")
+    parser.add_argument("--sentiment-model", default=DEFAULT_SENTIMENT_MODEL)
+    parser.add_argument("--zero-shot-model", default=DEFAULT_ZERO_SHOT_MODEL)
+    parser.add_argument("--backend", default="torch", choices=["torch", "onnx", "onnx-int8"])
+    parser.add_argument("--zero-shot-mode", default="nli", choices=["nli", "embedding"])
+    parser.add_argument("--batch-sizes", type=_int_list, default=[1, 8, 32])
+    parser.add_argument("--threads", type=_int_list, default=[1, os.cpu_count() or 1])
+    parser.add_argument("--lengths", default="short,medium,long")
+    parser.add_argument("--texts-per-bucket", type=int, default=64)
+    parser.add_argument("--skip-zero-shot", action="store_true")
+    parser.add_argument("--online", action="store_true", help="Allow downloading models")
+    parser.add_argument("--output", default="bench_sentiment.json")
+    args = parser.parse_args()
+
+    report = run_benchmark(
+        sentiment_model=args.sentiment_model,
+        zero_shot_model=args.zero_shot_model,
+        backend=args.backend,
+        zero_shot_mode=args.zero_shot_mode,
+        batch_sizes=args.batch_sizes,
+        threads=sorted(set(args.threads)),
+        lengths=[l for l in args.lengths.split(",") if l],
+        texts_per_bucket=args.texts_per_bucket,
+        zero_shot=not args.skip_zero_shot,
+        offline=not args.online
+    )
+
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"Wrote {len(report['results'])} results to {args.output}")
@@ -0,0 +1,14 @@
+"""
+Firebase Admin setup shared by the maintenance scripts
+"""
+
+import firebase_admin
+from firebase_admin import credentials
+
+from src.config import settings
+
+
+def init_firebase():
+    """Initialize Firebase Admin once, before the Firestore client is created"""
+    if not firebase_admin._apps:
+        firebase_admin.initialize_app(credentials.Certificate(settings.FIREBASE_ADMIN_CREDENTIALS))
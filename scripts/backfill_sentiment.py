@@ -0,0 +1,175 @@
+"""
+Sentiment backfill script
+Re-scores historical mood entries after SENTIMENT_MODEL changes.
+
+Streams mood_entries in pages, decrypts journal text in parallel, runs batched
+inference and writes results back with batched writes. Progress is checkpointed
+so an interrupted run resumes where it stopped.
+
+Usage: python -m scripts.backfill_sentiment [--page-size 200] [--workers 8] [--restart]
+"""
+
+import argparse
+import json
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from scripts._firebase import init_firebase
+from src.config import settings, DATA_DIR
+
+# Setup logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_PATH = DATA_DIR / "backfill_sentiment_checkpoint.json"
+
+
+def _load_checkpoint(path: Path) -> Dict[str, Any]:
+    """Load checkpoint state, or a fresh one"""
+    if path.exists():
+        try:
+            return json.loads(path.read_text())
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable checkpoint {path}: {e}")
+    return {}
+
+
+def _save_checkpoint(path: Path, state: Dict[str, Any]):
+    """Atomically write checkpoint state"""
+    tmp_path = path.with_suffix(".tmp")
+    tmp_path.write_text(json.dumps(state, indent=2))
+    os.replace(tmp_path, path)
+
+
+def _decrypt(encrypted_text: Optional[str]) -> Optional[str]:
+    """Decrypt journal text, returning None if it is missing or unreadable"""
+    # Imported lazily: importing src.database creates the Firestore client
+    from src.database.encryption import decrypt_sensitive_data
+
+    if not encrypted_text:
+        return None
+    try:
+        return decrypt_sensitive_data(encrypted_text)
+    except Exception:
+        return None
+
+
+def _count_entries(db) -> Optional[int]:
+    """Total mood entries, for the ETA (None if aggregation is unavailable)"""
+    try:
+        result = db.collection(settings.FIRESTORE_COLLECTION_MOODS).count().get()
+        return int(result[0][0].value)
+    except Exception as e:
+        logger.warning(f"Could not count mood entries, ETA disabled: {e}")
+        return None
+
+
+def backfill_sentiment(page_size: int = 200, workers: int = 8, restart: bool = False,
+                       checkpoint_path: Path = CHECKPOINT_PATH, client: Any = None,
+                       analyzer: Any = None) -> Dict[str, Any]:
+    """
+    Recompute ai_sentiment, ai_confidence, mood_label and ai_tier for all mood entries
+
+    Args:
+        page_size: Entries fetched and scored per page
+        workers: Threads used to decrypt journal text
+        restart: Ignore any existing checkpoint
+        checkpoint_path: Where progress is recorded
+        client: Firestore client (defaults to the shared one)
+        analyzer: Sentiment analyzer (defaults to the shared one, once its model is loaded)
+
+    Returns:
+        Final checkpoint state
+    """
+    if client is None:
+        init_firebase()
+
+        from src.database.firestore_client import firestore_client as client
+
+    if analyzer is None:
+        from src.ai.sentiment_analyzer import sentiment_analyzer
+
+        # Wait for the transformer so the lexicon fallback never writes results
+        # (the cascade is also bypassed below: stored scores come from the model)
+        analyzer = sentiment_analyzer.wait()
+
+    state = {} if restart else _load_checkpoint(checkpoint_path)
+    if state.get('model') != settings.SENTIMENT_MODEL:
+        if state:
+            logger.info("Checkpoint was written for a different model, starting over")
+        state = {}
+
+    state.setdefault('model', settings.SENTIMENT_MODEL)
+    state.setdefault('last_id', None)
+    state.setdefault('processed', 0)
+    state.setdefault('updated', 0)
+    state.setdefault('skipped', 0)
+
+    total = _count_entries(client.db)
+    start_time = time.monotonic()
+    processed_at_start = state['processed']
+
+    if state['last_id']:
+        logger.info(f"Resuming after {state['last_id']} ({state['processed']} entries done)")
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for page in client.iter_mood_entry_pages(page_size, state['last_id']):
+            docs = [(doc.id, doc.to_dict() or {}) for doc in page]
+            texts = list(pool.map(_decrypt, [data.get('journal_text') for _, data in docs]))
+
+            to_score = [(doc_id, text) for (doc_id, _), text in zip(docs, texts) if text]
+            results = analyzer.analyze_texts([text for _, text in to_score], use_cascade=False)
+
+            updates = []
+            for (doc_id, _), result in zip(to_score, results):
+                if result['success']:
+                    updates.append((doc_id, {
+                        'ai_sentiment': result['sentiment'],
+                        'ai_confidence': result['confidence'],
+                        'mood_label': result['mood_label'],
+                        'ai_tier': result.get('tier'),
+                        'ai_model': settings.SENTIMENT_MODEL
+                    }))
+
+            if updates:
+                client.batch_update_mood_entries(updates)
+
+            state['processed'] += len(docs)
+            state['updated'] += len(updates)
+            state['skipped'] += len(docs) - len(updates)
+            state['last_id'] = docs[-1][0]
+            _save_checkpoint(checkpoint_path, state)
+
+            # Throughput and ETA
+            elapsed = time.monotonic() - start_time
+            rate = (state['processed'] - processed_at_start) / elapsed if elapsed > 0 else 0.0
+            if total and rate > 0:
+                remaining = max(0, total - state['processed'])
+                eta = f", ETA {remaining / rate / 60:.1f} min ({state['processed']}/{total})"
+            else:
+                eta = ""
+            logger.info(
+                f"Backfilled {state['processed']} entries "
+                f"({state['updated']} updated, {state['skipped']} skipped) "
+                f"at {rate:.1f} entries/s{eta}"
+            )
+
+    state['completed_at'] = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+    _save_checkpoint(checkpoint_path, state)
+    logger.info(f"✅ Sentiment backfill complete: {state['updated']} entries updated")
+
+    return state
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Re-score historical mood entries")
+    parser.add_argument("--page-size", type=int, default=200)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--restart", action="store_true", help="Ignore the saved checkpoint")
+    args = parser.parse_args()
+
+    backfill_sentiment(page_size=args.page_size, workers=args.workers, restart=args.restart)
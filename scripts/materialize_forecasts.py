@@ -0,0 +1,203 @@
+"""
+Forecast materialization script
+Precomputes mood forecasts for all active users, meant to run nightly.
+
+Streams users with a mood entry in the last FORECAST_ACTIVE_DAYS, skips those
+whose stored forecast already covers their latest entry, and fits and forecasts
+the rest in a process pool. Results are written back with batched writes so the
+dashboard can read a forecast instead of computing one.
+
+Usage: python -m scripts.materialize_forecasts [--workers 4] [--active-days 30] [--force]
+"""
+
+import argparse
+import logging
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from scripts._firebase import init_firebase
+from src.ai.training_scheduler import PROCESS_POOL_CONTEXT
+from src.config import settings
+
+# Setup logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Mood entries fetched per user (matches the dashboard)
+HISTORY_LIMIT = 30
+
+# Forecasts written per batch
+WRITE_BATCH_SIZE = 200
+
+# Per-process predictor, created by _init_worker
+_predictor = None
+
+
+def _init_worker():
+    """Create the predictor once per worker process"""
+    global _predictor
+    from src.ai.mood_predictor import MoodPredictor
+
+    _predictor = MoodPredictor()
+
+
+def _plain_datetime(value: datetime) -> datetime:
+    """Firestore timestamp as a plain datetime (picklable across processes)"""
+    return datetime.combine(value.date(), value.timetz())
+
+
+def _forecast_user(uid: str, history: List[Dict[str, Any]], feature_state: Optional[Dict[str, Any]],
+                   drift_state: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+    """
+    Fit the user's model if needed and build their forecast document (runs in a worker)
+
+    Args:
+        uid: User ID
+        history: Mood entries with mood_score and created_at, newest first
+        feature_state: User's incremental feature state
+        drift_state: User's stored drift state, so a drifting model is retrained
+
+    Returns:
+        Forecast document, or None if there is not enough data for the user's own model
+    """
+    _predictor.monitor.restore_state(uid, drift_state)
+    result = _predictor.predict_mood(history, days_ahead=_predictor.forecast_days, uid=uid,
+                                     feature_state=feature_state, train_inline=True)
+    # Baseline forecasts are never served from storage (see MoodPredictor.is_forecast_stale)
+    if not result or not result.get('success') or result.get('baseline'):
+        return None
+    return _predictor.to_forecast_document(result, history[0]['created_at'])
+
+
+def materialize_forecasts(workers: int = 4, active_days: Optional[int] = None,
+                          force: bool = False) -> Dict[str, Any]:
+    """
+    Compute and store forecasts for every active user
+
+    Args:
+        workers: Worker processes used to fit models
+        active_days: Users with a mood entry in this many days are active
+            (defaults to FORECAST_ACTIVE_DAYS)
+        force: Recompute forecasts that are still fresh
+
+    Returns:
+        Run statistics
+    """
+    init_firebase()
+
+    from src.database.firestore_client import firestore_client
+
+    since = datetime.utcnow() - timedelta(days=active_days or settings.FORECAST_ACTIVE_DAYS)
+    stats = {'active': 0, 'fresh': 0, 'written': 0, 'skipped': 0, 'failed': 0}
+    start_time = time.monotonic()
+    results: List[Tuple[str, Dict[str, Any]]] = []
+
+    def flush():
+        if results:
+            stats['written'] += firestore_client.save_forecasts(results)
+            _record_forecasts(firestore_client, results)
+            results.clear()
+
+    def collect(done: Set[Future]):
+        for future in done:
+            uid = in_flight.pop(future)
+            try:
+                document = future.result()
+            except Exception as e:
+                logger.error(f"Forecast failed for {uid}: {e}")
+                stats['failed'] += 1
+                continue
+            if document is None:
+                stats['skipped'] += 1
+            else:
+                results.append((uid, document))
+        if len(results) >= WRITE_BATCH_SIZE:
+            flush()
+
+    in_flight: Dict[Future, str] = {}
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             mp_context=PROCESS_POOL_CONTEXT) as pool:
+        for uid, feature_state in firestore_client.iter_active_users(since):
+            stats['active'] += 1
+
+            history = [
+                {'mood_score': e['mood_score'], 'created_at': _plain_datetime(e['created_at'])}
+                for e in firestore_client.get_mood_scores(uid, limit=HISTORY_LIMIT)
+                if 'mood_score' in e and e.get('created_at') is not None
+            ]
+            if not history:
+                stats['skipped'] += 1
+                continue
+
+            if not force:
+                stored = firestore_client.get_forecast(uid)
+                if stored and not _is_stale(stored, history[0]['created_at']):
+                    stats['fresh'] += 1
+                    continue
+
+            if feature_state:
+                feature_state = {
+                    **feature_state,
+                    'first_created_at': _plain_datetime(feature_state['first_created_at']),
+                    'last_created_at': _plain_datetime(feature_state['last_created_at'])
+                }
+            drift_state = firestore_client.get_drift_state(uid)
+            in_flight[pool.submit(_forecast_user, uid, history, feature_state, drift_state)] = uid
+
+            # Bound memory: wait once every worker has a few users queued
+            if len(in_flight) >= workers * 4:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                collect(done)
+
+        while in_flight:
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            collect(done)
+
+    flush()
+
+    elapsed = time.monotonic() - start_time
+    logger.info(
+        f"✅ Materialized {stats['written']} forecasts for {stats['active']} active users "
+        f"({stats['fresh']} fresh, {stats['skipped']} skipped, {stats['failed']} failed) "
+        f"in {elapsed:.1f}s"
+    )
+
+    return stats
+
+
+def _record_forecasts(firestore_client: Any, forecasts: List[Tuple[str, Dict[str, Any]]]):
+    """
+    Add stored forecasts to each user's drift state so their next entries score them
+
+    Args:
+        firestore_client: Firestore client
+        forecasts: (user ID, forecast document) pairs that were written
+    """
+    from src.ai.mood_predictor import mood_predictor
+
+    monitor = mood_predictor.monitor
+    for uid, document in forecasts:
+        monitor.restore_state(uid, firestore_client.get_drift_state(uid))
+        monitor.record_forecast(uid, mood_predictor.from_forecast_document(document))
+        firestore_client.save_drift_state(uid, monitor.export_state(uid))
+
+
+def _is_stale(stored: Dict[str, Any], latest_entry_at: datetime) -> bool:
+    """Check a stored forecast against the user's latest entry"""
+    from src.ai.mood_predictor import mood_predictor
+
+    return mood_predictor.is_forecast_stale(stored, latest_entry_at, mood_predictor.forecast_days)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Precompute mood forecasts for active users")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--active-days", type=int, default=None,
+                        help="Activity window in days (default: FORECAST_ACTIVE_DAYS)")
+    parser.add_argument("--force", action="store_true", help="Recompute fresh forecasts too")
+    args = parser.parse_args()
+
+    materialize_forecasts(workers=args.workers, active_days=args.active_days, force=args.force)
@@ -0,0 +1,64 @@
+"""
+Pooled mood model training script
+Retrains the cross-user forecaster over the whole mood_entries collection,
+meant to run nightly.
+
+Entries are streamed ordered by user and date, featurized a batch of users at
+a time and fed to an incremental learner, so memory does not grow with the
+number of users. New users get forecasts from this model until their own is
+trained.
+
+Usage: python -m scripts.train_pooled_model [--epochs 3] [--batch-users 200] [--page-size 500]
+"""
+
+import argparse
+import logging
+
+from scripts._firebase import init_firebase
+
+# Setup logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def train(epochs: int = 3, batch_users: int = 200, page_size: int = 500):
+    """
+    Train and store the pooled mood model
+
+    Args:
+        epochs: Passes of the regression over the collection
+        batch_users: Users featurized per mini-batch
+        page_size: Mood entries fetched per Firestore page
+
+    Returns:
+        Stored model artifact or None
+    """
+    init_firebase()
+
+    from src.database.firestore_client import firestore_client
+    from src.ai.mood_predictor import MoodPredictor
+    from src.ai.pooled_mood_model import train_pooled_model
+
+    artifact = train_pooled_model(
+        lambda: firestore_client.iter_mood_entries_by_user(page_size),
+        MoodPredictor(),
+        epochs=epochs,
+        batch_users=batch_users
+    )
+
+    if artifact is None:
+        logger.warning("No pooled mood model was trained")
+    else:
+        logger.info(f"✅ Pooled mood model v{artifact['version']} ready ({artifact['n_users']} users)")
+
+    return artifact
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Train the cross-user mood model")
+    parser.add_argument("--epochs", type=int, default=3)
+    parser.add_argument("--batch-users", type=int, default=200)
+    parser.add_argument("--page-size", type=int, default=500)
+    args = parser.parse_args()
+
+    train(epochs=args.epochs, batch_users=args.batch_users, page_size=args.page_size)
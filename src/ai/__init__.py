@@ -1,14 +1,44 @@
-"""AI module initialization"""
-
-from src.ai.openai_client import openai_client, OpenAIClient
-from src.ai.sentiment_analyzer import sentiment_analyzer, SentimentAnalyzer
-from src.ai.mood_predictor import mood_predictor, MoodPredictor
-
-__all__ = [
-    'openai_client',
-    'OpenAIClient',
-    'sentiment_analyzer',
-    'SentimentAnalyzer',
-    'mood_predictor',
-    'MoodPredictor'
-]
+"""AI module initialization
+
+Exports are imported on first access, so importing one light module (for
+example src.ai.mood_predictor in a training worker) does not load
+transformers, torch or openai. Singletons share their module's name, so
+import them from the module itself: from src.ai.mood_predictor import mood_predictor
+"""
+
+import importlib
+
+# Exported name -> module defining it
+_EXPORTS = {
+    'openai_client': 'src.ai.openai_client',
+    'OpenAIClient': 'src.ai.openai_client',
+    'sentiment_analyzer': 'src.ai.sentiment_analyzer',
+    'SentimentAnalyzer': 'src.ai.sentiment_analyzer',
+    'mood_predictor': 'src.ai.mood_predictor',
+    'MoodPredictor': 'src.ai.mood_predictor',
+    'mood_model_store': 'src.ai.mood_model_store',
+    'MoodModelStore': 'src.ai.mood_model_store',
+    'model_registry': 'src.ai.model_registry',
+    'ModelRegistry': 'src.ai.model_registry',
+    'embedding_index': 'src.ai.embedding_index',
+    'JournalEmbeddingIndex': 'src.ai.embedding_index',
+    'LazyModel': 'src.ai.lazy',
+    'warm_up_models': 'src.ai.lazy',
+    'models_ready': 'src.ai.lazy',
+    'get_models_status': 'src.ai.lazy'
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
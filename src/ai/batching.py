@@ -0,0 +1,140 @@
+"""
+Micro-batching for model inference
+Collects concurrent requests and runs them as a single batch
+"""
+
+import threading
+import time
+from concurrent.futures import Future
+from queue import Queue, Empty, Full
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class MicroBatcher:
+    """Groups concurrent single-item calls into batched handler calls"""
+
+    def __init__(self, handler: Callable[[List[Any]], List[Any]],
+                 max_batch_size: int = 16, max_wait_ms: float = 5.0,
+                 name: str = "micro-batcher", max_queue_size: int = 0):
+        """
+        Args:
+            handler: Function mapping a list of inputs to a list of outputs
+            max_batch_size: Largest batch handed to the handler
+            max_wait_ms: How long to wait for more requests after the first one
+            name: Worker thread name
+            max_queue_size: Pending request limit (0 = unbounded); submit raises
+                queue.Full when it is reached
+        """
+        self.handler = handler
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max(0.0, max_wait_ms) / 1000.0
+        self.name = name
+
+        self._queue: "Queue[Tuple[Any, Future]]" = Queue(maxsize=max(0, max_queue_size))
+        self._lock = threading.Lock()
+        self._worker: Optional[threading.Thread] = None
+
+        self.stats = {"batches": 0, "items": 0, "rejected": 0, "errors": 0, "last_batch_size": 0}
+
+    def _ensure_worker(self):
+        """Start the worker thread on first use"""
+        with self._lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(target=self._run, name=self.name, daemon=True)
+                self._worker.start()
+
+    def submit(self, item: Any) -> Future:
+        """
+        Queue an item for the next batch
+
+        Args:
+            item: Single handler input
+
+        Returns:
+            Future resolved with the handler output for this item
+
+        Raises:
+            queue.Full: If the pending queue is at max_queue_size
+        """
+        future: Future = Future()
+        try:
+            self._queue.put_nowait((item, future))
+        except Full:
+            with self._lock:
+                self.stats["rejected"] += 1
+            raise
+        self._ensure_worker()
+        return future
+
+    def process(self, item: Any, timeout: Optional[float] = None) -> Any:
+        """
+        Submit an item and block until its result is available
+
+        Args:
+            item: Single handler input
+            timeout: Seconds to wait for the result
+
+        Returns:
+            Handler output for this item
+        """
+        return self.submit(item).result(timeout=timeout)
+
+    def _collect_batch(self) -> List[Tuple[Any, Future]]:
+        """Block for the first request, then gather more until full or timed out"""
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self.max_wait
+
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except Empty:
+                break
+
+        return batch
+
+    def _run(self):
+        """Worker loop"""
+        while True:
+            batch = self._collect_batch()
+            items = [item for item, _ in batch]
+
+            with self._lock:
+                self.stats["batches"] += 1
+                self.stats["items"] += len(items)
+                self.stats["last_batch_size"] = len(items)
+
+            try:
+                results = self.handler(items)
+                if len(results) != len(items):
+                    raise RuntimeError(
+                        f"Batch handler returned {len(results)} results for {len(items)} inputs"
+                    )
+            except Exception as e:
+                logger.error(f"Batch of {len(items)} failed: {e}")
+                with self._lock:
+                    self.stats["errors"] += 1
+                for _, future in batch:
+                    future.set_exception(e)
+                continue
+
+            for (_, future), result in zip(batch, results):
+                future.set_result(result)
+
+    def queue_depth(self) -> int:
+        """Number of requests waiting for a batch"""
+        return self._queue.qsize()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Queue depth and batch-size metrics"""
+        with self._lock:
+            stats = dict(self.stats)
+        stats["queue_depth"] = self.queue_depth()
+        stats["avg_batch_size"] = round(stats["items"] / stats["batches"], 2) if stats["batches"] else 0.0
+        return stats
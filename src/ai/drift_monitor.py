@@ -0,0 +1,227 @@
+"""
+Forecast Drift Monitor
+Scores each user's forecasts against the moods they actually log and decides
+when their model should be retrained. Per-user state is kept in memory and can
+be exported and restored so it survives restarts and is shared across processes.
+"""
+
+import threading
+from collections import OrderedDict, deque
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from src.config import settings
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class _UserDrift:
+    """Pending forecasts and recent errors of one user's current model"""
+
+    __slots__ = ('pending', 'errors', 'model_version', 'last_retrain_reason')
+
+    def __init__(self, window: int):
+        self.pending: Dict[str, float] = {}
+        self.errors: deque = deque(maxlen=window)
+        self.model_version: Optional[int] = None
+        self.last_retrain_reason: Optional[str] = None
+
+
+class DriftMonitor:
+    """Rolling forecast error per user, with error- and volume-based retrain triggers"""
+
+    def __init__(self, window: Optional[int] = None, min_observations: Optional[int] = None,
+                 mae_threshold: Optional[float] = None, mae_ratio: Optional[float] = None,
+                 max_users: Optional[int] = None):
+        """
+        Args:
+            window: Scored forecasts kept per user (defaults to DRIFT_WINDOW)
+            min_observations: Scored forecasts needed before drift can trigger
+            mae_threshold: Rolling MAE above which a model has drifted
+            mae_ratio: Drift also triggers above this multiple of the model's backtest MAE
+            max_users: Users tracked in memory (least recently active are dropped)
+        """
+        self.window = window or settings.DRIFT_WINDOW
+        self.min_observations = min_observations or settings.DRIFT_MIN_OBSERVATIONS
+        self.mae_threshold = mae_threshold or settings.DRIFT_MAE_THRESHOLD
+        self.mae_ratio = mae_ratio or settings.DRIFT_MAE_RATIO
+        self.max_users = max_users or settings.DRIFT_MAX_USERS
+        self._users: "OrderedDict[str, _UserDrift]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._retrains = {"drift": 0, "volume": 0}
+        self._scored = 0
+
+    def _user(self, uid: str) -> _UserDrift:
+        """Tracking state of a user, created on first use"""
+        user = self._users.get(uid)
+        if user is None:
+            user = self._users[uid] = _UserDrift(self.window)
+        self._users.move_to_end(uid)
+        while len(self._users) > self.max_users:
+            self._users.popitem(last=False)
+        return user
+
+    def record_forecast(self, uid: str, forecast: Dict[str, Any]):
+        """
+        Remember a forecast so the user's next entries can score it
+
+        Newer forecasts replace older ones for the same dates. Baseline
+        forecasts are ignored (they are not the user's model).
+
+        Args:
+            uid: User ID
+            forecast: Output of MoodPredictor.predict_mood
+        """
+        if not forecast.get('success') or forecast.get('baseline'):
+            return
+        with self._lock:
+            user = self._user(uid)
+            if forecast.get('model_version') != user.model_version:
+                user.pending.clear()
+                user.errors.clear()
+                user.model_version = forecast.get('model_version')
+            for prediction in forecast['predictions']:
+                user.pending[prediction['date']] = prediction['predicted_mood']
+
+    def record_actual(self, uid: str, mood_score: float, created_at: datetime):
+        """
+        Score the pending forecast for the day a mood entry was logged
+
+        Args:
+            uid: User ID
+            mood_score: Logged score
+            created_at: Timestamp of the entry
+        """
+        date = created_at.strftime("%Y-%m-%d")
+        with self._lock:
+            user = self._users.get(uid)
+            if user is None or date not in user.pending:
+                return
+            predicted = user.pending.pop(date)
+            # Forecasts for earlier days can no longer be scored
+            for stale in [d for d in user.pending if d < date]:
+                del user.pending[stale]
+            user.errors.append(abs(float(mood_score) - predicted))
+            self._scored += 1
+
+    def export_state(self, uid: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a user's drift state for storage (pending forecasts, recent errors)
+
+        Args:
+            uid: User ID
+
+        Returns:
+            JSON-serializable state, or None if the user is not tracked
+        """
+        with self._lock:
+            user = self._users.get(uid)
+            if user is None:
+                return None
+            return {
+                'model_version': user.model_version,
+                'pending': dict(user.pending),
+                'errors': list(user.errors),
+                'last_retrain_reason': user.last_retrain_reason
+            }
+
+    def restore_state(self, uid: str, state: Optional[Dict[str, Any]]):
+        """
+        Replace a user's in-memory drift state with a stored one
+
+        Lets other processes (the nightly job, other app servers) continue
+        from the forecasts and errors recorded elsewhere.
+
+        Args:
+            uid: User ID
+            state: Output of export_state (None = nothing stored, state is kept)
+        """
+        if not state:
+            return
+        with self._lock:
+            user = self._user(uid)
+            user.model_version = state.get('model_version')
+            user.pending = dict(state.get('pending') or {})
+            user.errors.clear()
+            user.errors.extend(state.get('errors') or [])
+            user.last_retrain_reason = state.get('last_retrain_reason')
+
+    def rolling_error(self, uid: str) -> Optional[float]:
+        """Mean absolute error of the user's recent scored forecasts"""
+        with self._lock:
+            user = self._users.get(uid)
+            if user is None or not user.errors:
+                return None
+            return sum(user.errors) / len(user.errors)
+
+    def retrain_reason(self, uid: str, artifact: Dict[str, Any], new_entries: int,
+                       volume_threshold: int) -> Optional[str]:
+        """
+        Decide if a user's model should be retrained
+
+        Args:
+            uid: User ID
+            artifact: User's current model artifact
+            new_entries: Entries logged since the model was trained
+            volume_threshold: New entries that always trigger a retrain
+
+        Returns:
+            "drift", "volume" or None
+        """
+        if new_entries <= 0:
+            return None
+
+        with self._lock:
+            user = self._users.get(uid)
+            if user is not None and len(user.errors) >= self.min_observations:
+                mae = sum(user.errors) / len(user.errors)
+                limit = self.mae_threshold
+                if artifact.get('backtest_mae'):
+                    limit = min(limit, self.mae_ratio * artifact['backtest_mae'])
+                if mae > limit:
+                    return "drift"
+
+        if new_entries >= volume_threshold:
+            return "volume"
+        return None
+
+    def record_retrain(self, uid: str, reason: str):
+        """
+        Count a scheduled retrain
+
+        Args:
+            uid: User ID
+            reason: Result of retrain_reason
+        """
+        with self._lock:
+            self._retrains[reason] = self._retrains.get(reason, 0) + 1
+            self._user(uid).last_retrain_reason = reason
+        logger.info(f"Retraining mood model for {uid} ({reason})")
+
+    def get_user_stats(self, uid: str) -> Dict[str, Any]:
+        """Rolling error, recent errors (oldest first) and last retrain reason"""
+        with self._lock:
+            user = self._users.get(uid)
+            errors = list(user.errors) if user is not None else []
+            return {
+                'rolling_mae': round(sum(errors) / len(errors), 3) if errors else None,
+                'recent_errors': [round(e, 3) for e in errors],
+                'pending_forecasts': len(user.pending) if user is not None else 0,
+                'last_retrain_reason': user.last_retrain_reason if user is not None else None
+            }
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Retrain counts by reason and the average rolling error across users"""
+        with self._lock:
+            maes = [sum(u.errors) / len(u.errors) for u in self._users.values() if u.errors]
+            return {
+                'retrains': dict(self._retrains),
+                'scored_forecasts': self._scored,
+                'tracked_users': len(self._users),
+                'mean_rolling_mae': round(sum(maes) / len(maes), 3) if maes else None
+            }
+
+
+# Singleton instance
+drift_monitor = DriftMonitor()
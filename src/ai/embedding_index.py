@@ -0,0 +1,381 @@
+"""
+Journal Embedding Index
+Stores one sentence embedding per journal entry and finds similar past entries
+"""
+
+import io
+import os
+import re
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+try:
+    import hnswlib
+    HNSWLIB_AVAILABLE = True
+except ImportError:
+    HNSWLIB_AVAILABLE = False
+
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:
+    FCNTL_AVAILABLE = False
+
+from src.config import settings, DATA_DIR
+from src.ai.model_registry import model_registry
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+EMBEDDINGS_DIR = DATA_DIR / "embeddings"
+
+
+class SentenceEmbedder:
+    """Mean-pooled transformer sentence embeddings"""
+
+    def __init__(self, model_name: str, max_length: int = 256):
+        # Imported here so the index can be used without torch (e.g. with a custom embed_fn)
+        import torch
+        from transformers import AutoTokenizer, AutoModel
+
+        self._torch = torch
+        self.tokenizer = AutoTokenizer.from_pretrained(model_name)
+        self.model = AutoModel.from_pretrained(model_name)
+        self.model.eval()
+        self.max_length = max_length
+
+    def __call__(self, texts: List[str]) -> np.ndarray:
+        """
+        Embed texts
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            float32 array of shape (len(texts), dim)
+        """
+        encoded = self.tokenizer(
+            texts, padding=True, truncation=True,
+            max_length=self.max_length, return_tensors='pt'
+        )
+        with self._torch.no_grad():
+            output = self.model(**encoded)
+
+        # Average token vectors, ignoring padding
+        mask = encoded['attention_mask'].unsqueeze(-1).float()
+        pooled = (output.last_hidden_state * mask).sum(dim=1) / mask.sum(dim=1).clamp(min=1e-9)
+        return pooled.cpu().numpy().astype(np.float32)
+
+
+class JournalEmbeddingIndex:
+    """Per-user vector index over journal entries"""
+
+    def __init__(self, index_dir: Optional[Path] = None, model_name: Optional[str] = None,
+                 ann_threshold: Optional[int] = None, max_users: int = 256,
+                 embed_fn: Optional[Callable[[List[str]], Any]] = None, cipher: Any = None):
+        """
+        Args:
+            index_dir: Directory holding one encrypted index file per user
+            model_name: Sentence embedding model identifier
+            ann_threshold: Entry count at which a user switches to an HNSW index
+            max_users: Users kept resident in memory (least recently used are dropped)
+            embed_fn: Custom embedding function (defaults to the registry-managed model)
+            cipher: Object with encrypt_bytes/decrypt_bytes (defaults to the app's AES encryption)
+        """
+        self.index_dir = Path(index_dir or EMBEDDINGS_DIR)
+        self.index_dir.mkdir(parents=True, exist_ok=True)
+        self.model_name = model_name or settings.EMBEDDING_MODEL
+        self.ann_threshold = ann_threshold if ann_threshold is not None else settings.EMBEDDING_ANN_THRESHOLD
+        self.max_users = max_users
+        self._embed_fn = embed_fn
+        self._cipher = cipher
+        self._users: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.RLock()
+
+        model_name = self.model_name
+        model_registry.register(model_name, lambda: SentenceEmbedder(model_name), size_mb=100)
+
+    def embed(self, texts: List[str]) -> np.ndarray:
+        """
+        Embed texts as unit-length float32 vectors
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            Array of shape (len(texts), dim)
+        """
+        embed_fn = self._embed_fn or model_registry.get(self.model_name)
+        vectors = np.asarray(embed_fn(texts), dtype=np.float32)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors / np.maximum(norms, 1e-12)
+
+    def _get_cipher(self):
+        """Cipher for index files (imported on first use: it needs the encryption key)"""
+        if self._cipher is None:
+            from src.database.encryption import encryption
+            self._cipher = encryption
+        return self._cipher
+
+    def _user_path(self, uid: str, suffix: str = ".npz.enc") -> Path:
+        """Index file for a user (suffix selects the lock or legacy plaintext file)"""
+        return self.index_dir / f"{re.sub(r'[^A-Za-z0-9_-]', '_', uid)}{suffix}"
+
+    @staticmethod
+    def _file_stamp(path: Path) -> Optional[tuple]:
+        """Identity of the file currently on disk (changes on every atomic replace)"""
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return None
+        return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+    @contextmanager
+    def _file_lock(self, uid: str):
+        """Exclusive lock on a user's index across processes (no-op where fcntl is missing)"""
+        if not FCNTL_AVAILABLE:
+            yield
+            return
+        with open(self._user_path(uid, ".lock"), 'a') as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+    def _get_user(self, uid: str) -> Dict[str, Any]:
+        """
+        Resident index state for a user (caller holds the lock)
+
+        The state is reloaded whenever another process has replaced the file since it was read.
+        """
+        path = self._user_path(uid)
+        stamp = self._file_stamp(path)
+
+        state = self._users.get(uid)
+        if state is not None and state['stamp'] == stamp:
+            self._users.move_to_end(uid)
+            return state
+
+        ids: List[str] = []
+        vectors = None
+        source = None
+        if stamp is not None:
+            source = io.BytesIO(self._get_cipher().decrypt_bytes(path.read_bytes()))
+        elif self._user_path(uid, ".npz").exists():
+            # Written before index files were encrypted; replaced on the next save
+            source = self._user_path(uid, ".npz")
+        if source is not None:
+            with np.load(source) as data:
+                ids = [str(i) for i in data['ids']]
+                vectors = data['vectors']
+
+        state = {
+            'ids': ids,
+            'positions': {entry_id: i for i, entry_id in enumerate(ids)},
+            'vectors': vectors,
+            'ann': None,
+            'stamp': stamp
+        }
+        self._users[uid] = state
+        self._users.move_to_end(uid)
+        while len(self._users) > self.max_users:
+            self._users.popitem(last=False)
+        return state
+
+    def _save_user(self, uid: str, state: Dict[str, Any]):
+        """Atomically write a user's encrypted index file (caller holds the file lock)"""
+        buffer = io.BytesIO()
+        np.savez(buffer, ids=np.array(state['ids']), vectors=state['vectors'])
+
+        path = self._user_path(uid)
+        tmp_path = self._user_path(uid, f".{os.getpid()}.tmp")
+        with open(tmp_path, 'wb') as f:
+            f.write(self._get_cipher().encrypt_bytes(buffer.getvalue()))
+        os.replace(tmp_path, path)
+        state['stamp'] = self._file_stamp(path)
+
+        legacy_path = self._user_path(uid, ".npz")
+        if legacy_path.exists():
+            legacy_path.unlink()
+
+    def _get_ann(self, state: Dict[str, Any]):
+        """Build (once) the HNSW index for a large user"""
+        if state['ann'] is None:
+            vectors = state['vectors'].astype(np.float32)
+            ann = hnswlib.Index(space='cosine', dim=vectors.shape[1])
+            ann.init_index(max_elements=max(2 * len(vectors), 1024), ef_construction=200, M=16)
+            ann.add_items(vectors, np.arange(len(vectors)))
+            ann.set_ef(64)
+            state['ann'] = ann
+        return state['ann']
+
+    def add_entry(self, uid: str, entry_id: str, text: str) -> bool:
+        """
+        Embed a journal entry and add it to the user's index
+
+        Args:
+            uid: User ID
+            entry_id: Mood entry ID
+            text: Journal text
+
+        Returns:
+            Success status
+        """
+        try:
+            if not text or not text.strip():
+                return False
+
+            vector = self.embed([text])[0].astype(np.float16)
+
+            # Re-read under the file lock so entries other processes added are kept
+            with self._lock, self._file_lock(uid):
+                state = self._get_user(uid)
+                position = state['positions'].get(entry_id)
+
+                if position is not None:
+                    state['vectors'][position] = vector
+                elif state['vectors'] is None:
+                    position = 0
+                    state['vectors'] = vector[np.newaxis, :]
+                else:
+                    position = len(state['ids'])
+                    state['vectors'] = np.vstack([state['vectors'], vector])
+
+                if entry_id not in state['positions']:
+                    state['ids'].append(entry_id)
+                    state['positions'][entry_id] = position
+
+                ann = state['ann']
+                if ann is not None:
+                    if ann.get_current_count() >= ann.get_max_elements():
+                        ann.resize_index(2 * ann.get_max_elements())
+                    ann.add_items(vector.astype(np.float32)[np.newaxis, :], [position])
+
+                self._save_user(uid, state)
+
+            return True
+
+        except Exception as e:
+            logger.error(f"Failed to index entry {entry_id} for {uid}: {e}")
+            return False
+
+    def _search_vector(self, uid: str, query: np.ndarray, k: int,
+                       exclude_ids: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """Top-k entries by cosine similarity to a unit-length query vector"""
+        exclude = set(exclude_ids or [])
+
+        with self._lock:
+            state = self._get_user(uid)
+            ids = state['ids']
+            n = len(ids)
+            if n == 0:
+                return []
+
+            n_candidates = min(n, k + len(exclude))
+
+            if HNSWLIB_AVAILABLE and n >= self.ann_threshold:
+                labels, distances = self._get_ann(state).knn_query(query, k=n_candidates)
+                candidates = zip(labels[0], 1.0 - distances[0])
+            else:
+                scores = state['vectors'].astype(np.float32) @ query
+                top = np.argpartition(-scores, n_candidates - 1)[:n_candidates]
+                top = top[np.argsort(-scores[top])]
+                candidates = zip(top, scores[top])
+
+            results = []
+            for position, score in candidates:
+                entry_id = ids[int(position)]
+                if entry_id in exclude:
+                    continue
+                results.append({'entry_id': entry_id, 'similarity': round(float(score), 4)})
+                if len(results) == k:
+                    break
+            return results
+
+    def search(self, uid: str, text: str, k: int = 5,
+               exclude_ids: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """
+        Find the user's past entries most similar to a text
+
+        Args:
+            uid: User ID
+            text: Query text
+            k: Number of results
+            exclude_ids: Entry IDs to leave out
+
+        Returns:
+            List of {entry_id, similarity}, most similar first
+        """
+        try:
+            query = self.embed([text])[0]
+            return self._search_vector(uid, query, k, exclude_ids)
+        except Exception as e:
+            logger.error(f"Similarity search failed for {uid}: {e}")
+            return []
+
+    def similar_entries(self, uid: str, entry_id: str, k: int = 5) -> List[Dict[str, Any]]:
+        """
+        Find the user's past entries most similar to one of their indexed entries
+
+        Args:
+            uid: User ID
+            entry_id: Indexed mood entry ID
+            k: Number of results
+
+        Returns:
+            List of {entry_id, similarity}, most similar first
+        """
+        with self._lock:
+            state = self._get_user(uid)
+            position = state['positions'].get(entry_id)
+            if position is None:
+                return []
+            query = state['vectors'][position].astype(np.float32)
+
+        return self._search_vector(uid, query, k, exclude_ids=[entry_id])
+
+    def delete_user(self, uid: str) -> bool:
+        """
+        Delete a user's index from memory and disk
+
+        Args:
+            uid: User ID
+
+        Returns:
+            Success status
+        """
+        try:
+            with self._lock, self._file_lock(uid):
+                self._users.pop(uid, None)
+                for suffix in (".npz.enc", ".npz"):
+                    path = self._user_path(uid, suffix)
+                    if path.exists():
+                        path.unlink()
+            lock_path = self._user_path(uid, ".lock")
+            if lock_path.exists():
+                lock_path.unlink()
+            return True
+
+        except Exception as e:
+            logger.error(f"Failed to delete embeddings for {uid}: {e}")
+            return False
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get resident index statistics"""
+        with self._lock:
+            return {
+                'users_loaded': len(self._users),
+                'entries_loaded': sum(len(s['ids']) for s in self._users.values()),
+                'ann_indexes': sum(1 for s in self._users.values() if s['ann'] is not None),
+                'ann_available': HNSWLIB_AVAILABLE
+            }
+
+
+# Singleton instance
+embedding_index = JournalEmbeddingIndex()
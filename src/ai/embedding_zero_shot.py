@@ -0,0 +1,162 @@
+"""
+Embedding-based Zero-shot Classification
+Scores a text against every candidate label with one matrix multiply instead of
+one NLI pass per (text, label) pair
+"""
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from src.config import settings, MODELS_DIR
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Labels are embedded as short sentences so they sit near journal text in the space
+HYPOTHESIS_TEMPLATE = "I am dealing with {}."
+
+# Uncalibrated mapping from cosine similarity to a 0-1 score: sigmoid(SCALE * (cos - CENTER)).
+# These scores are not entailment probabilities, so the analyzer applies the
+# ZERO_SHOT_EMBEDDING_*_THRESHOLD settings to them instead of the NLI thresholds.
+DEFAULT_SCALE = 20.0
+DEFAULT_CENTER = 0.3
+
+HEAD_PATH = MODELS_DIR / "zero_shot_head.json"
+
+
+def _sigmoid(x: np.ndarray) -> np.ndarray:
+    return 1.0 / (1.0 + np.exp(-x))
+
+
+class EmbeddingZeroShotClassifier:
+    """Zero-shot classifier over sentence embeddings with cached label vectors"""
+
+    def __init__(self, embed_fn: Optional[Callable[[List[str]], np.ndarray]] = None,
+                 head_path: Optional[Path] = None):
+        """
+        Args:
+            embed_fn: Returns one vector per text (defaults to the journal embedding index model)
+            head_path: Calibrated per-label head (used if the file exists)
+        """
+        self._embed_fn = embed_fn
+        self.head_path = Path(head_path or HEAD_PATH)
+        self._label_vectors: Dict[str, np.ndarray] = {}
+        self._matrices: Dict[Tuple[str, ...], np.ndarray] = {}
+        self._lock = threading.Lock()
+        self.head = self._load_head()
+
+    def _embed(self, texts: List[str]) -> np.ndarray:
+        if self._embed_fn is None:
+            from src.ai.embedding_index import embedding_index
+            self._embed_fn = embedding_index.embed
+        vectors = np.asarray(self._embed_fn(texts), dtype=np.float32)
+        return vectors / np.maximum(np.linalg.norm(vectors, axis=1, keepdims=True), 1e-12)
+
+    def _load_head(self) -> Dict[str, Tuple[float, float]]:
+        """Load per-label (weight, bias) calibration, if present for this embedding model"""
+        if not self.head_path.exists():
+            return {}
+        try:
+            data = json.loads(self.head_path.read_text())
+            if data.get('model') != settings.EMBEDDING_MODEL:
+                logger.warning("Ignoring zero-shot head calibrated for a different embedding model")
+                return {}
+            return {label: (w, b) for label, (w, b) in data['labels'].items()}
+        except Exception as e:
+            logger.warning(f"Could not load zero-shot head {self.head_path}: {e}")
+            return {}
+
+    def label_matrix(self, labels: List[str]) -> np.ndarray:
+        """
+        Get the cached (n_labels, dim) matrix of label vectors, encoding any new labels once
+
+        Args:
+            labels: Candidate labels
+
+        Returns:
+            Label vectors in the order given
+        """
+        key = tuple(labels)
+        with self._lock:
+            matrix = self._matrices.get(key)
+            if matrix is not None:
+                return matrix
+
+            missing = [label for label in labels if label not in self._label_vectors]
+            if missing:
+                vectors = self._embed([HYPOTHESIS_TEMPLATE.format(label) for label in missing])
+                self._label_vectors.update(zip(missing, vectors))
+
+            matrix = np.stack([self._label_vectors[label] for label in labels])
+            self._matrices[key] = matrix
+            return matrix
+
+    def _calibrate(self, similarities: np.ndarray, labels: List[str]) -> np.ndarray:
+        """Map cosine similarities to independent per-label probabilities"""
+        weights = np.array([self.head.get(label, (DEFAULT_SCALE, 0.0))[0] for label in labels])
+        biases = np.array([
+            self.head[label][1] if label in self.head else -DEFAULT_SCALE * DEFAULT_CENTER
+            for label in labels
+        ])
+        return _sigmoid(similarities * weights + biases)
+
+    def classify(self, texts: List[str], labels: List[str]) -> List[Dict[str, float]]:
+        """
+        Score every text against every label
+
+        Args:
+            texts: Texts to classify
+            labels: Candidate labels
+
+        Returns:
+            One mapping of label to probability per text (multi-label, like the NLI pipeline)
+        """
+        similarities = self._embed(texts) @ self.label_matrix(labels).T
+        scores = self._calibrate(similarities, labels)
+        return [dict(zip(labels, row.tolist())) for row in scores]
+
+    def fit_head(self, texts: List[str], targets: List[List[str]], labels: List[str]) -> Dict[str, Any]:
+        """
+        Fit a per-label logistic calibration on labelled examples and save it
+
+        Args:
+            texts: Example texts
+            targets: Labels that apply to each text
+            labels: Labels to calibrate
+
+        Returns:
+            Fit results
+        """
+        try:
+            from sklearn.linear_model import LogisticRegression
+
+            similarities = self._embed(texts) @ self.label_matrix(labels).T
+            head = {}
+            for j, label in enumerate(labels):
+                y = np.array([label in t for t in targets], dtype=int)
+                if y.min() == y.max():
+                    continue  # needs positive and negative examples
+                model = LogisticRegression().fit(similarities[:, [j]], y)
+                head[label] = (float(model.coef_[0][0]), float(model.intercept_[0]))
+
+            self.head_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.head_path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps({'model': settings.EMBEDDING_MODEL, 'labels': head}, indent=2))
+            os.replace(tmp_path, self.head_path)
+            self.head = head
+
+            logger.info(f"Calibrated zero-shot head for {len(head)} labels")
+            return {"success": True, "calibrated_labels": sorted(head)}
+
+        except Exception as e:
+            logger.error(f"Zero-shot head calibration failed: {e}")
+            return {"success": False, "error": str(e)}
+
+
+# Singleton instance
+embedding_zero_shot = EmbeddingZeroShotClassifier()
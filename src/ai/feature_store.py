@@ -0,0 +1,132 @@
+"""
+Incremental Mood Feature State
+Per-user running statistics updated in O(1) per mood entry, so forecasts can
+read the latest features without rebuilding them from the full history
+"""
+
+import math
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+# Scores kept per user: the latest entry plus the 7 before it (for mood_lag_7)
+FEATURE_WINDOW = 8
+
+
+def empty_feature_state() -> Dict[str, Any]:
+    """New feature state for a user without entries"""
+    return {
+        'recent_scores': [],
+        'count': 0,
+        'sum': 0.0,
+        'first_created_at': None,
+        'last_created_at': None
+    }
+
+
+def update_feature_state(state: Optional[Dict[str, Any]], mood_score: float,
+                         created_at: datetime) -> Dict[str, Any]:
+    """
+    Add one mood entry to a feature state
+
+    Args:
+        state: Current state (None = empty)
+        mood_score: Score of the new entry
+        created_at: Timestamp of the new entry
+
+    Returns:
+        New state (the input is not modified)
+    """
+    state = dict(state or empty_feature_state())
+    score = float(mood_score)
+
+    state['recent_scores'] = (list(state['recent_scores']) + [score])[-FEATURE_WINDOW:]
+    state['count'] += 1
+    state['sum'] += score
+    state['first_created_at'] = state['first_created_at'] or created_at
+    state['last_created_at'] = created_at
+
+    return state
+
+
+def build_feature_state(mood_history: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Build a feature state from mood entries (used to seed existing users)
+
+    Args:
+        mood_history: Mood entries in any order
+
+    Returns:
+        Feature state
+    """
+    state = empty_feature_state()
+    entries = [e for e in mood_history if 'mood_score' in e and e.get('created_at') is not None]
+    for entry in sorted(entries, key=lambda e: e['created_at']):
+        state = update_feature_state(state, entry['mood_score'], entry['created_at'])
+    return state
+
+
+def seed_feature_state(recent_entries: List[Dict[str, Any]], count: int, total: float) -> Dict[str, Any]:
+    """
+    Build a feature state for a user who already has entries
+
+    The recent scores come from the latest entries; count and sum come from an
+    aggregation over the whole history so the running mean is exact.
+    first_created_at only covers the entries passed in.
+
+    Args:
+        recent_entries: The user's latest FEATURE_WINDOW (or more) entries
+        count: Number of entries in the full history
+        total: Sum of mood scores over the full history
+
+    Returns:
+        Feature state
+    """
+    state = build_feature_state(recent_entries)
+    if count > state['count']:
+        state['count'] = int(count)
+        state['sum'] = float(total)
+    return state
+
+
+def latest_features(state: Dict[str, Any]) -> Optional[Dict[str, float]]:
+    """
+    Features of the latest entry, matching the last row of MoodPredictor.prepare_features
+
+    Args:
+        state: Feature state
+
+    Returns:
+        Mapping of feature name to value, or None if the state has no entries
+    """
+    scores = state.get('recent_scores') or []
+    if not scores or state.get('last_created_at') is None:
+        return None
+
+    mean = state['sum'] / state['count']
+    last_3 = scores[-3:]
+    last_7 = scores[-7:]
+
+    # Sample standard deviation, like pandas rolling std (0 for a single value)
+    if len(last_3) > 1:
+        mean_3 = sum(last_3) / len(last_3)
+        std_3 = math.sqrt(sum((s - mean_3) ** 2 for s in last_3) / (len(last_3) - 1))
+    else:
+        std_3 = 0.0
+
+    def lag(n: int) -> float:
+        return scores[-1 - n] if len(scores) > n else mean
+
+    created_at = state['last_created_at']
+    return {
+        'day_of_week': created_at.weekday(),
+        'day_of_month': created_at.day,
+        'month': created_at.month,
+        'hour': created_at.hour,
+        'mood_rolling_mean_3': sum(last_3) / len(last_3),
+        'mood_rolling_std_3': std_3,
+        'mood_rolling_mean_7': sum(last_7) / len(last_7),
+        'mood_lag_1': lag(1),
+        'mood_lag_2': lag(2),
+        'mood_lag_7': lag(7),
+        'mood_trend': scores[-1] - scores[-2] if len(scores) > 1 else 0.0
+    }
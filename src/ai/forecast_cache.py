@@ -0,0 +1,177 @@
+"""
+Forecast Result Cache
+Mood forecasts keyed by user, latest entry, horizon and model version, kept in
+an in-process LRU with an optional shared Redis tier
+"""
+
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+try:
+    import redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+from src.config import settings
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def make_forecast_key(latest_entry: Any, days_ahead: int, model_version: Any) -> str:
+    """
+    Build the per-user part of a forecast cache key
+
+    Args:
+        latest_entry: Latest mood entry ID or created_at
+        days_ahead: Number of days forecast
+        model_version: Version of the model that would make the forecast
+
+    Returns:
+        Key unique within one user's forecasts
+    """
+    if hasattr(latest_entry, 'isoformat'):
+        latest_entry = latest_entry.isoformat()
+    return f"{latest_entry}|{days_ahead}|{model_version}"
+
+
+class ForecastCache:
+    """Per-user forecast cache, invalidated when the user logs a mood entry"""
+
+    def __init__(self, max_users: Optional[int] = None, ttl_seconds: Optional[int] = None,
+                 redis_client: Optional[Any] = None):
+        """
+        Args:
+            max_users: Users kept in the in-process LRU (defaults to FORECAST_CACHE_MAX_USERS)
+            ttl_seconds: Entry lifetime (defaults to CACHE_TTL_SECONDS)
+            redis_client: Shared tier (defaults to a client when ENABLE_REDIS_CACHE is set)
+        """
+        self.max_users = max_users or settings.FORECAST_CACHE_MAX_USERS
+        self.ttl_seconds = ttl_seconds or settings.CACHE_TTL_SECONDS
+        self._memory: "OrderedDict[str, Dict[str, Tuple[float, Dict[str, Any]]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._redis = redis_client if redis_client is not None else self._connect()
+
+        self.stats = {"memory_hits": 0, "shared_hits": 0, "misses": 0, "invalidations": 0}
+
+    def _connect(self) -> Optional[Any]:
+        """Redis client for the shared tier, or None"""
+        if not settings.ENABLE_REDIS_CACHE:
+            return None
+        if not REDIS_AVAILABLE:
+            logger.warning("ENABLE_REDIS_CACHE is set but redis is not installed, forecast cache is in-process only")
+            return None
+        return redis.Redis(
+            host=settings.REDIS_HOST,
+            port=settings.REDIS_PORT,
+            db=settings.REDIS_DB,
+            socket_timeout=0.5
+        )
+
+    @staticmethod
+    def _redis_key(uid: str) -> str:
+        return f"forecast:{uid}"
+
+    def _remember(self, uid: str, key: str, created_at: float, value: Dict[str, Any]):
+        """Insert into the in-process tier, evicting least recently used users"""
+        self._memory.setdefault(uid, {})[key] = (created_at, value)
+        self._memory.move_to_end(uid)
+        while len(self._memory) > self.max_users:
+            self._memory.popitem(last=False)
+
+    def get(self, uid: str, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached forecast
+
+        Args:
+            uid: User ID
+            key: Key from make_forecast_key
+
+        Returns:
+            Cached forecast or None
+        """
+        with self._lock:
+            entry = self._memory.get(uid, {}).get(key)
+            if entry is not None:
+                created_at, value = entry
+                if time.time() - created_at <= self.ttl_seconds:
+                    self._memory.move_to_end(uid)
+                    self.stats["memory_hits"] += 1
+                    return value
+                del self._memory[uid][key]
+
+        if self._redis is not None:
+            try:
+                raw = self._redis.hget(self._redis_key(uid), key)
+                if raw is not None:
+                    value = json.loads(raw)
+                    with self._lock:
+                        self._remember(uid, key, time.time(), value)
+                        self.stats["shared_hits"] += 1
+                    return value
+            except Exception as e:
+                logger.warning(f"Shared forecast cache read failed: {e}")
+
+        with self._lock:
+            self.stats["misses"] += 1
+        return None
+
+    def set(self, uid: str, key: str, value: Dict[str, Any]):
+        """
+        Store a forecast
+
+        Args:
+            uid: User ID
+            key: Key from make_forecast_key
+            value: JSON-serializable forecast
+        """
+        with self._lock:
+            self._remember(uid, key, time.time(), value)
+
+        if self._redis is not None:
+            try:
+                redis_key = self._redis_key(uid)
+                pipe = self._redis.pipeline()
+                pipe.hset(redis_key, key, json.dumps(value))
+                pipe.expire(redis_key, self.ttl_seconds)
+                pipe.execute()
+            except Exception as e:
+                logger.warning(f"Shared forecast cache write failed: {e}")
+
+    def invalidate(self, uid: str):
+        """
+        Drop every cached forecast for a user (call when they log a mood entry)
+
+        Args:
+            uid: User ID
+        """
+        with self._lock:
+            self._memory.pop(uid, None)
+            self.stats["invalidations"] += 1
+
+        if self._redis is not None:
+            try:
+                self._redis.delete(self._redis_key(uid))
+            except Exception as e:
+                logger.warning(f"Shared forecast cache invalidation failed: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and cache size"""
+        with self._lock:
+            hits = self.stats["memory_hits"] + self.stats["shared_hits"]
+            lookups = hits + self.stats["misses"]
+            return {
+                **self.stats,
+                "hits": hits,
+                "hit_rate": round(hits / lookups, 3) if lookups else 0.0,
+                "cached_users": len(self._memory),
+                "shared": self._redis is not None
+            }
+
+
+# Singleton instance
+forecast_cache = ForecastCache()
@@ -0,0 +1,166 @@
+"""
+Mood Forecasting Model Ladder
+Cheap closed-form models for short histories, gradient boosting for long ones,
+chosen per user by a time-ordered backtest
+"""
+
+import numpy as np
+from sklearn.ensemble import HistGradientBoostingRegressor
+from sklearn.linear_model import SGDRegressor
+from sklearn.preprocessing import StandardScaler
+from typing import Any, Dict, List, Optional, Tuple
+
+# Entries needed before gradient boosting is considered
+LONG_HISTORY_ENTRIES = 90
+
+# Ridge penalties tried for every user
+RIDGE_ALPHAS = (0.3, 3.0, 30.0)
+
+# Share of the history held out (latest targets) when comparing candidates
+BACKTEST_FRACTION = 0.25
+
+
+def expand_weekday(X: np.ndarray, weekday_column: Optional[int]) -> np.ndarray:
+    """
+    Replace a 0-6 weekday column with one indicator per weekday
+
+    Args:
+        X: Model input rows
+        weekday_column: Index of the weekday column (None = leave X as is)
+
+    Returns:
+        Expanded rows
+    """
+    if weekday_column is None:
+        return X
+    weekdays = X[:, weekday_column].astype(int) % 7
+    return np.hstack([np.delete(X, weekday_column, axis=1), np.eye(7)[weekdays]])
+
+
+class RidgeForecaster:
+    """
+    Closed-form ridge regression on standardized features
+
+    The target-weekday column is expanded to one indicator per weekday so a
+    weekly pattern is not forced onto a straight line.
+    """
+
+    def __init__(self, alpha: float = 3.0, weekday_column: Optional[int] = None):
+        """
+        Args:
+            alpha: L2 penalty
+            weekday_column: Index of a 0-6 weekday column to one-hot encode
+        """
+        self.alpha = alpha
+        self.weekday_column = weekday_column
+
+    def fit(self, X: np.ndarray, y: np.ndarray) -> "RidgeForecaster":
+        D = expand_weekday(np.asarray(X, dtype=float), self.weekday_column)
+        self.mean_ = D.mean(axis=0)
+        self.scale_ = D.std(axis=0)
+        self.scale_[self.scale_ == 0] = 1.0
+        Z = (D - self.mean_) / self.scale_
+
+        self.intercept_ = float(np.mean(y))
+        gram = Z.T @ Z + self.alpha * np.eye(Z.shape[1])
+        self.coef_ = np.linalg.solve(gram, Z.T @ (y - self.intercept_))
+        return self
+
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        Z = (expand_weekday(np.asarray(X, dtype=float), self.weekday_column) - self.mean_) / self.scale_
+        return Z @ self.coef_ + self.intercept_
+
+
+class IncrementalForecaster:
+    """
+    Linear model trained in mini-batches, for data that does not fit in memory
+
+    Feature scaling is learned in its own pass (partial_fit_scaler) before the
+    regression passes (partial_fit), so every gradient step sees the same scale.
+    """
+
+    def __init__(self, weekday_column: Optional[int] = None, alpha: float = 1e-4):
+        """
+        Args:
+            weekday_column: Index of a 0-6 weekday column to one-hot encode
+            alpha: L2 penalty
+        """
+        self.weekday_column = weekday_column
+        self.scaler = StandardScaler()
+        self.model = SGDRegressor(alpha=alpha, learning_rate='adaptive', eta0=0.01, random_state=42)
+        self.n_samples_ = 0
+
+    def partial_fit_scaler(self, X: np.ndarray) -> "IncrementalForecaster":
+        self.scaler.partial_fit(expand_weekday(np.asarray(X, dtype=float), self.weekday_column))
+        return self
+
+    def partial_fit(self, X: np.ndarray, y: np.ndarray) -> "IncrementalForecaster":
+        Z = self.scaler.transform(expand_weekday(np.asarray(X, dtype=float), self.weekday_column))
+        self.model.partial_fit(Z, y)
+        self.n_samples_ += len(y)
+        return self
+
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        Z = self.scaler.transform(expand_weekday(np.asarray(X, dtype=float), self.weekday_column))
+        return self.model.predict(Z)
+
+
+def candidate_models(n_entries: int, weekday_column: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Unfitted models worth trying for a history of the given length
+
+    Args:
+        n_entries: Mood entries in the user's history
+        weekday_column: Index of the target-weekday column
+
+    Returns:
+        Mapping of model name to estimator
+    """
+    candidates: Dict[str, Any] = {
+        f"ridge_{alpha:g}": RidgeForecaster(alpha=alpha, weekday_column=weekday_column)
+        for alpha in RIDGE_ALPHAS
+    }
+    if n_entries >= LONG_HISTORY_ENTRIES:
+        candidates["hist_gbm"] = HistGradientBoostingRegressor(
+            max_iter=100, learning_rate=0.1, max_leaf_nodes=15, random_state=42
+        )
+    return candidates
+
+
+def select_model(X: np.ndarray, y: np.ndarray, target_index: np.ndarray, n_entries: int,
+                 weekday_column: Optional[int] = None,
+                 candidates: Optional[Dict[str, Any]] = None) -> Tuple[str, Any, Optional[float]]:
+    """
+    Pick the candidate with the lowest backtest error and refit it on all rows
+
+    Rows whose target falls in the latest BACKTEST_FRACTION of the history are
+    held out, so every candidate is scored on forecasts of entries it never saw.
+
+    Args:
+        X: Model input rows
+        y: Targets
+        target_index: Position of each row's target entry in the history
+        n_entries: Mood entries in the history
+        weekday_column: Index of the target-weekday column
+        candidates: Unfitted models to compare (defaults to candidate_models)
+
+    Returns:
+        (model name, fitted model, backtest MAE or None if there was no holdout)
+    """
+    candidates = candidates or candidate_models(n_entries, weekday_column)
+
+    split = int(n_entries * (1 - BACKTEST_FRACTION))
+    train = target_index < split
+    scores: List[Tuple[float, str]] = []
+    if train.sum() >= 10 and (~train).any():
+        for name, model in candidates.items():
+            model.fit(X[train], y[train])
+            scores.append((float(np.mean(np.abs(model.predict(X[~train]) - y[~train]))), name))
+
+    if scores:
+        backtest_mae, name = min(scores)
+    else:
+        backtest_mae, name = None, next(iter(candidates))
+
+    model = candidates[name].fit(X, y)
+    return name, model, backtest_mae
@@ -0,0 +1,134 @@
+"""
+Lazy Model Proxies
+Builds heavy AI singletons on a background thread so the UI can start immediately
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# All proxies created in this process, for readiness reporting
+_proxies: List["LazyModel"] = []
+
+
+class LazyModel:
+    """Proxy that constructs its target in the background and waits only when used"""
+
+    def __init__(self, factory: Callable[[], Any], name: str, fallback: Any = None):
+        """
+        Args:
+            factory: Zero-argument callable that builds the real object
+            name: Name used in logs and readiness reports
+            fallback: Object whose attributes are served instead of waiting while
+                the target is loading (or if it failed to load)
+        """
+        self._factory = factory
+        self._name = name
+        self._fallback = fallback
+        self._instance: Optional[Any] = None
+        self._error: Optional[BaseException] = None
+        self._ready = threading.Event()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._load_seconds: Optional[float] = None
+        _proxies.append(self)
+
+    def start(self) -> "LazyModel":
+        """Begin loading on a background thread (idempotent; retries after a failure)"""
+        with self._lock:
+            if self._ready.is_set() and self._error is None:
+                return self
+            if self._thread is not None and self._thread.is_alive():
+                return self
+            self._error = None
+            self._ready.clear()
+            self._thread = threading.Thread(
+                target=self._load, name=f"warmup-{self._name}", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def _load(self):
+        """Background loader"""
+        start = time.monotonic()
+        try:
+            logger.info(f"Warming up {self._name}")
+            self._instance = self._factory()
+            self._load_seconds = time.monotonic() - start
+            logger.info(f"{self._name} ready in {self._load_seconds:.1f}s")
+        except BaseException as e:
+            self._error = e
+            logger.error(f"Failed to load {self._name}: {e}")
+        finally:
+            self._ready.set()
+
+    def is_ready(self) -> bool:
+        """Check if the target has loaded successfully"""
+        return self._ready.is_set() and self._error is None
+
+    def wait(self, timeout: Optional[float] = None) -> Any:
+        """
+        Block until the target is loaded
+
+        Args:
+            timeout: Seconds to wait (None = forever)
+
+        Returns:
+            The loaded object
+        """
+        self.start()
+        if not self._ready.wait(timeout):
+            raise TimeoutError(f"{self._name} is still loading")
+        if self._error is not None:
+            raise RuntimeError(f"{self._name} failed to load: {self._error}") from self._error
+        return self._instance
+
+    def status(self) -> Dict[str, Any]:
+        """Readiness details for this proxy"""
+        if self.is_ready():
+            state = "ready"
+        elif self._error is not None:
+            state = "failed"
+        elif self._thread is not None:
+            state = "loading"
+        else:
+            state = "not_started"
+
+        return {
+            "state": state,
+            "load_seconds": round(self._load_seconds, 2) if self._load_seconds else None,
+            "error": str(self._error) if self._error else None
+        }
+
+    def __getattr__(self, attr: str) -> Any:
+        # Only called for attributes the proxy itself does not define
+        if attr.startswith('_'):
+            raise AttributeError(attr)
+        if self._fallback is not None and not self.is_ready() and hasattr(self._fallback, attr):
+            if self._thread is None:
+                self.start()
+            return getattr(self._fallback, attr)
+        return getattr(self.wait(), attr)
+
+    def __repr__(self) -> str:
+        return f"<LazyModel {self._name} ({self.status()['state']})>"
+
+
+def warm_up_models():
+    """Start background loading for every lazy model"""
+    for proxy in _proxies:
+        proxy.start()
+
+
+def models_ready() -> bool:
+    """Check if every lazy model has finished loading"""
+    return all(proxy.is_ready() for proxy in _proxies)
+
+
+def get_models_status() -> Dict[str, Dict[str, Any]]:
+    """Readiness details for every lazy model"""
+    return {proxy._name: proxy.status() for proxy in _proxies}
@@ -0,0 +1,140 @@
+"""
+Lexicon-based Sentiment Scorer
+Fast rule-based first stage of the sentiment cascade; also serves while the
+transformer model is still loading
+"""
+
+import math
+import re
+from typing import Any, Dict, List
+
+from src.ai.mood_scale import build_sentiment_result
+
+# Word polarities (1 = mild, 2 = strong)
+POSITIVE_WORDS = {
+    'good': 1, 'great': 2, 'happy': 2, 'glad': 1, 'joy': 2, 'joyful': 2, 'love': 2,
+    'loved': 2, 'lovely': 2, 'wonderful': 2, 'amazing': 2, 'awesome': 2, 'excellent': 2,
+    'fantastic': 2, 'calm': 1, 'relaxed': 1, 'peaceful': 1, 'grateful': 2, 'thankful': 2,
+    'proud': 2, 'excited': 2, 'hopeful': 1, 'optimistic': 1, 'productive': 1, 'fun': 1,
+    'enjoyed': 1, 'enjoy': 1, 'nice': 1, 'better': 1, 'best': 2, 'content': 1,
+    'energized': 1, 'motivated': 1, 'confident': 1, 'rested': 1, 'smile': 1, 'smiled': 1,
+    'laughed': 1, 'blessed': 2, 'delighted': 2, 'cheerful': 2, 'accomplished': 1,
+    'supported': 1, 'safe': 1, 'fine': 1, 'beautiful': 2, 'success': 1,
+    'successful': 1, 'relieved': 1, 'satisfied': 1, 'inspired': 1, 'refreshed': 1
+}
+
+NEGATIVE_WORDS = {
+    'bad': 1, 'terrible': 2, 'awful': 2, 'horrible': 2, 'sad': 2, 'unhappy': 2,
+    'depressed': 2, 'depressing': 2, 'anxious': 2, 'anxiety': 2, 'worried': 1, 'worry': 1,
+    'stressed': 2, 'stress': 1, 'stressful': 2, 'angry': 2, 'mad': 1, 'upset': 2,
+    'frustrated': 2, 'frustrating': 2, 'tired': 1, 'exhausted': 2, 'lonely': 2, 'alone': 1,
+    'hurt': 2, 'pain': 2, 'painful': 2, 'cry': 2, 'cried': 2, 'crying': 2, 'scared': 2,
+    'afraid': 2, 'fear': 2, 'hate': 2, 'hated': 2, 'miserable': 2, 'hopeless': 2,
+    'worthless': 2, 'overwhelmed': 2, 'sick': 1, 'worse': 1, 'worst': 2, 'fail': 1,
+    'failed': 1, 'failure': 2, 'nervous': 1, 'panic': 2, 'irritated': 1, 'annoyed': 1,
+    'disappointed': 2, 'guilty': 1, 'ashamed': 2, 'empty': 1, 'numb': 1, 'broken': 2,
+    'sleepless': 1, 'insomnia': 1, 'argument': 1, 'fight': 1
+}
+
+NEGATIONS = {
+    'not', 'no', 'never', 'none', 'nothing', 'nobody', 'neither', 'nor', 'without',
+    "don't", "didn't", "doesn't", "isn't", "wasn't", "aren't", "weren't", "can't",
+    "couldn't", "won't", "wouldn't", "shouldn't", "haven't", "hasn't", "hadn't",
+    'dont', 'didnt', 'doesnt', 'isnt', 'wasnt', 'cant', 'couldnt', 'wont', 'hardly'
+}
+
+INTENSIFIERS = {
+    'very': 1.5, 'really': 1.5, 'so': 1.4, 'extremely': 1.8, 'incredibly': 1.8,
+    'super': 1.5, 'totally': 1.4, 'completely': 1.5, 'truly': 1.4, 'quite': 1.2,
+    'slightly': 0.6, 'somewhat': 0.7, 'kinda': 0.7, 'bit': 0.7
+}
+
+NEGATION_WINDOW = 3
+NEGATION_FACTOR = -0.75
+
+_TOKEN_RE = re.compile(r"[a-z']+")
+
+
+class LexiconSentimentScorer:
+    """Rule-based sentiment scorer with negation, intensifier and contrast handling"""
+
+    def score(self, text: str) -> Dict[str, Any]:
+        """
+        Score text
+
+        Args:
+            text: Text to score
+
+        Returns:
+            Raw result with label and score, in the same format as the transformer pipeline
+        """
+        tokens = _TOKEN_RE.findall(text.lower())
+
+        # Clauses after "but" carry more weight than the ones before it
+        contrast_at = tokens.index('but') if 'but' in tokens else -1
+
+        positive = 0.0
+        negative = 0.0
+        for i, token in enumerate(tokens):
+            polarity = POSITIVE_WORDS.get(token, 0) - NEGATIVE_WORDS.get(token, 0)
+            if not polarity:
+                continue
+
+            value = float(polarity)
+            if i > 0 and tokens[i - 1] in INTENSIFIERS:
+                value *= INTENSIFIERS[tokens[i - 1]]
+            if any(t in NEGATIONS for t in tokens[max(0, i - NEGATION_WINDOW):i]):
+                value *= NEGATION_FACTOR
+            if contrast_at >= 0:
+                value *= 1.5 if i > contrast_at else 0.5
+
+            if value > 0:
+                positive += value
+            else:
+                negative -= value
+
+        total = positive + negative
+        if total == 0:
+            return {"label": "NEUTRAL", "score": 0.5}
+
+        # Confidence grows with evidence and shrinks with mixed signals
+        agreement = abs(positive - negative) / total
+        confidence = 0.5 + 0.5 * agreement * math.tanh(total / 2)
+
+        label = "POSITIVE" if positive >= negative else "NEGATIVE"
+        return {"label": label, "score": confidence}
+
+    def analyze_text(self, text: str, return_chunks: bool = False,
+                     use_cascade: bool = True) -> Dict[str, Any]:
+        """
+        Analyze sentiment of text using the lexicon only
+
+        Takes the same arguments as SentimentAnalyzer.analyze_text so it can
+        stand in for it while the model loads (lexicon results have no windows).
+
+        Args:
+            text: Text to analyze
+            return_chunks: Ignored
+            use_cascade: Ignored
+
+        Returns:
+            Sentiment analysis results (same schema as SentimentAnalyzer.analyze_text)
+        """
+        if not text or len(text.strip()) == 0:
+            return {
+                "success": False,
+                "error": "Empty text provided"
+            }
+
+        result = build_sentiment_result(self.score(text))
+        result['tier'] = 'lexicon'
+        return result
+
+    def analyze_texts(self, texts: List[str], return_chunks: bool = False,
+                      use_cascade: bool = True) -> List[Dict[str, Any]]:
+        """Analyze many texts using the lexicon only (same arguments as SentimentAnalyzer.analyze_texts)"""
+        return [self.analyze_text(text) for text in texts]
+
+
+# Singleton instance
+lexicon_scorer = LexiconSentimentScorer()
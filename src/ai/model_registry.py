@@ -0,0 +1,186 @@
+"""
+Process-wide Model Registry
+Loads models lazily, keeps them resident and evicts idle ones under a memory budget
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional
+
+from src.config import settings
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def estimate_model_size_mb(model: Any) -> float:
+    """
+    Estimate resident size of a loaded model
+
+    Args:
+        model: Torch module or transformers pipeline
+
+    Returns:
+        Approximate size in megabytes (0 if unknown)
+    """
+    module = getattr(model, 'model', model)
+    parameters = getattr(module, 'parameters', None)
+    if parameters is None:
+        return 0.0
+
+    try:
+        total_bytes = sum(p.numel() * p.element_size() for p in parameters())
+        return total_bytes / (1024 * 1024)
+    except Exception:
+        return 0.0
+
+
+class ModelRegistry:
+    """Lazy, LRU-evicting store of loaded models shared by the whole process"""
+
+    def __init__(self, max_memory_mb: Optional[float] = None,
+                 max_idle_seconds: Optional[float] = None):
+        """
+        Args:
+            max_memory_mb: Memory budget for resident models (0 or None = unlimited)
+            max_idle_seconds: Drop models unused for this long when loading another (0 or None = never)
+        """
+        self.max_memory_mb = max_memory_mb or 0
+        self.max_idle_seconds = max_idle_seconds or 0
+        self._loaders: Dict[str, Callable[[], Any]] = {}
+        self._size_hints: Dict[str, float] = {}
+        self._models: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.RLock()
+        self._load_locks: Dict[str, threading.Lock] = {}
+
+    def register(self, name: str, loader: Callable[[], Any], size_mb: Optional[float] = None):
+        """
+        Register a model loader (idempotent)
+
+        Args:
+            name: Registry key
+            loader: Zero-argument callable returning the loaded model
+            size_mb: Size hint used when the size cannot be measured
+        """
+        with self._lock:
+            if name not in self._loaders:
+                self._loaders[name] = loader
+                self._load_locks[name] = threading.Lock()
+            if size_mb is not None:
+                self._size_hints[name] = size_mb
+
+    def get(self, name: str) -> Any:
+        """
+        Get a model, loading it on first use
+
+        Args:
+            name: Registry key
+
+        Returns:
+            Loaded model
+        """
+        with self._lock:
+            entry = self._models.get(name)
+            if entry is not None:
+                self._touch(name, entry)
+                return entry['model']
+            if name not in self._loaders:
+                raise KeyError(f"Model not registered: {name}")
+            load_lock = self._load_locks[name]
+
+        # Load outside the registry lock so other models stay available
+        with load_lock:
+            with self._lock:
+                entry = self._models.get(name)
+                if entry is not None:
+                    self._touch(name, entry)
+                    return entry['model']
+
+            logger.info(f"Loading model into registry: {name}")
+            start = time.monotonic()
+            model = self._loaders[name]()
+            size_mb = estimate_model_size_mb(model) or self._size_hints.get(name, 0.0)
+
+            with self._lock:
+                if self.max_idle_seconds:
+                    self.evict_idle(self.max_idle_seconds)
+                self._evict_for(size_mb)
+                self._models[name] = {
+                    'model': model,
+                    'size_mb': size_mb,
+                    'loaded_at': time.time(),
+                    'last_used': time.time()
+                }
+                logger.info(
+                    f"Model {name} loaded in {time.monotonic() - start:.1f}s "
+                    f"({size_mb:.0f} MB, {self.memory_usage_mb():.0f} MB resident)"
+                )
+
+            return model
+
+    def _touch(self, name: str, entry: Dict[str, Any]):
+        """Mark a model as most recently used"""
+        entry['last_used'] = time.time()
+        self._models.move_to_end(name)
+
+    def _evict_for(self, incoming_mb: float):
+        """Evict least recently used models until the incoming model fits"""
+        if not self.max_memory_mb:
+            return
+
+        while self._models and self.memory_usage_mb() + incoming_mb > self.max_memory_mb:
+            name, entry = self._models.popitem(last=False)
+            idle = time.time() - entry['last_used']
+            logger.info(f"Evicted model {name} ({entry['size_mb']:.0f} MB, idle {idle:.0f}s)")
+
+    def evict_idle(self, max_idle_seconds: float) -> int:
+        """
+        Evict models that have not been used recently
+
+        Args:
+            max_idle_seconds: Idle time after which a model is dropped
+
+        Returns:
+            Number of evicted models
+        """
+        now = time.time()
+        with self._lock:
+            idle = [name for name, entry in self._models.items()
+                    if now - entry['last_used'] > max_idle_seconds]
+            for name in idle:
+                self._models.pop(name)
+                logger.info(f"Evicted idle model {name}")
+            return len(idle)
+
+    def unload(self, name: str) -> bool:
+        """Drop a resident model; it will be reloaded on next use"""
+        with self._lock:
+            return self._models.pop(name, None) is not None
+
+    def is_loaded(self, name: str) -> bool:
+        """Check if a model is resident"""
+        with self._lock:
+            return name in self._models
+
+    def memory_usage_mb(self) -> float:
+        """Total estimated size of resident models"""
+        with self._lock:
+            return sum(entry['size_mb'] for entry in self._models.values())
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Registry statistics"""
+        with self._lock:
+            return {
+                "registered": list(self._loaders),
+                "loaded": list(self._models),
+                "memory_usage_mb": round(self.memory_usage_mb(), 1),
+                "max_memory_mb": self.max_memory_mb
+            }
+
+
+# Singleton instance
+model_registry = ModelRegistry(
+    max_memory_mb=settings.MODEL_REGISTRY_MAX_MEMORY_MB,
+    max_idle_seconds=settings.MODEL_REGISTRY_IDLE_SECONDS
+)
@@ -0,0 +1,251 @@
+"""
+Shared Model Server
+Owns the sentiment and zero-shot models and serves batched requests over a Unix socket,
+so multiple app workers on one host share a single copy of the weights.
+
+Run with: python -m src.ai.model_server
+"""
+
+import json
+import os
+import socket
+import socketserver
+import struct
+import time
+from collections import defaultdict
+from queue import Full
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.config import settings
+from src.ai.batching import MicroBatcher
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+_HEADER = struct.Struct("!I")
+
+
+class ModelServerBusy(Exception):
+    """Raised when the model server rejects a request because its queue is full"""
+
+
+def send_message(sock: socket.socket, payload: Dict[str, Any]):
+    """Send a length-prefixed JSON message"""
+    data = json.dumps(payload).encode('utf-8')
+    sock.sendall(_HEADER.pack(len(data)) + data)
+
+
+def _recv_exact(sock: socket.socket, size: int) -> bytes:
+    buffer = b''
+    while len(buffer) < size:
+        chunk = sock.recv(size - len(buffer))
+        if not chunk:
+            raise ConnectionError("Model server connection closed")
+        buffer += chunk
+    return buffer
+
+
+def recv_message(sock: socket.socket) -> Dict[str, Any]:
+    """Receive a length-prefixed JSON message"""
+    (size,) = _HEADER.unpack(_recv_exact(sock, _HEADER.size))
+    return json.loads(_recv_exact(sock, size).decode('utf-8'))
+
+
+class ModelServer:
+    """Batched inference server for the sentiment and zero-shot models"""
+
+    def __init__(self, socket_path: Optional[str] = None, analyzer: Any = None):
+        """
+        Args:
+            socket_path: Unix socket to listen on (defaults to MODEL_SERVER_SOCKET)
+            analyzer: SentimentAnalyzer running in-process (built if omitted)
+        """
+        if analyzer is None:
+            from src.ai.sentiment_analyzer import SentimentAnalyzer
+            analyzer = SentimentAnalyzer(local=True)
+
+        self.socket_path = socket_path or settings.MODEL_SERVER_SOCKET or "/tmp/mindful_connect_models.sock"
+        self.analyzer = analyzer
+        self.timeout = settings.MODEL_SERVER_TIMEOUT
+        self.started_at = time.time()
+
+        # Bounded queues give callers immediate backpressure instead of unbounded latency
+        self.sentiment_batcher = MicroBatcher(
+            analyzer._run_pipeline,
+            max_batch_size=settings.SENTIMENT_BATCH_SIZE,
+            max_wait_ms=settings.SENTIMENT_BATCH_WAIT_MS,
+            name="server-sentiment",
+            max_queue_size=settings.MODEL_SERVER_MAX_QUEUE
+        )
+        self.zero_shot_batcher = MicroBatcher(
+            self._run_zero_shot,
+            max_batch_size=max(1, settings.SENTIMENT_BATCH_SIZE // 4),
+            max_wait_ms=settings.SENTIMENT_BATCH_WAIT_MS,
+            name="server-zero-shot",
+            max_queue_size=settings.MODEL_SERVER_MAX_QUEUE
+        )
+
+    def _run_zero_shot(self, items: List[Tuple[str, Tuple[str, ...]]]) -> List[Dict[str, float]]:
+        """Score queued (text, labels) requests, one NLI pass (or matrix multiply) per distinct label set"""
+        groups: Dict[Tuple[str, ...], List[int]] = defaultdict(list)
+        for index, (_, labels) in enumerate(items):
+            groups[labels].append(index)
+
+        results: List[Dict[str, float]] = [{} for _ in items]
+
+        if getattr(self.analyzer, 'zero_shot_mode', 'nli') == 'embedding':
+            from src.ai.embedding_zero_shot import embedding_zero_shot
+
+            for labels, indices in groups.items():
+                outputs = embedding_zero_shot.classify([items[i][0] for i in indices], list(labels))
+                for i, output in zip(indices, outputs):
+                    results[i] = output
+            return results
+
+        from src.ai.model_registry import model_registry
+
+        classifier = model_registry.get(self.analyzer.zero_shot_model_name)
+        for labels, indices in groups.items():
+            texts = [items[i][0] for i in indices]
+            outputs = classifier(
+                texts, list(labels), multi_label=True,
+                batch_size=min(64, len(labels) * len(texts))
+            )
+            if isinstance(outputs, dict):
+                outputs = [outputs]
+            for i, output in zip(indices, outputs):
+                results[i] = dict(zip(output['labels'], output['scores']))
+
+        return results
+
+    def _wait_all(self, futures: List[Any]) -> List[Any]:
+        deadline = time.monotonic() + self.timeout
+        return [f.result(timeout=max(0.0, deadline - time.monotonic())) for f in futures]
+
+    def handle_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Dispatch one client request
+
+        Args:
+            request: Decoded request message
+
+        Returns:
+            Response message
+        """
+        op = request.get('op')
+        try:
+            if op == 'sentiment':
+                futures = [self.sentiment_batcher.submit(text) for text in request['texts']]
+                return {"ok": True, "results": self._wait_all(futures)}
+
+            if op == 'zero_shot':
+                labels = tuple(request['labels'])
+                future = self.zero_shot_batcher.submit((request['text'], labels))
+                return {"ok": True, "results": self._wait_all([future])[0]}
+
+            if op == 'info':
+                return {"ok": True, "results": {
+                    "model_name": self.analyzer.model_name,
+                    "model_version": self.analyzer.model_version,
+                    "max_length": self.analyzer.max_length
+                }}
+
+            if op == 'stats':
+                return {"ok": True, "results": self.get_stats()}
+
+            return {"ok": False, "error": f"Unknown operation: {op}"}
+
+        except Full:
+            return {"ok": False, "busy": True, "error": "Model server queue is full"}
+        except Exception as e:
+            logger.error(f"Model server request failed ({op}): {e}")
+            return {"ok": False, "error": str(e)}
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Queue depth and batch-size metrics for each model"""
+        return {
+            "uptime_seconds": round(time.time() - self.started_at, 1),
+            "sentiment": self.sentiment_batcher.get_stats(),
+            "zero_shot": self.zero_shot_batcher.get_stats()
+        }
+
+    def serve_forever(self):
+        """Listen on the Unix socket until interrupted"""
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+
+        server = self
+
+        class _Handler(socketserver.BaseRequestHandler):
+            def handle(self):
+                while True:
+                    try:
+                        request = recv_message(self.request)
+                    except (ConnectionError, struct.error, ValueError):
+                        return
+                    send_message(self.request, server.handle_request(request))
+
+        class _Server(socketserver.ThreadingUnixStreamServer):
+            daemon_threads = True
+
+        with _Server(self.socket_path, _Handler) as unix_server:
+            logger.info(f"Model server listening on {self.socket_path}")
+            try:
+                unix_server.serve_forever()
+            finally:
+                if os.path.exists(self.socket_path):
+                    os.unlink(self.socket_path)
+
+
+class ModelServerClient:
+    """Client used by SentimentAnalyzer when MODEL_SERVER_SOCKET is configured"""
+
+    def __init__(self, socket_path: str, timeout: Optional[float] = None, retries: int = 3):
+        """
+        Args:
+            socket_path: Model server Unix socket
+            timeout: Socket timeout in seconds
+            retries: Attempts when the server reports it is busy
+        """
+        self.socket_path = socket_path
+        self.timeout = timeout or settings.MODEL_SERVER_TIMEOUT
+        self.retries = max(1, retries)
+
+    def _request(self, payload: Dict[str, Any]) -> Any:
+        """Send a request, backing off while the server is busy"""
+        for attempt in range(self.retries):
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+                sock.settimeout(self.timeout)
+                sock.connect(self.socket_path)
+                send_message(sock, payload)
+                response = recv_message(sock)
+
+            if response.get('ok'):
+                return response['results']
+            if not response.get('busy'):
+                raise RuntimeError(response.get('error', 'Model server error'))
+
+            time.sleep(0.05 * (2 ** attempt))
+
+        raise ModelServerBusy("Model server queue is full")
+
+    def sentiment(self, texts: List[str], batch_size: Optional[int] = None,
+                  truncation: bool = True) -> List[Dict[str, Any]]:
+        """Pipeline-compatible sentiment call (batch_size/truncation are handled server-side)"""
+        return self._request({"op": "sentiment", "texts": list(texts)})
+
+    def zero_shot(self, text: str, labels: List[str]) -> Dict[str, float]:
+        """Score labels against text; returns label -> probability"""
+        return self._request({"op": "zero_shot", "text": text, "labels": list(labels)})
+
+    def info(self) -> Dict[str, Any]:
+        """Model name and version served"""
+        return self._request({"op": "info"})
+
+    def stats(self) -> Dict[str, Any]:
+        """Server queue and batch metrics"""
+        return self._request({"op": "stats"})
+
+
+if __name__ == "__main__":
+    ModelServer().serve_forever()
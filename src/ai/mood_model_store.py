@@ -0,0 +1,220 @@
+"""
+Per-user Mood Model Store
+Versioned on-disk storage of trained mood models with a bounded in-memory LRU
+"""
+
+import os
+import re
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import joblib
+
+from src.config import settings, MODELS_DIR
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+_VERSION_RE = re.compile(r"^v(\d+)\.joblib$")
+
+
+class MoodModelStore:
+    """Model artifacts keyed by user ID, one directory of versions per user"""
+
+    def __init__(self, store_dir: Optional[Path] = None, max_cached: Optional[int] = None,
+                 keep_versions: Optional[int] = None):
+        """
+        Args:
+            store_dir: Root directory (MODELS_DIR/mood by default)
+            max_cached: Artifacts kept in memory (least recently used are dropped)
+            keep_versions: Versions kept on disk per user (older ones are deleted)
+        """
+        self.store_dir = Path(store_dir or MODELS_DIR / "mood")
+        self.store_dir.mkdir(parents=True, exist_ok=True)
+        self.max_cached = max_cached or settings.MOOD_MODEL_CACHE_SIZE
+        self.keep_versions = keep_versions or settings.MOOD_MODEL_KEEP_VERSIONS
+        self._cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._latest: Dict[str, Tuple[int, Optional[int]]] = {}  # uid -> (directory mtime_ns, latest version)
+        self._lock = threading.RLock()
+        self._hits = 0
+        self._misses = 0
+
+    def _user_dir(self, uid: str) -> Path:
+        """Directory holding a user's model versions"""
+        return self.store_dir / re.sub(r'[^A-Za-z0-9_-]', '_', uid)
+
+    def versions(self, uid: str) -> List[int]:
+        """
+        List stored versions for a user
+
+        Args:
+            uid: User ID
+
+        Returns:
+            Version numbers, oldest first
+        """
+        user_dir = self._user_dir(uid)
+        if not user_dir.exists():
+            return []
+        found = (_VERSION_RE.match(path.name) for path in user_dir.iterdir())
+        return sorted(int(match.group(1)) for match in found if match)
+
+    def latest_version(self, uid: str) -> Optional[int]:
+        """
+        Get a user's latest stored version
+
+        The listing is cached until the user's directory changes (publishing
+        or pruning a version in any process updates its mtime), so repeated
+        lookups cost one stat instead of a directory scan.
+
+        Args:
+            uid: User ID
+
+        Returns:
+            Latest version number or None if the user has no stored model
+        """
+        with self._lock:
+            try:
+                mtime = self._user_dir(uid).stat().st_mtime_ns
+            except FileNotFoundError:
+                self._latest.pop(uid, None)
+                return None
+
+            cached = self._latest.get(uid)
+            if cached is not None and cached[0] == mtime:
+                return cached[1]
+
+            # Listed after the stat, so a change in between only causes one extra listing later
+            versions = self.versions(uid)
+            latest = versions[-1] if versions else None
+            self._latest[uid] = (mtime, latest)
+            return latest
+
+    def _path(self, uid: str, version: int) -> Path:
+        return self._user_dir(uid) / f"v{version:06d}.joblib"
+
+    def _cache_put(self, uid: str, artifact: Dict[str, Any]):
+        self._cache[uid] = artifact
+        self._cache.move_to_end(uid)
+        while len(self._cache) > self.max_cached:
+            self._cache.popitem(last=False)
+
+    def get(self, uid: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the latest model artifact for a user
+
+        The cached artifact is only returned while it is still the latest
+        version on disk, so models saved by other processes (training
+        workers, the nightly job) are picked up. A version pruned by another
+        process between listing and loading is retried with the newer one.
+
+        Args:
+            uid: User ID
+
+        Returns:
+            Artifact dict or None if the user has no trained model
+        """
+        with self._lock:
+            latest = self.latest_version(uid)
+            artifact = self._cache.get(uid)
+            if artifact is not None and latest is not None and artifact.get('version') == latest:
+                self._cache.move_to_end(uid)
+                self._hits += 1
+                return artifact
+            self._misses += 1
+
+            for _ in range(3):
+                if latest is None:
+                    self._cache.pop(uid, None)
+                    return None
+
+                try:
+                    artifact = joblib.load(self._path(uid, latest))
+                except FileNotFoundError:
+                    # A newer save elsewhere pruned this version after it was listed
+                    self._latest.pop(uid, None)
+                    latest = self.latest_version(uid)
+                    continue
+                except Exception as e:
+                    logger.warning(f"Could not load mood model for {uid}: {e}")
+                    return None
+
+                self._cache_put(uid, artifact)
+                return artifact
+
+            logger.warning(f"Could not load mood model for {uid}: versions kept being pruned")
+            return None
+
+    def save(self, uid: str, artifact: Dict[str, Any]) -> int:
+        """
+        Store a new model version for a user
+
+        The version file is published with os.link, which fails if the file
+        exists (like O_EXCL), so concurrent savers in other processes never
+        share or overwrite a version, and readers never see a partial file.
+
+        Args:
+            uid: User ID
+            artifact: Model artifact (model, scaler and training metadata)
+
+        Returns:
+            New version number
+        """
+        with self._lock:
+            user_dir = self._user_dir(uid)
+            user_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = user_dir / f".{os.getpid()}.{threading.get_ident()}.tmp"
+
+            try:
+                while True:
+                    versions = self.versions(uid)
+                    version = versions[-1] + 1 if versions else 1
+                    stored = {**artifact, 'version': version}
+                    joblib.dump(stored, tmp_path)
+                    try:
+                        os.link(tmp_path, self._path(uid, version))
+                        break
+                    except FileExistsError:
+                        # Another process took this version; allocate the next one
+                        continue
+            finally:
+                try:
+                    tmp_path.unlink()
+                except OSError:
+                    pass
+
+            self._cache_put(uid, stored)
+
+            # Keep the most recent versions for rollback
+            for old in self.versions(uid)[:-self.keep_versions]:
+                try:
+                    self._path(uid, old).unlink()
+                except OSError:
+                    pass
+
+            # The next lookup lists the directory again
+            self._latest.pop(uid, None)
+
+            return version
+
+    def evict(self, uid: str):
+        """Drop a user's model from memory (it stays on disk)"""
+        with self._lock:
+            self._cache.pop(uid, None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics"""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                'cached_models': len(self._cache),
+                'hits': self._hits,
+                'misses': self._misses,
+                'hit_rate': round(self._hits / lookups, 3) if lookups else 0.0
+            }
+
+
+# Singleton instance
+mood_model_store = MoodModelStore()
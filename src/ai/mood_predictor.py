@@ -5,54 +5,177 @@ Predicts future mood trends using Scikit-learn
 
 import numpy as np
 import pandas as pd
-from sklearn.ensemble import RandomForestRegressor, GradientBoostingRegressor
-from sklearn.preprocessing import StandardScaler
-from sklearn.model_selection import train_test_split
 from typing import List, Dict, Any, Optional, Tuple
-import joblib
+import time
 from datetime import datetime, timedelta
-import logging
 
-from src.config import settings, MODELS_DIR
+from src.config import settings
+from src.ai.lazy import LazyModel
+from src.ai.mood_model_store import mood_model_store, MoodModelStore
+from src.ai.feature_store import build_feature_state, latest_features
+from src.ai.forecast_models import select_model
+from src.ai.streaming_stats import StreamingMoodStats
+from src.ai.forecast_cache import forecast_cache, make_forecast_key, ForecastCache
+from src.ai.drift_monitor import drift_monitor, DriftMonitor
+from src.ai.training_scheduler import training_scheduler, TrainingScheduler
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Model inputs produced by prepare_features / prepare_features_batch
+FEATURE_COLUMNS = [
+    'day_of_week', 'day_of_month', 'month', 'hour',
+    'mood_rolling_mean_3', 'mood_rolling_std_3', 'mood_rolling_mean_7',
+    'mood_lag_1', 'mood_lag_2', 'mood_lag_7', 'mood_trend'
+]
+
+# Entries needed before a model is fitted
+MIN_TRAINING_ENTRIES = 14
+
+# Per-day decay of the recent trend in the baseline forecast
+BASELINE_DECAY = 0.8
+
+# Extra inputs of the direct multi-horizon model: steps ahead and the target's weekday
+HORIZON_COLUMNS = ['horizon', 'target_day_of_week']
+
+# Store key of the cross-user model (see src.ai.pooled_mood_model)
+POOLED_MODEL_KEY = "__pooled__"
+
+# Position of target_day_of_week in model input rows
+TARGET_WEEKDAY_COLUMN = len(FEATURE_COLUMNS) + HORIZON_COLUMNS.index('target_day_of_week')
+
+
+def add_horizon_features(X_base: np.ndarray, steps: np.ndarray, horizons: np.ndarray) -> np.ndarray:
+    """
+    Append HORIZON_COLUMNS to origin feature rows
+    
+    Args:
+        X_base: FEATURE_COLUMNS rows of the origin entries
+        steps: Calendar days between origin and target
+        horizons: Horizon fed to the model (steps capped at the trained maximum)
+        
+    Returns:
+        Model input rows
+    """
+    day_of_week = X_base[:, FEATURE_COLUMNS.index('day_of_week')]
+    target_day_of_week = (day_of_week + steps) % 7
+    return np.column_stack([X_base, horizons, target_day_of_week])
+
+
+def build_training_rows(df: pd.DataFrame, horizons: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    One row per (origin entry, later entry within the horizon): features at
+    the origin, target at the later entry, horizon = calendar days between them
+    
+    Horizons are counted in days, not entries, so skipped days and several
+    entries on one day still line up with the daily forecast.
+    
+    Args:
+        df: One user's output of prepare_features / prepare_features_batch
+        horizons: Maximum days ahead
+        
+    Returns:
+        Model input rows, targets and the position of each row's target entry
+        (rows with missing values are dropped)
+    """
+    X_base = df[FEATURE_COLUMNS].values
+    scores = df['mood_score'].values
+    days = np.array([d.toordinal() for d in df['date'].dt.date])
+    
+    X_parts, y_parts, target_parts = [], [], []
+    for k in range(1, len(df)):
+        # Pair each entry with the one k entries later (dates are sorted, so gaps grow with k)
+        steps = days[k:] - days[:-k]
+        if steps.min() > horizons:
+            break
+        origin = np.flatnonzero((steps >= 1) & (steps <= horizons))
+        X_parts.append(add_horizon_features(X_base[origin], steps[origin], steps[origin]))
+        y_parts.append(scores[origin + k])
+        target_parts.append(origin + k)
+    
+    if not X_parts:
+        return np.empty((0, len(FEATURE_COLUMNS) + len(HORIZON_COLUMNS))), np.empty(0), np.empty(0, dtype=int)
+    
+    X = np.vstack(X_parts).astype(float)
+    y = np.concatenate(y_parts).astype(float)
+    target_index = np.concatenate(target_parts)
+    
+    # Remove NaN values
+    mask = ~np.isnan(X).any(axis=1) & ~np.isnan(y)
+    return X[mask], y[mask], target_index[mask]
+
+
+def fit_mood_model(df: pd.DataFrame, horizons: int,
+                   candidates: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+    """
+    Fit a direct multi-horizon model on prepared features
+    
+    Horizon is an input feature, so one model forecasts every day ahead
+    from the latest entry without feeding predictions back in. The model
+    comes from the forecast_models ladder (closed-form ridge for short
+    histories, gradient boosting added for long ones). Top-level so it can
+    run in a training worker process.
+    
+    Args:
+        df: Output of prepare_features
+        horizons: Maximum days ahead
+        candidates: Unfitted models to choose from (defaults to the ladder)
+        
+    Returns:
+        Model artifact or None if there is not enough data
+    """
+    start = time.monotonic()
+    
+    if len(df) < MIN_TRAINING_ENTRIES:
+        logger.warning("Insufficient data for training")
+        return None
+    
+    X, y, target_index = build_training_rows(df, horizons)
+    
+    if len(X) < 10:
+        logger.warning("Not enough clean data for training")
+        return None
+    
+    model_name, model, backtest_mae = select_model(
+        X, y, target_index, len(df), TARGET_WEEKDAY_COLUMN, candidates
+    )
+    
+    logger.info(f"Model {model_name} trained successfully with {len(X)} samples")
+    
+    return {
+        'model': model,
+        'scaler': None,  # ladder models handle their own scaling
+        'model_name': model_name,
+        'backtest_mae': backtest_mae,
+        'n_samples': len(X),
+        'horizons': horizons,
+        'trained_through': df['date'].iloc[-1],
+        'trained_at': datetime.utcnow().isoformat(),
+        'fit_seconds': round(time.monotonic() - start, 3)
+    }
+
 
 class MoodPredictor:
     """ML-based mood forecasting"""
     
-    def __init__(self):
-        self.model = None
-        self.scaler = StandardScaler()
+    def __init__(self, store: Optional[MoodModelStore] = None,
+                 scheduler: Optional[TrainingScheduler] = None,
+                 cache: Optional[ForecastCache] = None,
+                 monitor: Optional[DriftMonitor] = None):
+        """
+        Args:
+            store: Per-user model store (defaults to the shared one)
+            scheduler: Background training scheduler (defaults to the shared one)
+            cache: Forecast cache (defaults to the shared one when ENABLE_FORECAST_CACHE is set)
+            monitor: Forecast drift monitor (defaults to the shared one)
+        """
         self.lookback_days = settings.MOOD_PREDICTION_LOOKBACK_DAYS
         self.forecast_days = settings.MOOD_PREDICTION_FORECAST_DAYS
-        self.model_path = MODELS_DIR / "mood_predictor.joblib"
-        self.scaler_path = MODELS_DIR / "mood_scaler.joblib"
-        
-        # Try to load existing model
-        self._load_model()
-    
-    def _load_model(self):
-        """Load pre-trained model if exists"""
-        try:
-            if self.model_path.exists():
-                self.model = joblib.load(self.model_path)
-                self.scaler = joblib.load(self.scaler_path)
-                logger.info("Loaded existing mood prediction model")
-            else:
-                logger.info("No existing model found, will train on first use")
-        except Exception as e:
-            logger.warning(f"Could not load model: {e}")
-    
-    def _save_model(self):
-        """Save trained model"""
-        try:
-            joblib.dump(self.model, self.model_path)
-            joblib.dump(self.scaler, self.scaler_path)
-            logger.info("Mood prediction model saved")
-        except Exception as e:
-            logger.error(f"Failed to save model: {e}")
+        self.store = store or mood_model_store
+        self.scheduler = scheduler or training_scheduler
+        self.retrain_min_new_entries = settings.MOOD_RETRAIN_MIN_NEW_ENTRIES
+        self.cache = cache or (forecast_cache if settings.ENABLE_FORECAST_CACHE else None)
+        self.monitor = monitor or drift_monitor
     
     def prepare_features(self, mood_history: List[Dict[str, Any]]) -> Optional[pd.DataFrame]:
         """
@@ -109,136 +232,563 @@ class MoodPredictor:
             logger.error(f"Feature preparation failed: {e}")
             return None
     
-    def train_model(self, mood_history: List[Dict[str, Any]]) -> bool:
+    def prepare_features_batch(self, entries: Any, user_col: str = 'user_id') -> Optional[pd.DataFrame]:
         """
-        Train mood prediction model
+        Prepare features for many users in one vectorized pass
+        
+        Produces the same features as prepare_features, computed per user with
+        groupby rolling windows and shifts instead of one DataFrame per user.
         
         Args:
-            mood_history: Historical mood data
+            entries: Long-format mood entries (DataFrame or list of dicts) with
+                user_col, created_at and mood_score
+            user_col: Column identifying the user
             
         Returns:
-            Success status
+            DataFrame sorted by user and date (users with under a week of data
+            are dropped), or None
         """
         try:
-            df = self.prepare_features(mood_history)
+            df = pd.DataFrame(entries)
             
-            if df is None or len(df) < 14:
-                logger.warning("Insufficient data for training")
-                return False
+            if df.empty or not {user_col, 'created_at', 'mood_score'}.issubset(df.columns):
+                return None
+            
+            df['date'] = pd.to_datetime(df['created_at'])
+            df = df.sort_values([user_col, 'date'], kind='mergesort').reset_index(drop=True)
+            
+            # Need at least a week of data per user
+            counts = df.groupby(user_col, sort=False)[user_col].transform('size')
+            df = df[counts >= 7].reset_index(drop=True)
+            if df.empty:
+                return None
             
-            # Select features
-            feature_cols = [
-                'day_of_week', 'day_of_month', 'month', 'hour',
-                'mood_rolling_mean_3', 'mood_rolling_std_3', 'mood_rolling_mean_7',
-                'mood_lag_1', 'mood_lag_2', 'mood_lag_7', 'mood_trend'
-            ]
+            # Calendar features
+            df['day_of_week'] = df['date'].dt.dayofweek
+            df['day_of_month'] = df['date'].dt.day
+            df['month'] = df['date'].dt.month
+            df['hour'] = df['date'].dt.hour
             
-            X = df[feature_cols].values
-            y = df['mood_score'].values
+            scores = df.groupby(user_col, sort=False)['mood_score']
             
-            # Remove NaN values
-            mask = ~np.isnan(X).any(axis=1) & ~np.isnan(y)
-            X = X[mask]
-            y = y[mask]
+            rolling_3 = scores.rolling(window=3, min_periods=1)
+            rolling_7 = scores.rolling(window=7, min_periods=1)
             
-            if len(X) < 10:
-                logger.warning("Not enough clean data for training")
-                return False
+            # Rolling statistics (groupby-rolling prepends the user to the index; drop it to realign)
+            df['mood_rolling_mean_3'] = rolling_3.mean().droplevel(0)
+            df['mood_rolling_std_3'] = rolling_3.std().droplevel(0).fillna(0)
+            df['mood_rolling_mean_7'] = rolling_7.mean().droplevel(0)
             
-            # Scale features
-            X_scaled = self.scaler.fit_transform(X)
+            # Lag features (gaps filled with the user's mean)
+            user_mean = scores.transform('mean')
+            df['mood_lag_1'] = scores.shift(1).fillna(user_mean)
+            df['mood_lag_2'] = scores.shift(2).fillna(user_mean)
+            df['mood_lag_7'] = scores.shift(7).fillna(user_mean)
             
-            # Train model (using Gradient Boosting for better performance)
-            self.model = GradientBoostingRegressor(
-                n_estimators=100,
-                learning_rate=0.1,
-                max_depth=3,
-                random_state=42
-            )
+            # Trend
+            df['mood_trend'] = scores.diff().fillna(0)
+            
+            return df
+            
+        except Exception as e:
+            logger.error(f"Batch feature preparation failed: {e}")
+            return None
+    
+    def get_feature_matrices(self, features: pd.DataFrame, user_col: str = 'user_id',
+                             pooled: bool = False, horizons: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Split batch features into multi-horizon training matrices
+        
+        Rows come from build_training_rows for each user, so every target is a
+        later entry of the same user (never the origin's own score).
+        
+        Args:
+            features: Output of prepare_features_batch
+            user_col: Column identifying the user
+            pooled: Return one matrix for all users instead of one per user
+            horizons: Maximum days ahead (defaults to the forecast horizon)
+            
+        Returns:
+            {uid: (X, y)} per user (users without rows are left out), or
+            {"X", "y", "groups"} when pooled
+        """
+        horizons = horizons or self.forecast_days
+        
+        matrices = {}
+        for uid, group in features.groupby(user_col, sort=False):
+            X, y, _ = build_training_rows(group, horizons)
+            if len(y):
+                matrices[uid] = (X, y)
+        
+        if pooled:
+            if not matrices:
+                return {
+                    "X": np.empty((0, len(FEATURE_COLUMNS) + len(HORIZON_COLUMNS))),
+                    "y": np.empty(0),
+                    "groups": np.empty(0, dtype=object)
+                }
+            return {
+                "X": np.vstack([X for X, _ in matrices.values()]),
+                "y": np.concatenate([y for _, y in matrices.values()]),
+                "groups": np.concatenate([np.full(len(y), uid, dtype=object) for uid, (_, y) in matrices.items()])
+            }
+        
+        return matrices
+    
+    def train_models_batch(self, entries: Any, user_col: str = 'user_id') -> Dict[str, bool]:
+        """
+        Train and store a model for every user in a long-format frame
+        
+        Args:
+            entries: Long-format mood entries for many users (each user's full
+                history; its size is recorded as the model's trained_count)
+            user_col: Column identifying the user
+            
+        Returns:
+            Mapping of user ID to training success
+        """
+        features = self.prepare_features_batch(entries, user_col)
+        if features is None:
+            return {}
+        
+        results = {}
+        for uid, df in features.groupby(user_col, sort=False):
+            try:
+                artifact = self._fit(df)
+                self._install_model(uid, artifact, len(df))
+                results[uid] = artifact is not None
+            except Exception as e:
+                logger.error(f"Model training failed for {uid}: {e}")
+                results[uid] = False
+        
+        logger.info(f"Trained {sum(results.values())}/{len(results)} user mood models")
+        return results
+    
+    def _fit(self, df: pd.DataFrame) -> Optional[Dict[str, Any]]:
+        """Fit a model for this predictor's forecast horizon (see fit_mood_model)"""
+        return fit_mood_model(df, self.forecast_days)
+    
+    def train_model(self, mood_history: List[Dict[str, Any]], uid: Optional[str] = None) -> bool:
+        """
+        Train mood prediction model
+        
+        Args:
+            mood_history: Historical mood data (its size is recorded as the model's trained_count)
+            uid: User ID the model is stored under (not stored if omitted)
             
-            self.model.fit(X_scaled, y)
+        Returns:
+            Success status
+        """
+        try:
+            df = self.prepare_features(mood_history)
             
-            # Save model
-            self._save_model()
+            if df is None:
+                logger.warning("Insufficient data for training")
+                return False
+            
+            artifact = self._fit(df)
+            if artifact is None:
+                return False
+            
+            if uid:
+                self._install_model(uid, artifact, len(mood_history))
             
-            logger.info(f"Model trained successfully with {len(X)} samples")
             return True
             
         except Exception as e:
             logger.error(f"Model training failed: {e}")
             return False
     
+    def _retrain_reason(self, uid: Optional[str], artifact: Dict[str, Any], new_entries: int) -> Optional[str]:
+        """
+        Check if a model should be retrained
+        
+        Args:
+            uid: User ID (None = only the volume trigger applies)
+            artifact: Current model artifact
+            new_entries: Entries logged since the model was trained
+            
+        Returns:
+            "drift" (recent forecasts missed), "volume" (enough new entries) or None
+        """
+        if not uid:
+            return "volume" if new_entries >= self.retrain_min_new_entries else None
+        return self.monitor.retrain_reason(uid, artifact, new_entries, self.retrain_min_new_entries)
+    
+    def _get_model(self, df: pd.DataFrame, uid: Optional[str],
+                   feature_state: Optional[Dict[str, Any]] = None,
+                   train_inline: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        Get the user's model, scheduling a background fit when it is missing or stale
+        
+        Args:
+            df: Output of prepare_features
+            uid: User ID (a throwaway model is fitted inline if omitted)
+            feature_state: User's incremental feature state, if known
+            train_inline: Fit in this thread instead of the scheduler (batch jobs)
+            
+        Returns:
+            Last good model artifact, or None until the first fit completes
+        """
+        artifact = self.store.get(uid) if uid else None
+        if artifact is not None and 'horizons' not in artifact:
+            artifact = None  # trained by the old recursive forecaster
+        
+        reason = None
+        if artifact is not None:
+            new_entries = int((df['date'] > artifact['trained_through']).sum())
+            reason = self._retrain_reason(uid, artifact, new_entries)
+            if reason is None:
+                return artifact
+        
+        if len(df) < MIN_TRAINING_ENTRIES:
+            return artifact
+        
+        trained_count = feature_state['count'] if feature_state else None
+        
+        if not uid:
+            return self._fit(df)
+        
+        if train_inline:
+            if reason:
+                self.monitor.record_retrain(uid, reason)
+            fitted = self._fit(df)
+            self._install_model(uid, fitted, trained_count)
+            return fitted or artifact
+        
+        # Keep serving the last good model while the new one trains
+        scheduled = self.scheduler.schedule(
+            uid, fit_mood_model, df, self.forecast_days,
+            on_complete=lambda key, fitted: self._install_model(key, fitted, trained_count)
+        )
+        if scheduled and reason:
+            self.monitor.record_retrain(uid, reason)
+        return artifact
+    
+    def _install_model(self, uid: str, fitted: Optional[Dict[str, Any]], trained_count: Optional[int]):
+        """Store a fitted model with the entry count it saw (the swap is atomic for readers)"""
+        if fitted is None:
+            return
+        if trained_count is not None:
+            fitted['trained_count'] = trained_count
+        fitted['version'] = self.store.save(uid, fitted)
+        logger.info(f"Trained mood model v{fitted['version']} for {uid} in {fitted['fit_seconds']}s")
+    
+    def _get_cached_model(self, uid: Optional[str],
+                          feature_state: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Stored model that is still fresh according to the feature state (no history needed)"""
+        if not uid or not feature_state:
+            return None
+        
+        artifact = self.store.get(uid)
+        if artifact is None or 'horizons' not in artifact or 'trained_count' not in artifact:
+            return None
+        
+        if self._retrain_reason(uid, artifact, feature_state['count'] - artifact['trained_count']):
+            return None
+        
+        return artifact
+    
+    def _forecast(self, artifact: Dict[str, Any], last_features: np.ndarray,
+                  last_date: datetime, days_ahead: int, baseline: bool = False) -> Dict[str, Any]:
+        """
+        Predict all N days in one call from the latest entry's features
+        
+        Args:
+            artifact: Model artifact
+            last_features: FEATURE_COLUMNS values of the latest entry
+            last_date: Timestamp of the latest entry
+            days_ahead: Number of days to forecast
+            baseline: The model is a stand-in for the user's own (pooled model)
+            
+        Returns:
+            Predictions
+        """
+        steps = np.arange(1, days_ahead + 1)
+        horizons = np.minimum(steps, artifact['horizons'])  # beyond the trained range, reuse the last horizon
+        X_pred = add_horizon_features(np.tile(last_features, (days_ahead, 1)), steps, horizons)
+        
+        # Models fitted before the ladder expect scaled inputs
+        if artifact.get('scaler') is not None:
+            X_pred = artifact['scaler'].transform(X_pred)
+        
+        # Clip to valid range
+        predicted_moods = np.clip(artifact['model'].predict(X_pred), 1, 10)
+        
+        return self._format_forecast(predicted_moods, last_date, artifact.get('version'), baseline=baseline)
+    
+    def _pooled_forecast(self, feature_state: Dict[str, Any], days_ahead: int) -> Optional[Dict[str, Any]]:
+        """
+        Forecast from the pooled model and the user's running features
+        
+        Args:
+            feature_state: User's incremental feature state
+            days_ahead: Number of days to forecast
+            
+        Returns:
+            Predictions, or None without a pooled model or entries
+        """
+        pooled = self.store.get(POOLED_MODEL_KEY)
+        features = latest_features(feature_state)
+        if pooled is None or features is None:
+            return None
+        
+        last_features = np.array([features[col] for col in FEATURE_COLUMNS], dtype=float)
+        return self._forecast(pooled, last_features, feature_state['last_created_at'], days_ahead, baseline=True)
+    
+    def has_pooled_model(self) -> bool:
+        """Check if a pooled model is available for new users"""
+        return self.store.get(POOLED_MODEL_KEY) is not None
+    
+    def _baseline_forecast(self, scores: np.ndarray, last_date: datetime, days_ahead: int) -> Dict[str, Any]:
+        """
+        Cheap forecast used until the user's first model is trained
+        
+        The recent weekly average decays toward the user's overall average.
+        
+        Args:
+            scores: Mood scores, oldest first
+            last_date: Timestamp of the latest entry
+            days_ahead: Number of days to forecast
+            
+        Returns:
+            Predictions
+        """
+        recent_avg = float(np.mean(scores[-7:]))
+        overall_avg = float(np.mean(scores))
+        steps = np.arange(1, days_ahead + 1)
+        predicted_moods = np.clip(overall_avg + (recent_avg - overall_avg) * BASELINE_DECAY ** steps, 1, 10)
+        
+        return self._format_forecast(predicted_moods, last_date, None, baseline=True)
+    
+    def _format_forecast(self, predicted_moods: np.ndarray, last_date: datetime,
+                         model_version: Optional[int], baseline: bool = False) -> Dict[str, Any]:
+        """Build the forecast result for consecutive days after last_date"""
+        predictions = []
+        for step, predicted_mood in enumerate(predicted_moods, start=1):
+            # Calculate prediction date
+            pred_date = last_date + timedelta(days=step)
+            
+            predictions.append({
+                "date": pred_date.strftime("%Y-%m-%d"),
+                "predicted_mood": round(float(predicted_mood), 2),
+                "mood_label": self._get_mood_label(int(predicted_mood))
+            })
+        
+        logger.info(f"Generated {len(predictions)} day mood forecast")
+        
+        return {
+            "success": True,
+            "predictions": predictions,
+            "forecast_days": len(predictions),
+            "model_version": model_version,
+            "baseline": baseline,
+            "generated_at": datetime.utcnow().isoformat()
+        }
+    
+    def record_entry(self, uid: str, mood_score: float, created_at: datetime):
+        """
+        Update forecast state after the user logs a mood entry
+        
+        Scores the pending forecast for that day and drops cached forecasts,
+        which no longer include the latest entry.
+        
+        Args:
+            uid: User ID
+            mood_score: Logged score
+            created_at: Timestamp of the entry
+        """
+        self.monitor.record_actual(uid, mood_score, created_at)
+        if self.cache is not None:
+            self.cache.invalidate(uid)
+    
     def predict_mood(self, mood_history: List[Dict[str, Any]], 
-                    days_ahead: int = 7) -> Optional[Dict[str, Any]]:
+                    days_ahead: int = 7, uid: Optional[str] = None,
+                    feature_state: Optional[Dict[str, Any]] = None,
+                    train_inline: bool = False) -> Optional[Dict[str, Any]]:
         """
         Predict future mood trends
         
+        When the user's feature state is given and their stored model is fresh,
+        the forecast is made from the stored features without touching the history.
+        Forecasts for known users are cached until they log a new entry or a new
+        model is trained.
+        
         Args:
-            mood_history: Historical mood data
+            mood_history: Historical mood data (used to train and as a fallback)
             days_ahead: Number of days to forecast
+            uid: User ID whose model is used (trained in the background on first use;
+                a baseline or pooled-model forecast is returned until it is ready)
+            feature_state: User's incremental feature state (see src.ai.feature_store)
+            train_inline: Fit a missing or stale model before forecasting (batch jobs)
             
         Returns:
             Predictions or None
         """
+        cache_key = None
+        if self.cache is not None and uid and not train_inline:
+            cache_key = self._forecast_cache_key(uid, mood_history, days_ahead, feature_state)
+            cached = self.cache.get(uid, cache_key) if cache_key else None
+            if cached is not None:
+                return cached
+        
+        result = self._predict_mood(mood_history, days_ahead, uid, feature_state, train_inline)
+        
+        # Scored against the moods the user logs next (see src.ai.drift_monitor)
+        if uid and result:
+            self.monitor.record_forecast(uid, result)
+        
+        if cache_key and result and result.get('success'):
+            self.cache.set(uid, cache_key, result)
+        
+        return result
+    
+    def _forecast_cache_key(self, uid: str, mood_history: List[Dict[str, Any]], days_ahead: int,
+                            feature_state: Optional[Dict[str, Any]] = None) -> Optional[str]:
+        """Cache key of the forecast predict_mood would make now (None if unknown)"""
+        try:
+            if feature_state and feature_state.get('last_created_at') is not None:
+                latest = feature_state['last_created_at']
+            else:
+                latest = max((e['created_at'] for e in mood_history if e.get('created_at') is not None), default=None)
+            if latest is None:
+                return None
+            
+            # A newly trained model (personal or pooled) changes the key
+            artifact = self.store.get(uid)
+            if artifact is not None and 'horizons' in artifact:
+                version = artifact.get('version')
+            else:
+                pooled = self.store.get(POOLED_MODEL_KEY)
+                version = f"pooled-{pooled.get('version')}" if pooled is not None else None
+            
+            return make_forecast_key(latest, days_ahead, version)
+            
+        except Exception as e:
+            logger.warning(f"Could not build forecast cache key for {uid}: {e}")
+            return None
+    
+    def _predict_mood(self, mood_history: List[Dict[str, Any]], days_ahead: int, uid: Optional[str],
+                      feature_state: Optional[Dict[str, Any]], train_inline: bool) -> Optional[Dict[str, Any]]:
+        """Compute a forecast (see predict_mood)"""
         try:
-            # Train or retrain model if needed
-            if self.model is None:
-                if not self.train_model(mood_history):
-                    return None
+            # Fast path: fresh model and stored features
+            artifact = self._get_cached_model(uid, feature_state)
+            features = latest_features(feature_state) if artifact is not None else None
+            if features is not None:
+                last_features = np.array([features[col] for col in FEATURE_COLUMNS], dtype=float)
+                return self._forecast(artifact, last_features, feature_state['last_created_at'], days_ahead)
             
             df = self.prepare_features(mood_history)
             
             if df is None:
-                return None
+                # Under a week of entries: only the pooled model can forecast
+                return self._pooled_forecast(feature_state or build_feature_state(mood_history), days_ahead)
             
-            # Get latest features
-            feature_cols = [
-                'day_of_week', 'day_of_month', 'month', 'hour',
-                'mood_rolling_mean_3', 'mood_rolling_std_3', 'mood_rolling_mean_7',
-                'mood_lag_1', 'mood_lag_2', 'mood_lag_7', 'mood_trend'
-            ]
-            
-            # Make predictions for next N days
-            predictions = []
-            last_date = df['date'].iloc[-1]
-            last_features = df[feature_cols].iloc[-1].values
-            
-            for i in range(days_ahead):
-                # Predict next day
-                X_pred = last_features.reshape(1, -1)
-                X_pred_scaled = self.scaler.transform(X_pred)
-                
-                predicted_mood = self.model.predict(X_pred_scaled)[0]
-                
-                # Clip to valid range
-                predicted_mood = np.clip(predicted_mood, 1, 10)
-                
-                # Calculate prediction date
-                pred_date = last_date + timedelta(days=i+1)
-                
-                predictions.append({
-                    "date": pred_date.strftime("%Y-%m-%d"),
-                    "predicted_mood": round(float(predicted_mood), 2),
-                    "mood_label": self._get_mood_label(int(predicted_mood))
-                })
-                
-                # Update features for next iteration (simplified)
-                # In a real scenario, you'd update all rolling features
-                last_features[7] = predicted_mood  # mood_lag_1
-            
-            logger.info(f"Generated {len(predictions)} day mood forecast")
+            last_features = df[FEATURE_COLUMNS].iloc[-1].values.astype(float)
             
-            return {
-                "success": True,
-                "predictions": predictions,
-                "forecast_days": days_ahead,
-                "generated_at": datetime.utcnow().isoformat()
-            }
+            # Train or retrain model if needed (in the background for known users)
+            artifact = self._get_model(df, uid, feature_state, train_inline)
+            if artifact is None:
+                pooled = self.store.get(POOLED_MODEL_KEY)
+                if pooled is not None:
+                    return self._forecast(pooled, last_features, df['date'].iloc[-1], days_ahead, baseline=True)
+                return self._baseline_forecast(df['mood_score'].values, df['date'].iloc[-1], days_ahead)
+            
+            return self._forecast(artifact, last_features, df['date'].iloc[-1], days_ahead)
             
         except Exception as e:
             logger.error(f"Mood prediction failed: {e}")
             return None
     
+    def to_forecast_document(self, forecast: Dict[str, Any], based_on_entry_at: datetime) -> Dict[str, Any]:
+        """
+        Prepare a forecast for storage
+        
+        Args:
+            forecast: Output of predict_mood
+            based_on_entry_at: Timestamp of the latest entry the forecast used
+            
+        Returns:
+            Forecast document
+        """
+        return {
+            'predictions': forecast['predictions'],
+            'model_version': forecast.get('model_version'),
+            'baseline': forecast.get('baseline', False),
+            'based_on_entry_at': based_on_entry_at,
+            'generated_at': forecast['generated_at']
+        }
+    
+    def from_forecast_document(self, document: Dict[str, Any],
+                               days_ahead: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Convert a stored forecast back to the predict_mood format
+        
+        Args:
+            document: Forecast document
+            days_ahead: Number of days to return (all if omitted)
+            
+        Returns:
+            Predictions
+        """
+        predictions = document['predictions'][:days_ahead]
+        return {
+            "success": True,
+            "predictions": predictions,
+            "forecast_days": len(predictions),
+            "model_version": document.get('model_version'),
+            "baseline": document.get('baseline', False),
+            "generated_at": document['generated_at']
+        }
+    
+    def is_forecast_stale(self, document: Optional[Dict[str, Any]], latest_entry_at: datetime,
+                          days_ahead: int = 7) -> bool:
+        """
+        Check if a stored forecast predates the user's latest entry
+        
+        Args:
+            document: Forecast document (None = missing)
+            latest_entry_at: Timestamp of the user's latest mood entry
+            days_ahead: Days the caller needs
+            
+        Returns:
+            True if the forecast must be recomputed
+        """
+        if not document or document.get('baseline'):
+            return True
+        if len(document.get('predictions', [])) < days_ahead:
+            return True
+        return document['based_on_entry_at'] < latest_entry_at
+    
+    def get_training_stats(self, uid: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Training queue and retrain metrics, plus model age, fit duration and
+        forecast error for a user
+        
+        Args:
+            uid: User ID (optional)
+            
+        Returns:
+            Metrics
+        """
+        stats = {**self.scheduler.get_stats(), **self.monitor.get_stats()}
+        
+        if uid:
+            artifact = self.store.get(uid)
+            stats['training'] = self.scheduler.is_pending(uid)
+            stats['model_version'] = artifact.get('version') if artifact else None
+            stats['model_age_seconds'] = (
+                round((datetime.utcnow() - datetime.fromisoformat(artifact['trained_at'])).total_seconds())
+                if artifact and artifact.get('trained_at') else None
+            )
+            stats['fit_seconds'] = artifact.get('fit_seconds') if artifact else None
+            stats['model_name'] = artifact.get('model_name') if artifact else None
+            stats['backtest_mae'] = artifact.get('backtest_mae') if artifact else None
+            stats['drift'] = self.monitor.get_user_stats(uid)
+        
+        return stats
+    
     def _get_mood_label(self, score: int) -> str:
         """Convert mood score to label"""
         if score >= 9:
@@ -266,37 +816,16 @@ class MoodPredictor:
             if not mood_history:
                 return {"success": False, "error": "No mood history"}
             
-            df = pd.DataFrame(mood_history)
+            # One pass over the entries, no DataFrame; entries without a score are skipped
+            stats = StreamingMoodStats()
+            for entry in mood_history:
+                if entry.get('mood_score') is not None:
+                    stats.update(entry['mood_score'])
             
-            if 'mood_score' not in df.columns:
+            if stats.count == 0:
                 return {"success": False, "error": "No mood scores found"}
             
-            mood_scores = df['mood_score'].values
-            
-            insights = {
-                "success": True,
-                "average_mood": round(float(np.mean(mood_scores)), 2),
-                "mood_std": round(float(np.std(mood_scores)), 2),
-                "min_mood": int(np.min(mood_scores)),
-                "max_mood": int(np.max(mood_scores)),
-                "median_mood": round(float(np.median(mood_scores)), 2),
-                "mood_volatility": "high" if np.std(mood_scores) > 2 else "moderate" if np.std(mood_scores) > 1 else "low",
-                "total_entries": len(mood_scores)
-            }
-            
-            # Trend analysis
-            if len(mood_scores) >= 7:
-                recent_avg = np.mean(mood_scores[-7:])
-                older_avg = np.mean(mood_scores[:-7]) if len(mood_scores) > 7 else recent_avg
-                
-                if recent_avg > older_avg + 0.5:
-                    insights["trend"] = "improving"
-                elif recent_avg < older_avg - 0.5:
-                    insights["trend"] = "declining"
-                else:
-                    insights["trend"] = "stable"
-            else:
-                insights["trend"] = "insufficient_data"
+            insights = stats.insights()
             
             logger.info("Generated mood insights")
             
@@ -307,5 +836,5 @@ class MoodPredictor:
             return {"success": False, "error": str(e)}
 
 
-# Singleton instance
-mood_predictor = MoodPredictor()
+# Singleton instance (loaded in the background, see src.ai.lazy)
+mood_predictor = LazyModel(MoodPredictor, name="mood_predictor")
@@ -0,0 +1,61 @@
+"""
+Mood Scale Mapping
+Converts sentiment labels and confidences to the 1-10 mood scale
+"""
+
+from typing import Any, Dict
+
+
+def get_mood_label(score: int) -> str:
+    """
+    Convert mood score to label
+    
+    Args:
+        score: Mood score (1-10)
+        
+    Returns:
+        Mood label
+    """
+    if score >= 9:
+        return 'excellent'
+    elif score >= 7:
+        return 'good'
+    elif score >= 5:
+        return 'okay'
+    elif score >= 3:
+        return 'low'
+    else:
+        return 'very_low'
+
+
+def build_sentiment_result(result: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Map a raw sentiment result to the mood scale
+    
+    Args:
+        result: Raw classifier output with label and score
+        
+    Returns:
+        Sentiment analysis results
+    """
+    label = result['label'].upper()
+    confidence = result['score']
+    
+    if label == 'POSITIVE':
+        mood_score = int(5 + (confidence * 5))  # 5-10
+        mood_label = get_mood_label(mood_score)
+    elif label == 'NEGATIVE':
+        mood_score = int(5 - (confidence * 4))  # 1-5
+        mood_label = get_mood_label(mood_score)
+    else:
+        mood_score = 5
+        mood_label = 'neutral'
+    
+    return {
+        "success": True,
+        "sentiment": label.lower(),
+        "confidence": round(confidence, 3),
+        "mood_score": mood_score,
+        "mood_label": mood_label,
+        "raw_result": result
+    }
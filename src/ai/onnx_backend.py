@@ -0,0 +1,157 @@
+"""
+ONNX Runtime Backend for Sentiment Inference
+Exports the sentiment model to ONNX (optionally int8-quantized) for fast CPU serving
+"""
+
+import os
+import numpy as np
+from pathlib import Path
+from typing import Any, Dict, List
+
+try:
+    import onnxruntime as ort
+    from onnxruntime.quantization import quantize_dynamic, QuantType
+    ONNX_AVAILABLE = True
+except ImportError:
+    ONNX_AVAILABLE = False
+
+from src.config import MODELS_DIR
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+ONNX_DIR = MODELS_DIR / "onnx"
+
+
+def _export_dir(model_name: str) -> Path:
+    """Directory holding exported artifacts for a model"""
+    return ONNX_DIR / model_name.replace('/', '--')
+
+
+def export_to_onnx(model_name: str, quantize: bool = False) -> Path:
+    """
+    Export a sequence classification model to ONNX
+
+    Args:
+        model_name: Hugging Face model identifier
+        quantize: Also write a dynamically int8-quantized copy
+
+    Returns:
+        Path of the ONNX file to serve
+    """
+    import torch
+    from transformers import AutoTokenizer, AutoModelForSequenceClassification
+
+    export_dir = _export_dir(model_name)
+    export_dir.mkdir(parents=True, exist_ok=True)
+    fp32_path = export_dir / "model.onnx"
+    int8_path = export_dir / "model.int8.onnx"
+
+    if not fp32_path.exists():
+        logger.info(f"Exporting {model_name} to ONNX")
+        tokenizer = AutoTokenizer.from_pretrained(model_name)
+        model = AutoModelForSequenceClassification.from_pretrained(model_name)
+        model.eval()
+
+        dummy = tokenizer("export", return_tensors="pt")
+        tmp_path = fp32_path.with_suffix(f".{os.getpid()}.tmp")
+        with torch.no_grad():
+            torch.onnx.export(
+                model,
+                (dummy['input_ids'], dummy['attention_mask']),
+                str(tmp_path),
+                input_names=['input_ids', 'attention_mask'],
+                output_names=['logits'],
+                dynamic_axes={
+                    'input_ids': {0: 'batch', 1: 'sequence'},
+                    'attention_mask': {0: 'batch', 1: 'sequence'},
+                    'logits': {0: 'batch'}
+                },
+                opset_version=14
+            )
+        tmp_path.replace(fp32_path)
+
+    if not quantize:
+        return fp32_path
+
+    if not int8_path.exists():
+        logger.info(f"Quantizing {model_name} to int8")
+        tmp_path = int8_path.with_suffix(f".{os.getpid()}.tmp")
+        quantize_dynamic(str(fp32_path), str(tmp_path), weight_type=QuantType.QInt8)
+        tmp_path.replace(int8_path)
+
+    return int8_path
+
+
+class OnnxSentimentModel:
+    """Drop-in replacement for the sentiment pipeline backed by onnxruntime"""
+
+    def __init__(self, model_name: str, tokenizer: Any, id2label: Dict[int, str],
+                 quantize: bool = False, max_length: int = 512):
+        """
+        Args:
+            model_name: Hugging Face model identifier
+            tokenizer: Tokenizer matching the model
+            id2label: Class index to label mapping from the model config
+            quantize: Serve the int8-quantized model
+            max_length: Maximum sequence length in tokens
+        """
+        if not ONNX_AVAILABLE:
+            raise ImportError("onnxruntime is required for the ONNX sentiment backend")
+
+        self.tokenizer = tokenizer
+        self.id2label = {int(k): v for k, v in id2label.items()}
+        self.max_length = max_length
+
+        model_path = export_to_onnx(model_name, quantize=quantize)
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        self.session = ort.InferenceSession(
+            str(model_path), options, providers=['CPUExecutionProvider']
+        )
+        self.input_names = {i.name for i in self.session.get_inputs()}
+
+        logger.info(f"ONNX sentiment model ready: {model_path.name}")
+
+    def __call__(self, texts: List[str], batch_size: int = 16,
+                 truncation: bool = True) -> List[Dict[str, Any]]:
+        """
+        Score texts with the same output format as the transformers pipeline
+
+        Args:
+            texts: Texts to score
+            batch_size: Rows per session run
+            truncation: Truncate to max_length tokens
+
+        Returns:
+            List of {"label", "score"} dicts
+        """
+        if isinstance(texts, str):
+            texts = [texts]
+
+        results = []
+        for start in range(0, len(texts), max(1, batch_size)):
+            encoded = self.tokenizer(
+                texts[start:start + batch_size],
+                padding=True,
+                truncation=truncation,
+                max_length=self.max_length,
+                return_tensors="np"
+            )
+            inputs = {
+                name: encoded[name].astype(np.int64)
+                for name in self.input_names if name in encoded
+            }
+            logits = self.session.run(['logits'], inputs)[0]
+
+            # Softmax over classes
+            logits = logits - logits.max(axis=1, keepdims=True)
+            probs = np.exp(logits)
+            probs /= probs.sum(axis=1, keepdims=True)
+
+            for row in probs:
+                index = int(row.argmax())
+                results.append({"label": self.id2label[index], "score": float(row[index])})
+
+        return results
@@ -0,0 +1,152 @@
+"""
+Pooled Mood Model
+One cross-user forecaster trained out-of-core over every user's mood entries,
+used for users without enough history for a personal model
+"""
+
+import time
+from collections import deque
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from src.ai.forecast_models import IncrementalForecaster
+from src.ai.mood_predictor import POOLED_MODEL_KEY, TARGET_WEEKDAY_COLUMN
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Latest entries used per user (bounds memory for very long histories)
+MAX_USER_HISTORY = 365
+
+# Users featurized together per mini-batch
+BATCH_USERS = 200
+
+
+def iter_user_histories(pages: Iterable[List[Dict[str, Any]]]) -> Iterator[Tuple[str, List[Dict[str, Any]]]]:
+    """
+    Group a stream of mood entries ordered by user_id, then created_at
+
+    Only one user's entries are held at a time.
+
+    Args:
+        pages: Pages of mood entries with user_id, mood_score and created_at
+
+    Yields:
+        (user ID, entries oldest first, at most MAX_USER_HISTORY)
+    """
+    current_uid, history = None, deque(maxlen=MAX_USER_HISTORY)
+    for page in pages:
+        for entry in page:
+            uid = entry.get('user_id')
+            if uid != current_uid:
+                if history:
+                    yield current_uid, list(history)
+                current_uid, history = uid, deque(maxlen=MAX_USER_HISTORY)
+            history.append(entry)
+    if history:
+        yield current_uid, list(history)
+
+
+def iter_training_batches(pages: Iterable[List[Dict[str, Any]]], predictor: Any, horizons: int,
+                          batch_users: int = BATCH_USERS) -> Iterator[Tuple[np.ndarray, np.ndarray, int]]:
+    """
+    Turn a mood entry stream into mini-batches of multi-horizon training rows
+
+    Args:
+        pages: Pages of mood entries ordered by user_id, then created_at
+        predictor: MoodPredictor whose feature pipeline is used
+        horizons: Maximum days ahead
+        batch_users: Users per mini-batch
+
+    Yields:
+        (model input rows, targets, users in the batch)
+    """
+    def featurize(entries: List[Dict[str, Any]], n_users: int):
+        features = predictor.prepare_features_batch(entries)
+        if features is None:
+            return None
+        matrices = predictor.get_feature_matrices(features, pooled=True, horizons=horizons)
+        if not len(matrices["y"]):
+            return None
+        return matrices["X"], matrices["y"], n_users
+
+    entries: List[Dict[str, Any]] = []
+    n_users = 0
+    for uid, history in iter_user_histories(pages):
+        entries.extend(history)
+        n_users += 1
+        if n_users >= batch_users:
+            batch = featurize(entries, n_users)
+            if batch is not None:
+                yield batch
+            entries, n_users = [], 0
+
+    if entries:
+        batch = featurize(entries, n_users)
+        if batch is not None:
+            yield batch
+
+
+def train_pooled_model(page_source: Callable[[], Iterable[List[Dict[str, Any]]]], predictor: Any,
+                       epochs: int = 3, batch_users: int = BATCH_USERS,
+                       seed: int = 42) -> Optional[Dict[str, Any]]:
+    """
+    Train the pooled model by streaming every user's entries and store it
+
+    The entries are streamed once to learn the feature scale and once per
+    epoch to fit the model, so memory depends on the batch size, not the
+    number of users.
+
+    Args:
+        page_source: Returns a fresh stream of mood entry pages ordered by
+            user_id, then created_at (called once per pass)
+        predictor: MoodPredictor whose feature pipeline and store are used
+        epochs: Passes of the regression over the data
+        batch_users: Users per mini-batch
+        seed: Seed for shuffling rows within a mini-batch
+
+    Returns:
+        Stored model artifact or None if there was no training data
+    """
+    start = time.monotonic()
+    horizons = predictor.forecast_days
+    model = IncrementalForecaster(weekday_column=TARGET_WEEKDAY_COLUMN)
+    rng = np.random.default_rng(seed)
+
+    n_samples, n_users = 0, 0
+    for X, y, batch_n_users in iter_training_batches(page_source(), predictor, horizons, batch_users):
+        model.partial_fit_scaler(X)
+        n_samples += len(y)
+        n_users += batch_n_users
+
+    if not n_samples:
+        logger.warning("No mood entries to train the pooled model on")
+        return None
+
+    for epoch in range(epochs):
+        for X, y, _ in iter_training_batches(page_source(), predictor, horizons, batch_users):
+            order = rng.permutation(len(y))
+            model.partial_fit(X[order], y[order])
+        logger.info(f"Pooled mood model epoch {epoch + 1}/{epochs} done")
+
+    artifact = {
+        'model': model,
+        'scaler': None,  # scaling is part of IncrementalForecaster
+        'model_name': 'pooled_sgd',
+        'backtest_mae': None,
+        'n_samples': n_samples,
+        'n_users': n_users,
+        'horizons': horizons,
+        'trained_through': None,
+        'trained_at': datetime.utcnow().isoformat(),
+        'fit_seconds': round(time.monotonic() - start, 3)
+    }
+    artifact['version'] = predictor.store.save(POOLED_MODEL_KEY, artifact)
+
+    logger.info(
+        f"Trained pooled mood model v{artifact['version']} on {n_samples} samples "
+        f"from {n_users} users in {artifact['fit_seconds']}s"
+    )
+    return artifact
@@ -0,0 +1,176 @@
+"""
+Content-addressed Result Cache
+Two-tier (in-memory LRU + SQLite) cache for model outputs
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def normalize_text(text: str) -> str:
+    """Normalize text so trivially different inputs share a cache key"""
+    text = unicodedata.normalize('NFC', text)
+    return ' '.join(text.split())
+
+
+def make_cache_key(text: str, model_name: str, model_version: str) -> str:
+    """
+    Build a content-addressed cache key
+
+    Args:
+        text: Input text
+        model_name: Model identifier
+        model_version: Model revision / backend identifier
+
+    Returns:
+        Hex digest identifying (text, model, version)
+    """
+    digest = hashlib.sha256()
+    for part in (model_name, model_version, normalize_text(text)):
+        digest.update(part.encode('utf-8'))
+        digest.update(b'\x00')
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """In-memory LRU tier backed by a persistent SQLite tier"""
+
+    def __init__(self, db_path: Optional[Path], ttl_seconds: int = 3600,
+                 max_memory_entries: int = 10000):
+        """
+        Args:
+            db_path: SQLite file for the persistent tier (None = memory only)
+            ttl_seconds: Entry lifetime
+            max_memory_entries: Size of the in-memory LRU tier
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_memory_entries = max_memory_entries
+        self._memory: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+        self.stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0}
+
+        if db_path is not None:
+            try:
+                self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
+                self._conn.execute(
+                    "CREATE TABLE IF NOT EXISTS results ("
+                    "key TEXT PRIMARY KEY, value TEXT NOT NULL, created_at REAL NOT NULL)"
+                )
+                self._conn.commit()
+            except Exception as e:
+                logger.warning(f"Result cache running memory-only, SQLite unavailable: {e}")
+                self._conn = None
+
+    def _expired(self, created_at: float) -> bool:
+        return time.time() - created_at > self.ttl_seconds
+
+    def _remember(self, key: str, created_at: float, value: Dict[str, Any]):
+        """Insert into the memory tier, evicting least recently used entries"""
+        self._memory[key] = (created_at, value)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached result
+
+        Args:
+            key: Cache key from make_cache_key
+
+        Returns:
+            Cached result or None
+        """
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                created_at, value = entry
+                if not self._expired(created_at):
+                    self._memory.move_to_end(key)
+                    self.stats["memory_hits"] += 1
+                    return value
+                del self._memory[key]
+
+            if self._conn is not None:
+                try:
+                    row = self._conn.execute(
+                        "SELECT value, created_at FROM results WHERE key = ?", (key,)
+                    ).fetchone()
+                    if row is not None:
+                        if not self._expired(row[1]):
+                            value = json.loads(row[0])
+                            self._remember(key, row[1], value)
+                            self.stats["disk_hits"] += 1
+                            return value
+                        self._conn.execute("DELETE FROM results WHERE key = ?", (key,))
+                        self._conn.commit()
+                except Exception as e:
+                    logger.warning(f"Result cache read failed: {e}")
+
+            self.stats["misses"] += 1
+            return None
+
+    def set(self, key: str, value: Dict[str, Any]):
+        """
+        Store a result in both tiers
+
+        Args:
+            key: Cache key from make_cache_key
+            value: JSON-serializable result
+        """
+        created_at = time.time()
+        with self._lock:
+            self._remember(key, created_at, value)
+
+            if self._conn is not None:
+                try:
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO results (key, value, created_at) VALUES (?, ?, ?)",
+                        (key, json.dumps(value), created_at)
+                    )
+                    self._conn.commit()
+                except Exception as e:
+                    logger.warning(f"Result cache write failed: {e}")
+
+    def purge_expired(self) -> int:
+        """
+        Remove expired entries from both tiers
+
+        Returns:
+            Number of persistent entries removed
+        """
+        cutoff = time.time() - self.ttl_seconds
+        with self._lock:
+            for key in [k for k, (created_at, _) in self._memory.items() if created_at < cutoff]:
+                del self._memory[key]
+
+            if self._conn is None:
+                return 0
+            cursor = self._conn.execute("DELETE FROM results WHERE created_at < ?", (cutoff,))
+            self._conn.commit()
+            return cursor.rowcount
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and tier sizes"""
+        with self._lock:
+            hits = self.stats["memory_hits"] + self.stats["disk_hits"]
+            lookups = hits + self.stats["misses"]
+            return {
+                **self.stats,
+                "hits": hits,
+                "hit_rate": round(hits / lookups, 3) if lookups else 0.0,
+                "memory_entries": len(self._memory)
+            }
@@ -3,40 +3,152 @@ Sentiment Analysis using Hugging Face Transformers
 Analyzes mood from journal text using NLP
 """
 
-from transformers import pipeline, AutoTokenizer, AutoModelForSequenceClassification
+from transformers import pipeline, AutoConfig, AutoTokenizer, AutoModelForSequenceClassification
 import torch
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 import logging
+import threading
 
-from src.config import settings
+from src.config import settings, DATA_DIR
+from src.ai.batching import MicroBatcher
+from src.ai.lazy import LazyModel
+from src.ai.model_registry import model_registry
+from src.ai.result_cache import ResultCache, make_cache_key
+from src.ai.model_server import ModelServerClient
+from src.ai.mood_scale import build_sentiment_result, get_mood_label
+from src.ai.lexicon_scorer import lexicon_scorer
+from src.ai.embedding_zero_shot import embedding_zero_shot
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Zero-shot label sets and detection thresholds (NLI mode; embedding mode reads its own from settings)
+EMOTION_LABELS = [
+    "joy", "sadness", "anger", "fear",
+    "anxiety", "calm", "excited", "stressed"
+]
+TRIGGER_LABELS = [
+    "work stress", "relationship issues", "health concerns",
+    "financial worries", "social anxiety", "sleep problems",
+    "family conflict", "loneliness"
+]
+EMOTION_THRESHOLD = 0.3
+TRIGGER_THRESHOLD = 0.4
+
+
+def _load_zero_shot_pipeline():
+    """Build the zero-shot NLI classifier shared by emotion and trigger detection"""
+    return pipeline(
+        "zero-shot-classification",
+        model=settings.ZERO_SHOT_MODEL,
+        device=0 if torch.cuda.is_available() else -1
+    )
+
 
 class SentimentAnalyzer:
     """NLP-based sentiment analysis for mood tracking"""
     
-    def __init__(self):
+    def __init__(self, local: bool = False):
+        """
+        Args:
+            local: Always load models in-process, ignoring MODEL_SERVER_SOCKET
+        """
         self.model_name = settings.SENTIMENT_MODEL
+        self.client = None
+        if settings.MODEL_SERVER_SOCKET and not local:
+            self.client = ModelServerClient(settings.MODEL_SERVER_SOCKET)
+        self.backend = settings.SENTIMENT_BACKEND.lower()
+        self.batch_size = settings.SENTIMENT_BATCH_SIZE
+        self.max_length = 512  # tokens per window
+        self.window_overlap = settings.SENTIMENT_WINDOW_OVERLAP
+        self.zero_shot_model_name = settings.ZERO_SHOT_MODEL
+        self.zero_shot_mode = settings.ZERO_SHOT_MODE.lower()
+        if self.zero_shot_mode == 'embedding':
+            # Embedding scores are not entailment probabilities, so NLI cut-offs do not carry over
+            self.emotion_threshold = settings.ZERO_SHOT_EMBEDDING_EMOTION_THRESHOLD
+            self.trigger_threshold = settings.ZERO_SHOT_EMBEDDING_TRIGGER_THRESHOLD
+        else:
+            self.emotion_threshold = EMOTION_THRESHOLD
+            self.trigger_threshold = TRIGGER_THRESHOLD
         self._initialize_model()
+        
+        # Zero-shot classifier is loaded once on first use and kept resident
+        model_registry.register(self.zero_shot_model_name, _load_zero_shot_pipeline, size_mb=1600)
+        
+        # Concurrent analyze_text callers share forward passes
+        self.batcher = MicroBatcher(
+            self._run_pipeline,
+            max_batch_size=self.batch_size,
+            max_wait_ms=settings.SENTIMENT_BATCH_WAIT_MS,
+            name="sentiment-batcher"
+        )
+        
+        # Cascade: confident lexicon results skip the transformer
+        self.fast_scorer = lexicon_scorer if settings.ENABLE_SENTIMENT_CASCADE else None
+        self.cascade_threshold = settings.SENTIMENT_CASCADE_THRESHOLD
+        self.tier_counts = {"lexicon": 0, "transformer": 0}
+        self._stats_lock = threading.Lock()
+        
+        # Identical texts skip the model entirely
+        self.cache = None
+        if settings.ENABLE_SENTIMENT_CACHE:
+            self.cache = ResultCache(
+                DATA_DIR / "sentiment_cache.sqlite3",
+                ttl_seconds=settings.CACHE_TTL_SECONDS,
+                max_memory_entries=settings.SENTIMENT_CACHE_MAX_ENTRIES
+            )
     
     def _initialize_model(self):
         """Initialize the sentiment analysis model"""
         try:
-            logger.info(f"Loading sentiment model: {self.model_name}")
+            logger.info(f"Loading sentiment model: {self.model_name} ({self.backend} backend)")
             
-            # Load model and tokenizer
+            # Load tokenizer
             self.tokenizer = AutoTokenizer.from_pretrained(self.model_name)
-            self.model = AutoModelForSequenceClassification.from_pretrained(self.model_name)
-            
-            # Create pipeline
-            self.sentiment_pipeline = pipeline(
-                "sentiment-analysis",
-                model=self.model,
-                tokenizer=self.tokenizer,
-                device=0 if torch.cuda.is_available() else -1
-            )
+            self.max_length = min(self.max_length, self.tokenizer.model_max_length)
+            
+            if self.client is not None:
+                # Forward inference to the shared model server; only the tokenizer stays local
+                self.model = None
+                self.sentiment_pipeline = self.client.sentiment
+                try:
+                    info = self.client.info()
+                    self.model_version = f"server-{info['model_version']}"
+                    self.max_length = min(self.max_length, info['max_length'])
+                except Exception as e:
+                    logger.warning(f"Model server not reachable yet: {e}")
+                    self.model_version = "server"
+                logger.info(f"Sentiment analyzer using model server at {self.client.socket_path}")
+                return
+            
+            if self.backend in ("onnx", "onnx-int8"):
+                # Serve through onnxruntime; the PyTorch weights are only needed for export
+                from src.ai.onnx_backend import OnnxSentimentModel
+                
+                config = AutoConfig.from_pretrained(self.model_name)
+                self.model = None
+                self.sentiment_pipeline = OnnxSentimentModel(
+                    self.model_name,
+                    self.tokenizer,
+                    config.id2label,
+                    quantize=self.backend == "onnx-int8",
+                    max_length=self.max_length
+                )
+            else:
+                config = None
+                self.model = AutoModelForSequenceClassification.from_pretrained(self.model_name)
+                
+                # Create pipeline
+                self.sentiment_pipeline = pipeline(
+                    "sentiment-analysis",
+                    model=self.model,
+                    tokenizer=self.tokenizer,
+                    device=0 if torch.cuda.is_available() else -1
+                )
+            
+            model_config = config if config is not None else self.model.config
+            revision = getattr(model_config, '_commit_hash', None) or 'local'
+            self.model_version = f"{revision}-{self.backend}"
             
             logger.info("Sentiment model loaded successfully")
             
@@ -44,55 +156,242 @@ class SentimentAnalyzer:
             logger.error(f"Failed to load sentiment model: {e}")
             raise
     
-    def analyze_text(self, text: str) -> Dict[str, Any]:
+    def _run_pipeline(self, texts: List[str]) -> List[Dict[str, Any]]:
+        """
+        Run one padded forward pass over a batch of texts
+        
+        Args:
+            texts: Non-empty texts that fit the model context
+            
+        Returns:
+            Raw pipeline results, one per text
+        """
+        return self.sentiment_pipeline(
+            texts,
+            batch_size=min(len(texts), self.batch_size),
+            truncation=True
+        )
+    
+    def _prepare_text(self, text: str) -> Optional[str]:
+        """Return text ready for the model, or None if it is empty"""
+        if not text or len(text.strip()) == 0:
+            return None
+        
+        return text
+    
+    def _chunk_text(self, text: str) -> List[Tuple[str, int]]:
+        """
+        Split text into overlapping token windows that fill the model context
+        
+        Args:
+            text: Text to split
+            
+        Returns:
+            List of (window text, token count) pairs
+        """
+        token_ids = self.tokenizer(text, add_special_tokens=False, verbose=False)['input_ids']
+        window = self.max_length - self.tokenizer.num_special_tokens_to_add()
+        
+        if len(token_ids) <= window:
+            return [(text, max(1, len(token_ids)))]
+        
+        step = max(1, window - self.window_overlap)
+        chunks = []
+        for start in range(0, len(token_ids), step):
+            ids = token_ids[start:start + window]
+            chunks.append((self.tokenizer.decode(ids), len(ids)))
+            if start + window >= len(token_ids):
+                break
+        
+        return chunks
+    
+    def _aggregate_chunks(self, raw_results: List[Dict[str, Any]],
+                          weights: List[int]) -> Dict[str, Any]:
+        """
+        Combine per-window predictions with a length-weighted average
+        
+        Args:
+            raw_results: Raw pipeline results, one per window
+            weights: Token count of each window
+            
+        Returns:
+            Aggregated raw result with label and score
+        """
+        if len(raw_results) == 1:
+            return raw_results[0]
+        
+        total = float(sum(weights))
+        labels = {r['label'].upper() for r in raw_results}
+        
+        if labels <= {'POSITIVE', 'NEGATIVE'}:
+            # Average the positive-class probability across windows
+            positive = sum(
+                w * (r['score'] if r['label'].upper() == 'POSITIVE' else 1 - r['score'])
+                for r, w in zip(raw_results, weights)
+            ) / total
+            if positive >= 0.5:
+                return {"label": "POSITIVE", "score": positive}
+            return {"label": "NEGATIVE", "score": 1 - positive}
+        
+        # Other label sets: weighted vote on each window's top label
+        votes: Dict[str, float] = {}
+        for r, w in zip(raw_results, weights):
+            votes[r['label']] = votes.get(r['label'], 0.0) + w * r['score']
+        label = max(votes, key=votes.get)
+        return {"label": label, "score": votes[label] / total}
+    
+    def _fast_result(self, text: str, use_cascade: bool = True) -> Optional[Dict[str, Any]]:
+        """
+        Run the lexicon stage of the cascade
+        
+        Args:
+            text: Text to analyze
+            use_cascade: Allow the lexicon to answer (False = always use the transformer)
+            
+        Returns:
+            Lexicon result if it is confident enough, else None
+        """
+        if self.fast_scorer is None or not use_cascade:
+            return None
+        
+        raw = self.fast_scorer.score(text)
+        if raw['score'] < self.cascade_threshold:
+            return None
+        
+        result = self._build_result(raw)
+        result['tier'] = 'lexicon'
+        self._count_tier('lexicon')
+        return result
+    
+    def _count_tier(self, tier: str):
+        """Count a text answered by a cascade tier"""
+        with self._stats_lock:
+            self.tier_counts[tier] += 1
+    
+    def get_tier_stats(self) -> Dict[str, int]:
+        """
+        Get how many texts each cascade tier answered
+        
+        Returns:
+            Counts per tier
+        """
+        with self._stats_lock:
+            return dict(self.tier_counts)
+    
+    def _build_chunked_result(self, chunks: List[Tuple[str, int]],
+                              raw_results: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Build the final result for a text from its window predictions"""
+        weights = [n_tokens for _, n_tokens in chunks]
+        result = self._build_result(self._aggregate_chunks(raw_results, weights))
+        result['tier'] = 'transformer'
+        self._count_tier('transformer')
+        result['chunks'] = [
+            {
+                "sentiment": raw['label'].lower(),
+                "confidence": round(raw['score'], 3),
+                "tokens": n_tokens
+            }
+            for (_, n_tokens), raw in zip(chunks, raw_results)
+        ]
+        return result
+    
+    def _finalize(self, result: Dict[str, Any], return_chunks: bool) -> Dict[str, Any]:
+        """Drop per-window detail unless it was requested"""
+        if return_chunks or 'chunks' not in result:
+            return result
+        return {key: value for key, value in result.items() if key != 'chunks'}
+    
+    def _cache_key(self, text: str) -> str:
+        """Cache key for text under the current model"""
+        return make_cache_key(text, self.model_name, self.model_version)
+    
+    def _cache_get(self, text: str) -> Optional[Dict[str, Any]]:
+        """Return a cached transformer result for text, if any"""
+        if self.cache is None:
+            return None
+        result = self.cache.get(self._cache_key(text))
+        if result is not None and result.get('tier') == 'lexicon':
+            return None  # written before lexicon results were kept out of the cache
+        return result
+    
+    def _cache_set(self, text: str, result: Dict[str, Any]):
+        """
+        Store a successful transformer result for text
+        
+        Lexicon results are cheap to recompute and must not be served under
+        the transformer's model version, so they are never cached.
+        """
+        if self.cache is not None and result.get('success') and result.get('tier') != 'lexicon':
+            self.cache.set(self._cache_key(text), result)
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """
+        Get sentiment cache statistics
+        
+        Returns:
+            Hit/miss counters (empty if caching is disabled)
+        """
+        return self.cache.get_stats() if self.cache is not None else {}
+    
+    def _build_result(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Map a raw pipeline result to the mood scale
+        
+        Args:
+            result: Raw pipeline output with label and score
+            
+        Returns:
+            Sentiment analysis results
+        """
+        return build_sentiment_result(result)
+    
+    def analyze_text(self, text: str, return_chunks: bool = False,
+                     use_cascade: bool = True) -> Dict[str, Any]:
         """
         Analyze sentiment of text
         
+        Long texts are split into overlapping token windows that are scored
+        together and combined with a length-weighted average. Concurrent
+        callers are grouped by the micro-batcher so their windows share a
+        single forward pass.
+        
         Args:
             text: Text to analyze
+            return_chunks: Include per-window scores in the result
+            use_cascade: Let a confident lexicon result skip the transformer
+                (False for results that are stored, e.g. the backfill)
             
         Returns:
             Sentiment analysis results
         """
         try:
-            if not text or len(text.strip()) == 0:
+            text = self._prepare_text(text)
+            if text is None:
                 return {
                     "success": False,
                     "error": "Empty text provided"
                 }
             
-            # Truncate if too long
-            max_length = 512
-            if len(text) > max_length:
-                text = text[:max_length]
+            cached = self._cache_get(text)
+            if cached is not None:
+                return self._finalize(cached, return_chunks)
             
-            # Run sentiment analysis
-            result = self.sentiment_pipeline(text)[0]
+            result = self._fast_result(text, use_cascade)
+            if result is not None:
+                return result
             
-            # Map to mood scale (1-10)
-            label = result['label'].upper()
-            confidence = result['score']
+            # Run sentiment analysis on every window in one batch
+            chunks = self._chunk_text(text)
+            futures = [self.batcher.submit(chunk_text) for chunk_text, _ in chunks]
+            result = self._build_chunked_result(chunks, [f.result() for f in futures])
+            self._cache_set(text, result)
             
-            if label == 'POSITIVE':
-                mood_score = int(5 + (confidence * 5))  # 5-10
-                mood_label = self._get_mood_label(mood_score)
-            elif label == 'NEGATIVE':
-                mood_score = int(5 - (confidence * 4))  # 1-5
-                mood_label = self._get_mood_label(mood_score)
-            else:
-                mood_score = 5
-                mood_label = 'neutral'
+            logger.info(
+                f"Sentiment analyzed: {result['mood_label']} "
+                f"(score: {result['mood_score']}, windows: {len(chunks)})"
+            )
             
-            logger.info(f"Sentiment analyzed: {mood_label} (score: {mood_score})")
-            
-            return {
-                "success": True,
-                "sentiment": label.lower(),
-                "confidence": round(confidence, 3),
-                "mood_score": mood_score,
-                "mood_label": mood_label,
-                "raw_result": result
-            }
+            return self._finalize(result, return_chunks)
             
         except Exception as e:
             logger.error(f"Sentiment analysis failed: {e}")
@@ -101,6 +400,75 @@ class SentimentAnalyzer:
                 "error": str(e)
             }
     
+    def analyze_texts(self, texts: List[str], return_chunks: bool = False,
+                      use_cascade: bool = True) -> List[Dict[str, Any]]:
+        """
+        Analyze sentiment of many texts in batches
+        
+        Windows from all texts are flattened and scored batch_size at a time.
+        
+        Args:
+            texts: Texts to analyze
+            return_chunks: Include per-window scores in each result
+            use_cascade: Let confident lexicon results skip the transformer
+            
+        Returns:
+            Sentiment analysis results in input order
+        """
+        results: List[Dict[str, Any]] = [
+            {"success": False, "error": "Empty text provided"} for _ in texts
+        ]
+        
+        pending: Dict[int, Tuple[str, List[Tuple[str, int]]]] = {}
+        windows: List[Tuple[int, str]] = []
+        for i, text in enumerate(texts):
+            text = self._prepare_text(text)
+            if text is None:
+                continue
+            cached = self._cache_get(text)
+            if cached is not None:
+                results[i] = self._finalize(cached, return_chunks)
+                continue
+            fast = self._fast_result(text, use_cascade)
+            if fast is not None:
+                results[i] = fast
+                continue
+            try:
+                chunks = self._chunk_text(text)
+            except Exception as e:
+                results[i] = {"success": False, "error": str(e)}
+                continue
+            pending[i] = (text, chunks)
+            windows.extend((i, chunk_text) for chunk_text, _ in chunks)
+        
+        raw_by_text: Dict[int, List[Dict[str, Any]]] = {i: [] for i in pending}
+        failed: Dict[int, str] = {}
+        for start in range(0, len(windows), self.batch_size):
+            batch = windows[start:start + self.batch_size]
+            try:
+                raw_results = self._run_pipeline([chunk_text for _, chunk_text in batch])
+                for (i, _), raw in zip(batch, raw_results):
+                    raw_by_text[i].append(raw)
+            except Exception as e:
+                logger.error(f"Batch sentiment analysis failed: {e}")
+                for i, _ in batch:
+                    failed[i] = str(e)
+        
+        for i, (text, chunks) in pending.items():
+            if i in failed:
+                results[i] = {"success": False, "error": failed[i]}
+                continue
+            result = self._build_chunked_result(chunks, raw_by_text[i])
+            self._cache_set(text, result)
+            results[i] = self._finalize(result, return_chunks)
+        
+        logger.info(
+            f"Sentiment analyzed for {len(texts)} texts "
+            f"({len(pending)} cache misses, {len(windows)} windows)"
+        )
+        
+        return results
+    
     def _get_mood_label(self, score: int) -> str:
         """
         Convert mood score to label
@@ -111,16 +479,7 @@ class SentimentAnalyzer:
         Returns:
             Mood label
         """
-        if score >= 9:
-            return 'excellent'
-        elif score >= 7:
-            return 'good'
-        elif score >= 5:
-            return 'okay'
-        elif score >= 3:
-            return 'low'
-        else:
-            return 'very_low'
+        return get_mood_label(score)
     
     def analyze_mood_entry(self, mood_entry: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -143,6 +502,7 @@ class SentimentAnalyzer:
                     mood_entry['ai_confidence'] = sentiment_result['confidence']
                     mood_entry['ai_mood_score'] = sentiment_result['mood_score']
                     mood_entry['ai_mood_label'] = sentiment_result['mood_label']
+                    mood_entry['ai_tier'] = sentiment_result.get('tier')
             
             return mood_entry
             
@@ -150,6 +510,64 @@ class SentimentAnalyzer:
             logger.error(f"Failed to analyze mood entry: {e}")
             return mood_entry
     
+    def _classify_zero_shot(self, text: str, labels: List[str]) -> Dict[str, float]:
+        """
+        Score candidate labels against text in a single NLI forward pass
+        (or a single matrix multiply when ZERO_SHOT_MODE is "embedding")
+        
+        Args:
+            text: Text to analyze
+            labels: Candidate labels (each one becomes a hypothesis)
+            
+        Returns:
+            Mapping of label to entailment probability
+        """
+        if self.client is not None:
+            return self.client.zero_shot(text, labels)
+        
+        if self.zero_shot_mode == 'embedding':
+            return embedding_zero_shot.classify([text], labels)[0]
+        
+        classifier = model_registry.get(self.zero_shot_model_name)
+        
+        # multi_label scores each hypothesis independently, so all pairs can share one batch
+        result = classifier(text, labels, multi_label=True, batch_size=len(labels))
+        
+        return dict(zip(result['labels'], result['scores']))
+    
+    def _format_emotions(self, scores: Dict[str, float]) -> Dict[str, Any]:
+        """Build the emotion result from label scores"""
+        ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)
+        
+        # Get top 3 emotions
+        top_emotions = []
+        for label, score in ranked[:3]:
+            if score > self.emotion_threshold:
+                top_emotions.append({
+                    "emotion": label,
+                    "confidence": round(score, 3)
+                })
+        
+        return {
+            "emotions": top_emotions,
+            "all_scores": dict(ranked)
+        }
+    
+    def _format_triggers(self, scores: Dict[str, float]) -> Dict[str, Any]:
+        """Build the trigger result from label scores"""
+        ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)
+        
+        # Get triggers above threshold
+        detected_triggers = []
+        for label, score in ranked:
+            if score > self.trigger_threshold:
+                detected_triggers.append({
+                    "trigger": label,
+                    "confidence": round(score, 3)
+                })
+        
+        return {"triggers": detected_triggers}
+    
     def extract_emotions(self, text: str) -> Dict[str, Any]:
         """
         Extract specific emotions from text
@@ -162,35 +580,11 @@ class SentimentAnalyzer:
         """
         try:
             # Use zero-shot classification for emotion detection
-            emotion_classifier = pipeline(
-                "zero-shot-classification",
-                model="facebook/bart-large-mnli",
-                device=0 if torch.cuda.is_available() else -1
-            )
-            
-            emotions = [
-                "joy", "sadness", "anger", "fear", 
-                "anxiety", "calm", "excited", "stressed"
-            ]
-            
-            result = emotion_classifier(text, emotions, multi_label=True)
+            result = self._format_emotions(self._classify_zero_shot(text, EMOTION_LABELS))
             
-            # Get top 3 emotions
-            top_emotions = []
-            for label, score in zip(result['labels'][:3], result['scores'][:3]):
-                if score > 0.3:  # Threshold
-                    top_emotions.append({
-                        "emotion": label,
-                        "confidence": round(score, 3)
-                    })
+            logger.info(f"Extracted emotions: {[e['emotion'] for e in result['emotions']]}")
             
-            logger.info(f"Extracted emotions: {[e['emotion'] for e in top_emotions]}")
-            
-            return {
-                "success": True,
-                "emotions": top_emotions,
-                "all_scores": dict(zip(result['labels'], result['scores']))
-            }
+            return {"success": True, **result}
             
         except Exception as e:
             logger.error(f"Emotion extraction failed: {e}")
@@ -210,45 +604,55 @@ class SentimentAnalyzer:
             Detected triggers
         """
         try:
-            # Common trigger categories
-            trigger_categories = [
-                "work stress", "relationship issues", "health concerns",
-                "financial worries", "social anxiety", "sleep problems",
-                "family conflict", "loneliness"
-            ]
-            
             # Use zero-shot classification
-            classifier = pipeline(
-                "zero-shot-classification",
-                model="facebook/bart-large-mnli",
-                device=0 if torch.cuda.is_available() else -1
-            )
-            
-            result = classifier(text, trigger_categories, multi_label=True)
+            result = self._format_triggers(self._classify_zero_shot(text, TRIGGER_LABELS))
             
-            # Get triggers above threshold
-            detected_triggers = []
-            for label, score in zip(result['labels'], result['scores']):
-                if score > 0.4:  # Threshold
-                    detected_triggers.append({
-                        "trigger": label,
-                        "confidence": round(score, 3)
-                    })
+            logger.info(f"Detected triggers: {[t['trigger'] for t in result['triggers']]}")
             
-            logger.info(f"Detected triggers: {[t['trigger'] for t in detected_triggers]}")
+            return {"success": True, **result}
             
+        except Exception as e:
+            logger.error(f"Trigger detection failed: {e}")
             return {
-                "success": True,
-                "triggers": detected_triggers
+                "success": False,
+                "error": str(e)
             }
+    
+    def analyze_affect(self, text: str) -> Dict[str, Any]:
+        """
+        Detect emotions and triggers together
+        
+        All emotion and trigger hypotheses are scored in one batched NLI
+        pass instead of two separate zero-shot runs.
+        
+        Args:
+            text: Text to analyze
+            
+        Returns:
+            Combined emotion and trigger results (same keys as
+            extract_emotions and detect_triggers)
+        """
+        try:
+            scores = self._classify_zero_shot(text, EMOTION_LABELS + TRIGGER_LABELS)
+            
+            emotions = self._format_emotions({label: scores[label] for label in EMOTION_LABELS})
+            triggers = self._format_triggers({label: scores[label] for label in TRIGGER_LABELS})
+            
+            logger.info(
+                f"Analyzed affect: emotions {[e['emotion'] for e in emotions['emotions']]}, "
+                f"triggers {[t['trigger'] for t in triggers['triggers']]}"
+            )
+            
+            return {"success": True, **emotions, **triggers}
             
         except Exception as e:
-            logger.error(f"Trigger detection failed: {e}")
+            logger.error(f"Affect analysis failed: {e}")
             return {
                 "success": False,
                 "error": str(e)
             }
 
 
-# Singleton instance
-sentiment_analyzer = SentimentAnalyzer()
+# Singleton instance (loaded in the background, see src.ai.lazy)
+# The lexicon scorer answers analyze_text calls until the model is ready
+sentiment_analyzer = LazyModel(SentimentAnalyzer, name="sentiment_analyzer", fallback=lexicon_scorer)
@@ -0,0 +1,173 @@
+"""
+Streaming Mood Statistics
+One-pass, mergeable summary of mood scores (Welford mean/variance, a score
+histogram for the median and a small window of the latest scores for the trend)
+"""
+
+import math
+from array import array
+from typing import Any, Dict, Iterable, List, Optional
+
+# Latest scores kept for the recent-vs-older trend
+TREND_WINDOW = 7
+
+# Integer scores counted in the histogram (anything else is kept as-is)
+MIN_SCORE = 1
+MAX_SCORE = 10
+
+
+class StreamingMoodStats:
+    """Running statistics over mood scores, in entry order"""
+
+    __slots__ = ('count', 'total', 'mean', 'm2', 'min', 'max',
+                 'histogram', 'other_scores', 'recent', 'recent_start')
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+        self.histogram = array('q', bytes(8 * (MAX_SCORE - MIN_SCORE + 1)))
+        self.other_scores: List[float] = []
+        # Ring buffer of the latest scores, oldest at recent_start once full
+        self.recent = array('d', bytes(8 * TREND_WINDOW))
+        self.recent_start = 0
+
+    @classmethod
+    def from_scores(cls, scores: Iterable[float]) -> "StreamingMoodStats":
+        """Summarize scores in one pass"""
+        stats = cls()
+        for score in scores:
+            stats.update(score)
+        return stats
+
+    def update(self, score: float):
+        """
+        Add one score (Welford update)
+
+        Args:
+            score: Mood score
+        """
+        self.count += 1
+        self.total += score
+        delta = score - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (score - self.mean)
+
+        self.min = score if self.min is None or score < self.min else self.min
+        self.max = score if self.max is None or score > self.max else self.max
+
+        if score == int(score) and MIN_SCORE <= score <= MAX_SCORE:
+            self.histogram[int(score) - MIN_SCORE] += 1
+        else:
+            self.other_scores.append(score)
+
+        if self.count <= TREND_WINDOW:
+            self.recent[self.count - 1] = score
+        else:
+            self.recent[self.recent_start] = score
+            self.recent_start = (self.recent_start + 1) % TREND_WINDOW
+
+    def merge(self, other: "StreamingMoodStats") -> "StreamingMoodStats":
+        """
+        Combine with the statistics of the entries that follow these ones (Chan et al.)
+
+        Args:
+            other: Statistics of a later page of entries
+
+        Returns:
+            New combined statistics (the inputs are not modified)
+        """
+        merged = StreamingMoodStats()
+        merged.count = self.count + other.count
+        if merged.count == 0:
+            return merged
+
+        merged.total = self.total + other.total
+        delta = other.mean - self.mean
+        merged.mean = self.mean + delta * other.count / merged.count
+        merged.m2 = self.m2 + other.m2 + delta * delta * self.count * other.count / merged.count
+
+        merged.min = min(v for v in (self.min, other.min) if v is not None)
+        merged.max = max(v for v in (self.max, other.max) if v is not None)
+
+        for i in range(len(merged.histogram)):
+            merged.histogram[i] = self.histogram[i] + other.histogram[i]
+        merged.other_scores = self.other_scores + other.other_scores
+
+        recent = (self.latest() + other.latest())[-TREND_WINDOW:]
+        merged.recent[:len(recent)] = array('d', recent)
+        return merged
+
+    def latest(self) -> List[float]:
+        """Latest scores (up to TREND_WINDOW), oldest first"""
+        if self.count <= TREND_WINDOW:
+            return list(self.recent[:self.count])
+        return list(self.recent[self.recent_start:]) + list(self.recent[:self.recent_start])
+
+    @property
+    def std(self) -> float:
+        """Population standard deviation"""
+        if not self.count:
+            return 0.0
+        if self.other_scores:
+            return math.sqrt(self.m2 / self.count)
+
+        # All scores are in the histogram: use exact integer moments so scores
+        # sitting exactly on a volatility threshold are not pushed over it by
+        # the Welford rounding error
+        s1 = sum((MIN_SCORE + i) * n for i, n in enumerate(self.histogram))
+        s2 = sum((MIN_SCORE + i) ** 2 * n for i, n in enumerate(self.histogram))
+        return math.sqrt((self.count * s2 - s1 * s1) / (self.count * self.count))
+
+    def median(self) -> float:
+        """Median from the histogram (and any scores outside it)"""
+        if self.other_scores:
+            values = sorted(self.other_scores + [
+                MIN_SCORE + i for i, n in enumerate(self.histogram) for _ in range(n)
+            ])
+            middle = len(values) // 2
+            return values[middle] if len(values) % 2 else (values[middle - 1] + values[middle]) / 2
+
+        def nth(k: int) -> int:
+            seen = 0
+            for i, n in enumerate(self.histogram):
+                seen += n
+                if seen > k:
+                    return MIN_SCORE + i
+            raise IndexError(k)
+
+        middle = self.count // 2
+        return nth(middle) if self.count % 2 else (nth(middle - 1) + nth(middle)) / 2
+
+    def trend(self) -> str:
+        """Average of the latest TREND_WINDOW scores compared with the ones before"""
+        if self.count < TREND_WINDOW:
+            return "insufficient_data"
+
+        recent_sum = sum(self.latest())
+        recent_avg = recent_sum / TREND_WINDOW
+        older_avg = (self.total - recent_sum) / (self.count - TREND_WINDOW) if self.count > TREND_WINDOW else recent_avg
+
+        if recent_avg > older_avg + 0.5:
+            return "improving"
+        elif recent_avg < older_avg - 0.5:
+            return "declining"
+        return "stable"
+
+    def insights(self) -> Dict[str, Any]:
+        """Summary in the MoodPredictor.get_mood_insights format"""
+        std = self.std
+        return {
+            "success": True,
+            "average_mood": round(self.total / self.count, 2),
+            "mood_std": round(std, 2),
+            "min_mood": int(self.min),
+            "max_mood": int(self.max),
+            "median_mood": round(float(self.median()), 2),
+            "mood_volatility": "high" if std > 2 else "moderate" if std > 1 else "low",
+            "total_entries": self.count,
+            "trend": self.trend()
+        }
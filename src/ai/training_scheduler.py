@@ -0,0 +1,139 @@
+"""
+Background Training Scheduler
+Runs model fits in a process pool, off the request path
+"""
+
+import multiprocessing
+import threading
+import time
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from src.config import settings
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# spawn: forking a process that runs model threads can deadlock
+PROCESS_POOL_CONTEXT = multiprocessing.get_context('spawn')
+
+
+class TrainingScheduler:
+    """Deduplicating job queue for model fits"""
+
+    def __init__(self, max_workers: Optional[int] = None, executor: Optional[Executor] = None):
+        """
+        Args:
+            max_workers: Worker processes (defaults to MOOD_TRAINING_WORKERS)
+            executor: Executor to use instead of a process pool (e.g. a thread pool in tests)
+        """
+        self.max_workers = max_workers or settings.MOOD_TRAINING_WORKERS
+        self._executor = executor
+        self._pending: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._completed = 0
+        self._failed = 0
+        self._total_job_seconds = 0.0
+        self._last_job_seconds: Optional[float] = None
+
+    def _get_executor(self) -> Executor:
+        """Create the process pool on first use"""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=PROCESS_POOL_CONTEXT
+            )
+        return self._executor
+
+    def schedule(self, key: str, fn: Callable[..., Any], *args: Any,
+                 on_complete: Optional[Callable[[str, Any], None]] = None) -> bool:
+        """
+        Queue a fit unless one is already pending for the key
+
+        Args:
+            key: Job key (e.g. user ID)
+            fn: Picklable top-level function to run in a worker
+            *args: Picklable arguments for fn
+            on_complete: Called in this process with (key, result) when fn succeeds
+
+        Returns:
+            True if a job was queued
+        """
+        with self._lock:
+            if key in self._pending:
+                return False
+            self._pending[key] = time.monotonic()
+
+        try:
+            future = self._get_executor().submit(fn, *args)
+        except Exception as e:
+            logger.error(f"Failed to schedule training for {key}: {e}")
+            self._finish(key, succeeded=False)
+            return False
+
+        future.add_done_callback(lambda f: self._on_done(key, f, on_complete))
+        return True
+
+    def _on_done(self, key: str, future: Future, on_complete: Optional[Callable[[str, Any], None]]):
+        """Hand the result over and record metrics"""
+        succeeded = False
+        try:
+            result = future.result()
+            if on_complete is not None:
+                on_complete(key, result)
+            succeeded = True
+        except Exception as e:
+            logger.error(f"Training job for {key} failed: {e}")
+        finally:
+            self._finish(key, succeeded)
+
+    def _finish(self, key: str, succeeded: bool):
+        with self._lock:
+            submitted_at = self._pending.pop(key, None)
+            if succeeded:
+                self._completed += 1
+                if submitted_at is not None:
+                    self._last_job_seconds = time.monotonic() - submitted_at
+                    self._total_job_seconds += self._last_job_seconds
+            else:
+                self._failed += 1
+            self._idle.notify_all()
+
+    def is_pending(self, key: str) -> bool:
+        """Check if a job is queued or running for the key"""
+        with self._lock:
+            return key in self._pending
+
+    def wait_idle(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until no jobs are pending
+
+        Args:
+            timeout: Seconds to wait (None = forever)
+
+        Returns:
+            True if idle, False on timeout
+        """
+        with self._idle:
+            return self._idle.wait_for(lambda: not self._pending, timeout)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Queue length and job duration metrics"""
+        with self._lock:
+            return {
+                'queue_length': len(self._pending),
+                'completed': self._completed,
+                'failed': self._failed,
+                'last_job_seconds': round(self._last_job_seconds, 3) if self._last_job_seconds is not None else None,
+                'avg_job_seconds': round(self._total_job_seconds / self._completed, 3) if self._completed else None
+            }
+
+    def shutdown(self, wait: bool = True):
+        """Stop the worker pool"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+
+
+# Singleton instance (the pool starts on the first scheduled fit)
+training_scheduler = TrainingScheduler()
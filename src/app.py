@@ -17,8 +17,13 @@ from src.database.firestore_client import firestore_client
 from src.ai.openai_client import openai_client
 from src.ai.sentiment_analyzer import sentiment_analyzer
 from src.ai.mood_predictor import mood_predictor
+from src.ai.embedding_index import embedding_index
+from src.ai.lazy import warm_up_models
 
 
+# Load AI models in the background so the login page renders immediately
+warm_up_models()
+
 # Page configuration
 st.set_page_config(
     page_title="Mindful Connect - Mental Wellness Companion",
@@ -269,12 +274,32 @@ def show_dashboard():
     
     st.plotly_chart(fig, use_container_width=True)
     
-    # Mood prediction
-    if settings.ENABLE_MOOD_PREDICTION and len(mood_entries) >= 7:
+    # Mood prediction (users under a week of entries get the pooled model's forecast)
+    pooled_forecast = bool(mood_entries) and mood_predictor.has_pooled_model()
+    if settings.ENABLE_MOOD_PREDICTION and (len(mood_entries) >= 7 or pooled_forecast):
         st.markdown("### 🔮 Mood Forecast")
         
         with st.spinner("Generating forecast..."):
-            prediction = mood_predictor.predict_mood(mood_entries, days_ahead=7)
+            # Continue from the drift state recorded by other processes
+            mood_predictor.monitor.restore_state(uid, firestore_client.get_drift_state(uid))
+            
+            # Prefer the nightly forecast (scripts/materialize_forecasts.py) while it is current
+            stored = firestore_client.get_forecast(uid)
+            latest_entry_at = mood_entries[0]['created_at']
+            if not mood_predictor.is_forecast_stale(stored, latest_entry_at, days_ahead=7):
+                prediction = mood_predictor.from_forecast_document(stored, days_ahead=7)
+                mood_predictor.monitor.record_forecast(uid, prediction)
+            else:
+                prediction = mood_predictor.predict_mood(
+                    mood_entries, days_ahead=7, uid=uid,
+                    feature_state=firestore_client.get_mood_features(uid)
+                )
+                if prediction and prediction['success'] and not prediction.get('baseline'):
+                    firestore_client.save_forecast(
+                        uid, mood_predictor.to_forecast_document(prediction, latest_entry_at)
+                    )
+            
+            firestore_client.save_drift_state(uid, mood_predictor.monitor.export_state(uid))
             
             if prediction and prediction['success']:
                 pred_df = pd.DataFrame(prediction['predictions'])
@@ -298,6 +323,9 @@ def show_dashboard():
                 )
                 
                 st.plotly_chart(fig2, use_container_width=True)
+                
+                if prediction.get('baseline'):
+                    st.caption("⏳ Your personal forecast model isn't ready yet - showing a general forecast for now.")
     
     # Recent insights
     st.markdown("### 💡 Recent Insights")
@@ -356,6 +384,9 @@ def show_mood_logger():
             placeholder="This is a safe space to express yourself..."
         )
         
+        if journal_text and not sentiment_analyzer.is_ready():
+            st.caption("⏳ AI model is warming up - a quick analysis will be used for this entry.")
+        
         if st.button("Save Mood Entry", use_container_width=True):
             with st.spinner("Saving and analyzing..."):
                 uid = st.session_state.user_data['uid']
@@ -374,11 +405,17 @@ def show_mood_logger():
                         mood_data['ai_sentiment'] = sentiment_result['sentiment']
                         mood_data['ai_confidence'] = sentiment_result['confidence']
                         mood_data['mood_label'] = sentiment_result['mood_label']
+                        mood_data['ai_tier'] = sentiment_result.get('tier')
                 
                 # Save to database
                 entry_id = firestore_client.create_mood_entry(uid, mood_data)
                 
                 if entry_id:
+                    # Score pending forecasts and drop cached ones
+                    mood_predictor.monitor.restore_state(uid, firestore_client.get_drift_state(uid))
+                    mood_predictor.record_entry(uid, mood_score, mood_data['created_at'])
+                    firestore_client.save_drift_state(uid, mood_predictor.monitor.export_state(uid))
+                    
                     # Generate AI insights
                     mood_history = firestore_client.get_mood_entries(uid, limit=10)
                     insight_result = openai_client.generate_coping_strategies(
@@ -402,6 +439,22 @@ def show_mood_logger():
                             st.info(insight_result['insight'])
                     else:
                         st.success("✅ Mood entry saved!")
+                    
+                    # Index the entry and surface similar past entries
+                    if journal_text and settings.ENABLE_EMBEDDING_INDEX:
+                        if embedding_index.add_entry(uid, entry_id, journal_text):
+                            matches = embedding_index.similar_entries(uid, entry_id, k=3)
+                            similar = firestore_client.get_mood_entries_by_ids(
+                                uid, [m['entry_id'] for m in matches]
+                            )
+                            if similar:
+                                with col2:
+                                    st.markdown("### 🔁 Similar Past Entries")
+                                    for entry in similar:
+                                        entry_date = entry['created_at'].strftime('%B %d, %Y')
+                                        title = f"{entry_date} - Mood {entry['mood_score']}/10"
+                                        with st.expander(title):
+                                            st.write(entry.get('journal_text', ''))
                 else:
                     st.error("Failed to save mood entry. Please try again.")
     
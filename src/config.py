@@ -67,6 +67,7 @@ class Settings(BaseSettings):
     FIRESTORE_COLLECTION_INSIGHTS: str = "insights"
     FIRESTORE_COLLECTION_PROMPTS: str = "daily_prompts"
     FIRESTORE_COLLECTION_SESSIONS: str = "chat_sessions"
+    FIRESTORE_COLLECTION_FORECASTS: str = "forecasts"
     
     # Rate Limiting
     RATE_LIMIT_PER_MINUTE: int = 60
@@ -79,8 +80,37 @@ class Settings(BaseSettings):
     
     # ML Models
     SENTIMENT_MODEL: str = "distilbert-base-uncased-finetuned-sst-2-english"
+    SENTIMENT_BACKEND: str = "torch"  # torch, onnx or onnx-int8
+    SENTIMENT_BATCH_SIZE: int = 16
+    SENTIMENT_BATCH_WAIT_MS: int = 5
+    SENTIMENT_WINDOW_OVERLAP: int = 64
+    ENABLE_SENTIMENT_CASCADE: bool = True
+    SENTIMENT_CASCADE_THRESHOLD: float = 0.9
+    ZERO_SHOT_MODEL: str = "facebook/bart-large-mnli"
+    ZERO_SHOT_MODE: str = "nli"  # nli (cross-encoder) or embedding
+    # Embedding scores are sigmoid-mapped cosine similarities, not entailment probabilities
+    ZERO_SHOT_EMBEDDING_EMOTION_THRESHOLD: float = 0.5
+    ZERO_SHOT_EMBEDDING_TRIGGER_THRESHOLD: float = 0.6
+    MODEL_REGISTRY_MAX_MEMORY_MB: int = 4096
+    MODEL_REGISTRY_IDLE_SECONDS: int = 0
+    MODEL_SERVER_SOCKET: Optional[str] = None
+    MODEL_SERVER_MAX_QUEUE: int = 256
+    MODEL_SERVER_TIMEOUT: int = 30
+    EMBEDDING_MODEL: str = "sentence-transformers/all-MiniLM-L6-v2"
+    EMBEDDING_ANN_THRESHOLD: int = 2000
+    ENABLE_EMBEDDING_INDEX: bool = True
     MOOD_PREDICTION_LOOKBACK_DAYS: int = 30
     MOOD_PREDICTION_FORECAST_DAYS: int = 7
+    MOOD_MODEL_CACHE_SIZE: int = 512
+    MOOD_MODEL_KEEP_VERSIONS: int = 3
+    MOOD_RETRAIN_MIN_NEW_ENTRIES: int = 30
+    MOOD_TRAINING_WORKERS: int = 1
+    FORECAST_ACTIVE_DAYS: int = 30
+    DRIFT_WINDOW: int = 14
+    DRIFT_MIN_OBSERVATIONS: int = 5
+    DRIFT_MAE_THRESHOLD: float = 1.5
+    DRIFT_MAE_RATIO: float = 1.5
+    DRIFT_MAX_USERS: int = 10000
     
     # Cache
     CACHE_TTL_SECONDS: int = 3600
@@ -88,6 +118,10 @@ class Settings(BaseSettings):
     REDIS_HOST: str = "localhost"
     REDIS_PORT: int = 6379
     REDIS_DB: int = 0
+    ENABLE_SENTIMENT_CACHE: bool = True
+    SENTIMENT_CACHE_MAX_ENTRIES: int = 10000
+    ENABLE_FORECAST_CACHE: bool = True
+    FORECAST_CACHE_MAX_USERS: int = 10000
     
     # Privacy & Compliance
     ENABLE_GDPR_MODE: bool = True
@@ -109,6 +143,18 @@ class Settings(BaseSettings):
     STREAMLIT_SERVER_ADDRESS: str = "localhost"
     STREAMLIT_THEME: str = "dark"
     
+    @validator("SENTIMENT_BACKEND")
+    def validate_sentiment_backend(cls, v):
+        if v.lower() not in ("torch", "onnx", "onnx-int8"):
+            raise ValueError("SENTIMENT_BACKEND must be one of: torch, onnx, onnx-int8")
+        return v
+    
+    @validator("ZERO_SHOT_MODE")
+    def validate_zero_shot_mode(cls, v):
+        if v.lower() not in ("nli", "embedding"):
+            raise ValueError("ZERO_SHOT_MODE must be one of: nli, embedding")
+        return v
+    
     @validator("SECRET_KEY")
     def validate_secret_key(cls, v):
         if len(v) < 32:
@@ -38,18 +38,8 @@ class AESEncryption:
             Base64 encoded encrypted text
         """
         try:
-            # Generate random IV
-            iv = get_random_bytes(self.block_size)
-            
-            # Create cipher
-            cipher = AES.new(self.key, AES.MODE_CBC, iv)
-            
-            # Pad and encrypt
-            padded_data = pad(plaintext.encode('utf-8'), self.block_size)
-            ciphertext = cipher.encrypt(padded_data)
-            
-            # Combine IV and ciphertext, then base64 encode
-            encrypted_data = iv + ciphertext
+            # Encrypt, then base64 encode IV + ciphertext
+            encrypted_data = self.encrypt_bytes(plaintext.encode('utf-8'))
             encoded_data = base64.b64encode(encrypted_data).decode('utf-8')
             
             return encoded_data
@@ -69,19 +59,9 @@ class AESEncryption:
             Decrypted plaintext
         """
         try:
-            # Base64 decode
+            # Base64 decode, then decrypt IV + ciphertext
             encrypted_data = base64.b64decode(encrypted_text.encode('utf-8'))
-            
-            # Extract IV and ciphertext
-            iv = encrypted_data[:self.block_size]
-            ciphertext = encrypted_data[self.block_size:]
-            
-            # Create cipher
-            cipher = AES.new(self.key, AES.MODE_CBC, iv)
-            
-            # Decrypt and unpad
-            padded_plaintext = cipher.decrypt(ciphertext)
-            plaintext = unpad(padded_plaintext, self.block_size)
+            plaintext = self.decrypt_bytes(encrypted_data)
             
             return plaintext.decode('utf-8')
             
@@ -89,6 +69,41 @@ class AESEncryption:
             logger.error(f"Decryption failed: {e}")
             raise
     
+    def encrypt_bytes(self, data: bytes) -> bytes:
+        """
+        Encrypt binary data using AES-256-CBC
+        
+        Args:
+            data: Bytes to encrypt
+            
+        Returns:
+            Random IV followed by the ciphertext
+        """
+        # Generate random IV
+        iv = get_random_bytes(self.block_size)
+        
+        # Create cipher, pad and encrypt
+        cipher = AES.new(self.key, AES.MODE_CBC, iv)
+        return iv + cipher.encrypt(pad(data, self.block_size))
+    
+    def decrypt_bytes(self, encrypted_data: bytes) -> bytes:
+        """
+        Decrypt binary data produced by encrypt_bytes
+        
+        Args:
+            encrypted_data: IV followed by the ciphertext
+            
+        Returns:
+            Decrypted bytes
+        """
+        # Extract IV and ciphertext
+        iv = encrypted_data[:self.block_size]
+        ciphertext = encrypted_data[self.block_size:]
+        
+        # Create cipher, decrypt and unpad
+        cipher = AES.new(self.key, AES.MODE_CBC, iv)
+        return unpad(cipher.decrypt(ciphertext), self.block_size)
+    
     def encrypt_dict(self, data: dict) -> dict:
         """
         Encrypt dictionary values
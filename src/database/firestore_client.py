@@ -6,16 +6,20 @@ Handles all database operations with encryption
 import firebase_admin
 from firebase_admin import firestore
 from google.cloud.firestore_v1 import FieldFilter
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 from datetime import datetime
 import logging
 
 from src.config import settings
 from src.database.encryption import encrypt_sensitive_data, decrypt_sensitive_data
+from src.ai.feature_store import FEATURE_WINDOW, seed_feature_state, update_feature_state
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Firestore allows at most 500 writes per batch
+MAX_BATCH_WRITES = 500
+
 
 class FirestoreClient:
     """Firestore database operations with encryption"""
@@ -176,6 +180,14 @@ class FirestoreClient:
             for session in sessions:
                 session.reference.delete()
             
+            # Delete materialized forecast
+            self.db.collection(settings.FIRESTORE_COLLECTION_FORECASTS).document(uid).delete()
+            
+            # Delete journal embeddings (local files, imported here to keep the AI stack optional)
+            from src.ai.embedding_index import embedding_index
+            if not embedding_index.delete_user(uid):
+                return False
+            
             logger.info(f"User and related data deleted: {uid}")
             return True
             
@@ -207,6 +219,9 @@ class FirestoreClient:
             doc_ref = self.db.collection(settings.FIRESTORE_COLLECTION_MOODS).add(mood_data)
             entry_id = doc_ref[1].id
             
+            if 'mood_score' in mood_data:
+                self._update_mood_features(uid, mood_data['mood_score'], mood_data['created_at'])
+            
             logger.info(f"Mood entry created for user {uid}: {entry_id}")
             return entry_id
             
@@ -214,6 +229,131 @@ class FirestoreClient:
             logger.error(f"Failed to create mood entry for {uid}: {e}")
             return None
     
+    def _update_mood_features(self, uid: str, mood_score: float, created_at: datetime):
+        """
+        Update the incremental feature state stored on the user document
+        
+        Args:
+            uid: User ID
+            mood_score: Score of the new entry
+            created_at: Timestamp of the new entry
+        """
+        try:
+            user_ref = self.db.collection(settings.FIRESTORE_COLLECTION_USERS).document(uid)
+            
+            # Read-modify-write in a transaction so concurrent entries are not lost
+            @firestore.transactional
+            def update(transaction):
+                user_doc = user_ref.get(transaction=transaction)
+                state = (user_doc.to_dict() or {}).get('mood_features') if user_doc.exists else None
+                
+                if state is None:
+                    # First update for this user: seed from existing entries (includes the new one)
+                    state = self._seed_mood_features(uid, transaction)
+                else:
+                    state = update_feature_state(state, mood_score, created_at)
+                
+                transaction.set(user_ref, {'mood_features': state}, merge=True)
+            
+            update(self.db.transaction())
+            
+        except Exception as e:
+            # The entry itself is saved; forecasts fall back to the raw history
+            logger.warning(f"Failed to update mood features for {uid}: {e}")
+    
+    def _seed_mood_features(self, uid: str, transaction: Any = None) -> Dict[str, Any]:
+        """
+        Build a user's feature state from the entries already stored
+        
+        Count and sum come from an aggregation over every entry, the recent
+        window from the latest FEATURE_WINDOW entries.
+        
+        Args:
+            uid: User ID
+            transaction: Transaction to read in
+            
+        Returns:
+            Feature state
+        """
+        entries = self.db.collection(settings.FIRESTORE_COLLECTION_MOODS)\
+            .where(filter=FieldFilter('user_id', '==', uid))
+        
+        totals = entries.count(alias='count').sum('mood_score', alias='sum').get(transaction=transaction)
+        values = {result.alias: result.value for result in totals[0]}
+        
+        recent = entries.order_by('created_at', direction=firestore.Query.DESCENDING)\
+            .limit(FEATURE_WINDOW)\
+            .stream(transaction=transaction)
+        
+        return seed_feature_state(
+            [entry.to_dict() for entry in recent],
+            values.get('count') or 0,
+            values.get('sum') or 0.0
+        )
+    
+    def get_mood_features(self, uid: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the user's incremental mood feature state
+        
+        Args:
+            uid: User ID
+            
+        Returns:
+            Feature state or None
+        """
+        try:
+            user_doc = self.db.collection(settings.FIRESTORE_COLLECTION_USERS).document(uid).get()
+            if not user_doc.exists:
+                return None
+            return user_doc.to_dict().get('mood_features')
+            
+        except Exception as e:
+            logger.error(f"Failed to get mood features for {uid}: {e}")
+            return None
+    
+    def get_drift_state(self, uid: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the user's stored forecast drift state (see src.ai.drift_monitor)
+        
+        Args:
+            uid: User ID
+            
+        Returns:
+            Drift state or None
+        """
+        try:
+            user_doc = self.db.collection(settings.FIRESTORE_COLLECTION_USERS).document(uid).get()
+            if not user_doc.exists:
+                return None
+            return user_doc.to_dict().get('forecast_drift')
+            
+        except Exception as e:
+            logger.error(f"Failed to get drift state for {uid}: {e}")
+            return None
+    
+    def save_drift_state(self, uid: str, state: Optional[Dict[str, Any]]) -> bool:
+        """
+        Store the user's forecast drift state next to their mood features
+        
+        Args:
+            uid: User ID
+            state: Output of DriftMonitor.export_state (None = nothing to store)
+            
+        Returns:
+            Success status
+        """
+        if state is None:
+            return False
+        try:
+            # update replaces the whole map, so scored dates do not linger
+            self.db.collection(settings.FIRESTORE_COLLECTION_USERS).document(uid)\
+                .update({'forecast_drift': state})
+            return True
+            
+        except Exception as e:
+            logger.error(f"Failed to save drift state for {uid}: {e}")
+            return False
+    
     def get_mood_entries(self, uid: str, limit: int = 30) -> List[Dict[str, Any]]:
         """
         Get user's mood entries
@@ -252,6 +392,269 @@ class FirestoreClient:
             logger.error(f"Failed to get mood entries for {uid}: {e}")
             return []
     
+    def get_mood_scores(self, uid: str, limit: int = 30) -> List[Dict[str, Any]]:
+        """
+        Get the scores of a user's latest mood entries
+        
+        Only mood_score and created_at are read, so journal text is neither
+        transferred nor decrypted (forecasting needs nothing else).
+        
+        Args:
+            uid: User ID
+            limit: Maximum number of entries
+            
+        Returns:
+            List of {mood_score, created_at} dicts, newest first
+        """
+        try:
+            entries = self.db.collection(settings.FIRESTORE_COLLECTION_MOODS)\
+                .where(filter=FieldFilter('user_id', '==', uid))\
+                .order_by('created_at', direction=firestore.Query.DESCENDING)\
+                .select(['mood_score', 'created_at'])\
+                .limit(limit)\
+                .stream()
+            
+            return [entry.to_dict() or {} for entry in entries]
+            
+        except Exception as e:
+            logger.error(f"Failed to get mood scores for {uid}: {e}")
+            return []
+    
+    def get_mood_entries_by_ids(self, uid: str, entry_ids: List[str]) -> List[Dict[str, Any]]:
+        """
+        Get specific mood entries of a user, in the order given
+
+        Args:
+            uid: User ID
+            entry_ids: Mood entry IDs
+
+        Returns:
+            List of mood entries (entries not owned by the user are skipped, and
+            journal text that fails to decrypt is left out)
+        """
+        try:
+            collection = self.db.collection(settings.FIRESTORE_COLLECTION_MOODS)
+            snapshots = self.db.get_all([collection.document(entry_id) for entry_id in entry_ids])
+            by_id = {snapshot.id: snapshot for snapshot in snapshots if snapshot.exists}
+
+            mood_entries = []
+            for entry_id in entry_ids:
+                snapshot = by_id.get(entry_id)
+                if snapshot is None:
+                    continue
+                entry_data = snapshot.to_dict()
+                if entry_data.get('user_id') != uid:
+                    continue
+                entry_data['id'] = snapshot.id
+
+                # Decrypt journal text
+                if 'journal_text' in entry_data:
+                    try:
+                        entry_data['journal_text'] = decrypt_sensitive_data(entry_data['journal_text'])
+                    except Exception as e:
+                        # Never show ciphertext as journal text
+                        logger.warning(f"Failed to decrypt mood entry {entry_id}: {e}")
+                        del entry_data['journal_text']
+
+                mood_entries.append(entry_data)
+
+            return mood_entries
+
+        except Exception as e:
+            logger.error(f"Failed to get mood entries by id for {uid}: {e}")
+            return []
+
+    def iter_mood_entry_pages(self, page_size: int = 200,
+                              start_after_id: Optional[str] = None) -> Iterator[List[Any]]:
+        """
+        Stream all mood entries in pages ordered by document ID
+        
+        Journal text is left encrypted so callers can decrypt in parallel.
+        
+        Args:
+            page_size: Documents per page
+            start_after_id: Resume after this document ID
+            
+        Yields:
+            Lists of document snapshots
+        """
+        collection = self.db.collection(settings.FIRESTORE_COLLECTION_MOODS)
+        query = collection.order_by('__name__').limit(page_size)
+        
+        cursor = None
+        if start_after_id:
+            cursor = collection.document(start_after_id).get()
+            if not cursor.exists:
+                logger.warning(f"Resume cursor {start_after_id} no longer exists, starting over")
+                cursor = None
+        
+        while True:
+            page_query = query.start_after(cursor) if cursor is not None else query
+            page = list(page_query.stream())
+            
+            if not page:
+                return
+            
+            yield page
+            
+            if len(page) < page_size:
+                return
+            cursor = page[-1]
+    
+    def iter_mood_entries_by_user(self, page_size: int = 500) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Stream every user's mood scores, grouped by user and oldest first
+        
+        Needs a composite index on mood_entries (user_id ASC, created_at ASC).
+        
+        Args:
+            page_size: Documents per page
+            
+        Yields:
+            Lists of entries with user_id, mood_score and created_at
+        """
+        query = self.db.collection(settings.FIRESTORE_COLLECTION_MOODS)\
+            .order_by('user_id')\
+            .order_by('created_at')\
+            .select(['user_id', 'mood_score', 'created_at'])\
+            .limit(page_size)
+        
+        cursor = None
+        while True:
+            page_query = query.start_after(cursor) if cursor is not None else query
+            page = list(page_query.stream())
+            
+            if not page:
+                return
+            
+            yield [doc.to_dict() for doc in page]
+            
+            if len(page) < page_size:
+                return
+            cursor = page[-1]
+    
+    def batch_update_mood_entries(self, updates: List[Tuple[str, Dict[str, Any]]]) -> int:
+        """
+        Apply field updates to many mood entries with batched writes
+        
+        Args:
+            updates: (entry ID, fields to update) pairs
+            
+        Returns:
+            Number of entries updated
+        """
+        collection = self.db.collection(settings.FIRESTORE_COLLECTION_MOODS)
+        written = 0
+        
+        for start in range(0, len(updates), MAX_BATCH_WRITES):
+            batch = self.db.batch()
+            chunk = updates[start:start + MAX_BATCH_WRITES]
+            for entry_id, fields in chunk:
+                batch.update(collection.document(entry_id), fields)
+            batch.commit()
+            written += len(chunk)
+        
+        return written
+    
+    def iter_active_users(self, since: datetime) -> Iterator[Tuple[str, Optional[Dict[str, Any]]]]:
+        """
+        Stream users who logged a mood entry since a given time
+        
+        Users with a feature state are found from it; users without one (e.g.
+        entries written before feature states existed, or a failed update) are
+        found from their recent mood entries instead.
+        
+        Args:
+            since: Earliest latest-entry timestamp
+            
+        Yields:
+            (user ID, mood feature state or None) pairs, each user once
+        """
+        seen = set()
+        
+        users = self.db.collection(settings.FIRESTORE_COLLECTION_USERS)\
+            .where(filter=FieldFilter('mood_features.last_created_at', '>=', since))\
+            .select(['mood_features'])\
+            .stream()
+        
+        for user in users:
+            seen.add(user.id)
+            yield user.id, (user.to_dict() or {}).get('mood_features')
+        
+        # Fall back to the latest entries for users without a current feature state
+        entries = self.db.collection(settings.FIRESTORE_COLLECTION_MOODS)\
+            .where(filter=FieldFilter('created_at', '>=', since))\
+            .select(['user_id'])\
+            .stream()
+        
+        for entry in entries:
+            uid = (entry.to_dict() or {}).get('user_id')
+            if uid and uid not in seen:
+                seen.add(uid)
+                yield uid, None
+    
+    # Forecast Operations
+    def save_forecast(self, uid: str, forecast: Dict[str, Any]) -> bool:
+        """
+        Store the user's materialized forecast (one document per user)
+        
+        Args:
+            uid: User ID
+            forecast: Compact forecast document
+            
+        Returns:
+            Success status
+        """
+        try:
+            self.db.collection(settings.FIRESTORE_COLLECTION_FORECASTS).document(uid)\
+                .set({**forecast, 'user_id': uid})
+            return True
+            
+        except Exception as e:
+            logger.error(f"Failed to save forecast for {uid}: {e}")
+            return False
+    
+    def save_forecasts(self, forecasts: List[Tuple[str, Dict[str, Any]]]) -> int:
+        """
+        Store many materialized forecasts with batched writes
+        
+        Args:
+            forecasts: (user ID, compact forecast document) pairs
+            
+        Returns:
+            Number of forecasts written
+        """
+        collection = self.db.collection(settings.FIRESTORE_COLLECTION_FORECASTS)
+        written = 0
+        
+        for start in range(0, len(forecasts), MAX_BATCH_WRITES):
+            batch = self.db.batch()
+            chunk = forecasts[start:start + MAX_BATCH_WRITES]
+            for uid, forecast in chunk:
+                batch.set(collection.document(uid), {**forecast, 'user_id': uid})
+            batch.commit()
+            written += len(chunk)
+        
+        return written
+    
+    def get_forecast(self, uid: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the user's materialized forecast
+        
+        Args:
+            uid: User ID
+            
+        Returns:
+            Compact forecast document or None
+        """
+        try:
+            doc = self.db.collection(settings.FIRESTORE_COLLECTION_FORECASTS).document(uid).get()
+            return doc.to_dict() if doc.exists else None
+            
+        except Exception as e:
+            logger.error(f"Failed to get forecast for {uid}: {e}")
+            return None
+    
     # Insights Operations
     def save_insight(self, uid: str, insight_data: Dict[str, Any]) -> Optional[str]:
         """
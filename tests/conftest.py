@@ -140,3 +140,31 @@ def pytest_configure(config):
     config.addinivalue_line(
         "markers", "slow: mark test as slow running"
     )
+
+
+@pytest.fixture
+def mood_predictor_factory(tmp_path):
+    """Build MoodPredictors with a temporary model store, private cache and drift monitor, and in-process training"""
+    from concurrent.futures import ThreadPoolExecutor
+    from src.ai.drift_monitor import DriftMonitor
+    from src.ai.forecast_cache import ForecastCache
+    from src.ai.mood_model_store import MoodModelStore
+    from src.ai.mood_predictor import MoodPredictor
+    from src.ai.training_scheduler import TrainingScheduler
+    
+    executors = []
+    
+    def factory(store=None):
+        executor = ThreadPoolExecutor(max_workers=1)
+        executors.append(executor)
+        return MoodPredictor(
+            store=store or MoodModelStore(store_dir=tmp_path / "mood"),
+            scheduler=TrainingScheduler(executor=executor),
+            cache=ForecastCache(),
+            monitor=DriftMonitor()
+        )
+    
+    yield factory
+    
+    for executor in executors:
+        executor.shutdown()
@@ -0,0 +1,136 @@
+"""
+Unit tests for the sentiment backfill script
+"""
+
+import json
+import pytest
+from types import SimpleNamespace
+
+import scripts.backfill_sentiment as backfill
+from src.config import settings
+
+
+class FakeDoc:
+    """Firestore document snapshot stand-in"""
+
+    def __init__(self, doc_id, data):
+        self.id = doc_id
+        self._data = data
+
+    def to_dict(self):
+        return dict(self._data)
+
+
+class FakeClient:
+    """Firestore client over an in-memory collection ordered by document ID"""
+
+    def __init__(self, entries, fail_after_pages=None):
+        self.docs = [FakeDoc(doc_id, data) for doc_id, data in sorted(entries.items())]
+        self.fail_after_pages = fail_after_pages
+        self.db = SimpleNamespace()
+        self.starts = []
+        self.updates = []
+
+    def iter_mood_entry_pages(self, page_size, start_after_id=None):
+        self.starts.append(start_after_id)
+        docs = [d for d in self.docs if start_after_id is None or d.id > start_after_id]
+        for n, start in enumerate(range(0, len(docs), page_size)):
+            if self.fail_after_pages is not None and n >= self.fail_after_pages:
+                raise RuntimeError("connection lost")
+            yield docs[start:start + page_size]
+
+    def batch_update_mood_entries(self, updates):
+        self.updates.extend(updates)
+        return len(updates)
+
+
+class FakeAnalyzer:
+    """Sentiment analyzer that records its batches and fails on the text "unreadable" """
+
+    def __init__(self):
+        self.batches = []
+        self.cascade_used = False
+
+    def analyze_texts(self, texts, use_cascade=True):
+        self.batches.append(list(texts))
+        self.cascade_used = self.cascade_used or use_cascade
+        return [
+            {"success": False, "error": "bad input"} if text == "unreadable" else
+            {"success": True, "sentiment": "positive", "confidence": 0.9, "mood_label": "good", "tier": "transformer"}
+            for text in texts
+        ]
+
+
+@pytest.fixture(autouse=True)
+def plain_text(monkeypatch):
+    """Journal text is stored unencrypted in these tests"""
+    monkeypatch.setattr(backfill, "_decrypt", lambda text: text or None)
+
+
+def make_entries(n):
+    return {f"e{i:02d}": {"journal_text": f"entry {i}", "mood_score": 5} for i in range(n)}
+
+
+class TestBackfillSentiment:
+    """Test batching, checkpoint resume and skipped entries"""
+
+    def test_scores_in_pages(self, tmp_path):
+        """Test that each page is scored in one batch and written back"""
+        client, analyzer = FakeClient(make_entries(5)), FakeAnalyzer()
+
+        state = backfill.backfill_sentiment(page_size=2, workers=2, checkpoint_path=tmp_path / "cp.json",
+                                            client=client, analyzer=analyzer)
+
+        assert [len(batch) for batch in analyzer.batches] == [2, 2, 1]
+        assert analyzer.cascade_used is False  # stored scores come from the model, not the lexicon
+        assert [doc_id for doc_id, _ in client.updates] == list(make_entries(5))
+        assert client.updates[0][1]["ai_model"] == settings.SENTIMENT_MODEL
+        assert client.updates[0][1]["ai_tier"] == "transformer"
+        assert (state["processed"], state["updated"], state["skipped"]) == (5, 5, 0)
+        assert state["last_id"] == "e04" and "completed_at" in state
+
+    def test_skips_entries_without_text_or_result(self, tmp_path):
+        """Test that missing text and failed analyses are counted as skipped, not written"""
+        entries = make_entries(3)
+        entries["e00"] = {"mood_score": 4}
+        entries["e01"]["journal_text"] = "unreadable"
+        client, analyzer = FakeClient(entries), FakeAnalyzer()
+
+        state = backfill.backfill_sentiment(page_size=10, checkpoint_path=tmp_path / "cp.json",
+                                            client=client, analyzer=analyzer)
+
+        assert analyzer.batches == [["unreadable", "entry 2"]]
+        assert [doc_id for doc_id, _ in client.updates] == ["e02"]
+        assert (state["processed"], state["updated"], state["skipped"]) == (3, 1, 2)
+
+    def test_resumes_from_checkpoint(self, tmp_path):
+        """Test that an interrupted run continues after the last finished page"""
+        checkpoint = tmp_path / "cp.json"
+        entries = make_entries(5)
+
+        with pytest.raises(RuntimeError):
+            backfill.backfill_sentiment(page_size=2, checkpoint_path=checkpoint,
+                                        client=FakeClient(entries, fail_after_pages=1), analyzer=FakeAnalyzer())
+        assert json.loads(checkpoint.read_text())["last_id"] == "e01"
+
+        client, analyzer = FakeClient(entries), FakeAnalyzer()
+        state = backfill.backfill_sentiment(page_size=2, checkpoint_path=checkpoint,
+                                            client=client, analyzer=analyzer)
+
+        assert client.starts == ["e01"]
+        assert [doc_id for doc_id, _ in client.updates] == ["e02", "e03", "e04"]
+        assert (state["processed"], state["updated"]) == (5, 5)
+
+    def test_restarts_for_another_model_or_on_request(self, tmp_path):
+        """Test that a checkpoint from another model, or --restart, starts from the beginning"""
+        checkpoint = tmp_path / "cp.json"
+        checkpoint.write_text(json.dumps({"model": "old-model", "last_id": "e03", "processed": 4,
+                                          "updated": 4, "skipped": 0}))
+
+        client = FakeClient(make_entries(5))
+        state = backfill.backfill_sentiment(checkpoint_path=checkpoint, client=client, analyzer=FakeAnalyzer())
+        assert client.starts == [None] and state["processed"] == 5
+
+        client = FakeClient(make_entries(5))
+        backfill.backfill_sentiment(checkpoint_path=checkpoint, restart=True, client=client, analyzer=FakeAnalyzer())
+        assert client.starts == [None]
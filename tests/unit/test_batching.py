@@ -0,0 +1,90 @@
+"""
+Unit tests for micro-batching
+"""
+
+import threading
+from queue import Full
+import pytest
+from src.ai.batching import MicroBatcher
+
+
+class TestMicroBatcher:
+    """Test request batching"""
+
+    def test_concurrent_requests_share_batch(self):
+        """Test that concurrent submissions are grouped into one handler call"""
+        batches = []
+
+        def handler(items):
+            batches.append(list(items))
+            return [item * 2 for item in items]
+
+        batcher = MicroBatcher(handler, max_batch_size=8, max_wait_ms=200)
+        futures = [batcher.submit(i) for i in range(5)]
+
+        assert [f.result(timeout=5) for f in futures] == [0, 2, 4, 6, 8]
+        assert len(batches) == 1
+
+    def test_batch_size_limit(self):
+        """Test that batches never exceed max_batch_size"""
+        batches = []
+
+        def handler(items):
+            batches.append(len(items))
+            return items
+
+        batcher = MicroBatcher(handler, max_batch_size=3, max_wait_ms=50)
+        futures = [batcher.submit(i) for i in range(7)]
+
+        assert [f.result(timeout=5) for f in futures] == list(range(7))
+        assert max(batches) <= 3
+
+    def test_handler_error_propagates(self):
+        """Test that a failing batch fails every caller in it"""
+        def handler(items):
+            raise ValueError("model exploded")
+
+        batcher = MicroBatcher(handler, max_batch_size=4, max_wait_ms=10)
+
+        with pytest.raises(ValueError):
+            batcher.process("text", timeout=5)
+
+    def test_process_from_threads(self):
+        """Test blocking process calls from many threads"""
+        batcher = MicroBatcher(lambda items: [i + 1 for i in items], max_batch_size=4, max_wait_ms=5)
+        results = {}
+
+        def worker(n):
+            results[n] = batcher.process(n, timeout=5)
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(10)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert results == {n: n + 1 for n in range(10)}
+
+    def test_bounded_queue_rejects(self):
+        """Test backpressure when the pending queue is full"""
+        release = threading.Event()
+
+        def handler(items):
+            release.wait(5)
+            return items
+
+        batcher = MicroBatcher(handler, max_batch_size=1, max_wait_ms=0, max_queue_size=1)
+        first = batcher.submit(1)
+
+        # Wait for the worker to take the first item, then fill the queue
+        while batcher.queue_depth():
+            pass
+        second = batcher.submit(2)
+
+        with pytest.raises(Full):
+            batcher.submit(3)
+
+        release.set()
+        assert first.result(timeout=5) == 1
+        assert second.result(timeout=5) == 2
+        assert batcher.get_stats()["rejected"] == 1
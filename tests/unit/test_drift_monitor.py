@@ -0,0 +1,128 @@
+"""
+Unit tests for drift-triggered retraining
+"""
+
+from datetime import datetime, timedelta
+from src.ai.drift_monitor import DriftMonitor
+
+
+def make_history(days, start=datetime(2024, 1, 1), shift_from=None):
+    """Daily entries that dip every weekend; scores drop by 3 from shift_from on"""
+    history = []
+    for i in range(days):
+        date = start + timedelta(days=i)
+        score = 4 if date.weekday() >= 5 else 8
+        if shift_from is not None and i >= shift_from:
+            score -= 3
+        history.append({'mood_score': score, 'created_at': date})
+    return history
+
+
+def forecast(day, score, version=1, baseline=False):
+    """One-day forecast result"""
+    return {
+        'success': True, 'baseline': baseline, 'model_version': version,
+        'predictions': [{'date': day.strftime("%Y-%m-%d"), 'predicted_mood': score, 'mood_label': 'okay'}]
+    }
+
+
+class TestDriftMonitor:
+    """Test forecast scoring and retrain triggers"""
+
+    def test_scores_forecasts(self):
+        """Test that logged moods score the matching forecast"""
+        monitor = DriftMonitor(min_observations=2)
+        day = datetime(2024, 3, 1, 20)
+
+        monitor.record_forecast("u1", forecast(day, 6.0))
+        monitor.record_actual("u1", 8, day)
+        monitor.record_actual("u1", 1, day)  # already scored
+
+        assert monitor.rolling_error("u1") == 2.0
+        assert monitor.get_stats()['scored_forecasts'] == 1
+
+    def test_new_model_resets_errors(self):
+        """Test that errors belong to the current model version"""
+        monitor = DriftMonitor()
+        day = datetime(2024, 3, 1)
+        monitor.record_forecast("u1", forecast(day, 6.0))
+        monitor.record_actual("u1", 9, day)
+
+        monitor.record_forecast("u1", forecast(day + timedelta(days=1), 6.0, version=2))
+        monitor.record_forecast("u1", forecast(day + timedelta(days=2), 6.0, baseline=True))
+
+        assert monitor.rolling_error("u1") is None
+        assert monitor.get_user_stats("u1")['pending_forecasts'] == 1
+
+    def test_retrain_reasons(self):
+        """Test the error and volume triggers"""
+        monitor = DriftMonitor(min_observations=2, mae_threshold=1.5, mae_ratio=2.0)
+        artifact = {'backtest_mae': 0.5}
+        day = datetime(2024, 3, 1)
+        for i, actual in enumerate([7.2, 7.3]):
+            monitor.record_forecast("u1", forecast(day + timedelta(days=i), 6.0))
+            monitor.record_actual("u1", actual, day + timedelta(days=i))
+
+        # 1.25 MAE: under the absolute threshold but over 2x the backtest MAE
+        assert monitor.retrain_reason("u1", artifact, 2, volume_threshold=30) == "drift"
+        assert monitor.retrain_reason("u1", {}, 2, volume_threshold=30) is None
+        assert monitor.retrain_reason("u1", {}, 30, volume_threshold=30) == "volume"
+        assert monitor.retrain_reason("u1", artifact, 0, volume_threshold=30) is None
+
+    def test_state_survives_restart(self):
+        """Test that a restored monitor scores forecasts recorded by another process"""
+        day = datetime(2024, 1, 1)
+        before = DriftMonitor(window=5, min_observations=1, mae_threshold=1.0)
+        before.record_forecast("u1", forecast(day, 6.0))
+        before.record_forecast("u1", forecast(day + timedelta(days=1), 6.0))
+        before.record_actual("u1", 8, day)
+        state = before.export_state("u1")
+
+        after = DriftMonitor(window=5, min_observations=1, mae_threshold=1.0)
+        after.restore_state("u1", state)
+        after.record_actual("u1", 9, day + timedelta(days=1))
+
+        assert state == {'model_version': 1, 'pending': {"2024-01-02": 6.0}, 'errors': [2.0],
+                         'last_retrain_reason': None}
+        assert after.rolling_error("u1") == 2.5
+        assert after.retrain_reason("u1", {}, 1, volume_threshold=30) == "drift"
+        assert after.export_state("u2") is None
+
+
+class TestDriftRetraining:
+    """Test that MoodPredictor retrains on drift, not on every few entries"""
+
+    def run_days(self, predictor, history, start, days):
+        """Forecast, then log each day's mood like the app does"""
+        for n in range(start, start + days):
+            predictor.predict_mood(history[:n], uid="u1")
+            predictor.scheduler.wait_idle(timeout=30)
+            entry = history[n]
+            predictor.monitor.record_actual("u1", entry['mood_score'], entry['created_at'])
+        return predictor.predict_mood(history[:start + days], uid="u1")
+
+    def test_stable_user_is_not_retrained(self, mood_predictor_factory):
+        """Test that accurate forecasts skip retraining below the volume threshold"""
+        predictor = mood_predictor_factory()
+        history = make_history(50)
+        predictor.predict_mood(history[:28], uid="u1")
+        predictor.scheduler.wait_idle(timeout=30)
+
+        result = self.run_days(predictor, history, 28, 14)
+
+        assert result['model_version'] == 1
+        assert predictor.get_training_stats()['retrains'] == {"drift": 0, "volume": 0}
+
+    def test_shifted_user_is_retrained(self, mood_predictor_factory):
+        """Test that a changed mood pattern triggers a prompt retrain"""
+        predictor = mood_predictor_factory()
+        history = make_history(50, shift_from=28)
+        predictor.predict_mood(history[:28], uid="u1")
+        predictor.scheduler.wait_idle(timeout=30)
+
+        self.run_days(predictor, history, 28, 8)
+        stats = predictor.get_training_stats("u1")
+
+        assert stats['retrains']['drift'] >= 1
+        assert stats['model_version'] >= 2
+        assert stats['drift']['last_retrain_reason'] == "drift"
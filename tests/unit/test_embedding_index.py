@@ -0,0 +1,87 @@
+"""
+Unit tests for the journal embedding index
+"""
+
+import io
+import numpy as np
+from src.ai.embedding_index import JournalEmbeddingIndex
+
+VOCABULARY = ["work", "deadline", "stress", "sleep", "tired", "friend", "dinner", "happy"]
+
+
+def bag_of_words(texts):
+    """Deterministic stand-in for the sentence embedding model"""
+    return np.array([
+        [text.lower().count(word) for word in VOCABULARY] for text in texts
+    ], dtype=np.float32) + 1e-3
+
+
+class XorCipher:
+    """Reversible stand-in for the AES cipher"""
+
+    def encrypt_bytes(self, data):
+        return bytes(b ^ 0x5A for b in data)
+
+    def decrypt_bytes(self, data):
+        return bytes(b ^ 0x5A for b in data)
+
+
+def make_index(path, **kwargs):
+    return JournalEmbeddingIndex(index_dir=path, model_name="fake", embed_fn=bag_of_words,
+                                 cipher=XorCipher(), **kwargs)
+
+
+class TestJournalEmbeddingIndex:
+    """Test indexing and similarity search"""
+
+    def test_similar_entries_ranked(self, tmp_path):
+        """Test that the closest entries come first and the query entry is excluded"""
+        index = make_index(tmp_path)
+        index.add_entry("u1", "e1", "Work deadline stress again")
+        index.add_entry("u1", "e2", "Dinner with a friend, happy")
+        index.add_entry("u1", "e3", "More work stress before the deadline")
+
+        results = index.similar_entries("u1", "e1", k=2)
+
+        assert [r["entry_id"] for r in results] == ["e3", "e2"]
+        assert results[0]["similarity"] > results[1]["similarity"]
+
+    def test_persisted_encrypted_as_float16(self, tmp_path):
+        """Test that vectors survive a new instance and are stored encrypted and compactly"""
+        make_index(tmp_path).add_entry("u1", "e1", "Tired, no sleep")
+
+        raw = (tmp_path / "u1.npz.enc").read_bytes()
+        assert not raw.startswith(b"PK")  # not a readable .npz archive
+        with np.load(io.BytesIO(XorCipher().decrypt_bytes(raw))) as data:
+            assert data["vectors"].dtype == np.float16
+
+        index = make_index(tmp_path)
+        assert index.search("u1", "could not sleep, so tired", k=1)[0]["entry_id"] == "e1"
+
+    def test_users_are_isolated(self, tmp_path):
+        """Test that searches only see the user's own entries"""
+        index = make_index(tmp_path)
+        index.add_entry("u1", "e1", "Work stress")
+
+        assert index.search("u2", "Work stress") == []
+
+    def test_concurrent_writers_merge(self, tmp_path):
+        """Test that instances sharing a directory keep each other's entries"""
+        first, second = make_index(tmp_path), make_index(tmp_path)
+        first.add_entry("u1", "e1", "Work stress")
+        second.add_entry("u1", "e2", "Dinner with a friend")
+        first.add_entry("u1", "e3", "Tired, no sleep")
+
+        assert {r["entry_id"] for r in make_index(tmp_path).search("u1", "work", k=5)} == {"e1", "e2", "e3"}
+        assert {r["entry_id"] for r in second.search("u1", "work", k=5)} == {"e1", "e2", "e3"}
+
+    def test_delete_user(self, tmp_path):
+        """Test that deletion removes the file and the resident copy"""
+        index = make_index(tmp_path)
+        index.add_entry("u1", "e1", "Work stress")
+        index.add_entry("u2", "e2", "Work stress")
+
+        assert index.delete_user("u1") is True
+        assert not (tmp_path / "u1.npz.enc").exists()
+        assert index.search("u1", "Work stress") == []
+        assert index.search("u2", "Work stress")[0]["entry_id"] == "e2"
@@ -0,0 +1,58 @@
+"""
+Unit tests for embedding-based zero-shot classification
+"""
+
+import numpy as np
+from src.ai.embedding_zero_shot import EmbeddingZeroShotClassifier
+
+VOCABULARY = ["work", "sleep", "money", "lonely"]
+
+
+class CountingEmbedder:
+    """Bag-of-words embedder that records how many texts it encoded"""
+
+    def __init__(self):
+        self.encoded = 0
+
+    def __call__(self, texts):
+        self.encoded += len(texts)
+        return np.array([
+            [text.lower().count(word) for word in VOCABULARY] for text in texts
+        ], dtype=np.float32) + 1e-3
+
+
+class TestEmbeddingZeroShot:
+    """Test label caching and scoring"""
+
+    def test_label_vectors_encoded_once(self, tmp_path):
+        """Test that repeated calls only encode the texts"""
+        embedder = CountingEmbedder()
+        classifier = EmbeddingZeroShotClassifier(embed_fn=embedder, head_path=tmp_path / "head.json")
+        labels = ["work", "sleep", "money"]
+
+        classifier.classify(["work again"], labels)
+        classifier.classify(["no sleep"], labels)
+
+        assert embedder.encoded == len(labels) + 2
+
+    def test_scores_all_labels(self, tmp_path):
+        """Test that every label gets an independent 0-1 score and the right one ranks first"""
+        classifier = EmbeddingZeroShotClassifier(embed_fn=CountingEmbedder(), head_path=tmp_path / "head.json")
+
+        scores = classifier.classify(["Worried about money and rent"], ["work", "money", "lonely"])[0]
+
+        assert set(scores) == {"work", "money", "lonely"}
+        assert all(0.0 <= s <= 1.0 for s in scores.values())
+        assert max(scores, key=scores.get) == "money"
+
+    def test_fitted_head_is_saved_and_loaded(self, tmp_path):
+        """Test that calibration persists for new instances"""
+        head_path = tmp_path / "head.json"
+        classifier = EmbeddingZeroShotClassifier(embed_fn=CountingEmbedder(), head_path=head_path)
+        texts = ["work work", "sleep", "work late", "lonely"]
+        targets = [["work"], ["sleep"], ["work"], ["lonely"]]
+
+        result = classifier.fit_head(texts, targets, ["work"])
+
+        assert result["success"]
+        assert "work" in EmbeddingZeroShotClassifier(embed_fn=CountingEmbedder(), head_path=head_path).head
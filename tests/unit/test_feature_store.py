@@ -0,0 +1,75 @@
+"""
+Unit tests for the incremental mood feature state
+"""
+
+import pytest
+from datetime import datetime, timedelta
+from src.ai.feature_store import (
+    FEATURE_WINDOW, build_feature_state, latest_features, seed_feature_state, update_feature_state
+)
+from src.ai.mood_model_store import MoodModelStore
+from src.ai.mood_predictor import MoodPredictor, FEATURE_COLUMNS
+
+
+def make_history(days, start=datetime(2024, 1, 1, 8)):
+    """Daily mood entries"""
+    return [
+        {'mood_score': [6, 3, 8, 5, 9, 2, 7][i % 7], 'created_at': start + timedelta(days=i, hours=i % 5)}
+        for i in range(days)
+    ]
+
+
+class TestFeatureState:
+    """Test O(1) feature updates"""
+
+    def test_window_is_bounded(self):
+        """Test that only the recent scores are kept while totals cover everything"""
+        state = build_feature_state(make_history(30))
+
+        assert len(state['recent_scores']) == FEATURE_WINDOW
+        assert state['count'] == 30
+        assert state['sum'] == sum(e['mood_score'] for e in make_history(30))
+
+    def test_update_does_not_modify_input(self):
+        """Test that updates return a new state"""
+        state = build_feature_state(make_history(3))
+        update_feature_state(state, 5, datetime(2024, 2, 1))
+
+        assert state['count'] == 3
+
+    def test_seed_uses_full_history_totals(self):
+        """Test that a seeded state has the full count and sum with the recent window"""
+        history = make_history(30)
+        state = seed_feature_state(history[-FEATURE_WINDOW:], 30, sum(e['mood_score'] for e in history))
+
+        assert state['count'] == 30
+        assert state['recent_scores'] == build_feature_state(history)['recent_scores']
+        assert latest_features(state) == latest_features(build_feature_state(history))
+
+    @pytest.mark.parametrize("days", [7, 8, 20])
+    def test_matches_prepare_features(self, days):
+        """Test that stored features equal the last row of prepare_features"""
+        history = make_history(days)
+        expected = MoodPredictor(store=MoodModelStore()).prepare_features(history)[FEATURE_COLUMNS].iloc[-1]
+
+        features = latest_features(build_feature_state(history))
+
+        for col in FEATURE_COLUMNS:
+            assert features[col] == pytest.approx(float(expected[col]))
+
+
+class TestPredictorFeatureStore:
+    """Test that forecasts read the feature state"""
+
+    def test_fresh_model_skips_history(self, mood_predictor_factory):
+        """Test that the history is not needed once a fresh model exists"""
+        predictor = mood_predictor_factory()
+        history = make_history(30)
+        state = build_feature_state(history)
+
+        predictor.predict_mood(history, uid="u1", feature_state=state)
+        predictor.scheduler.wait_idle(timeout=30)
+        first = predictor.predict_mood(history, uid="u1", feature_state=state)
+        second = predictor.predict_mood([], uid="u1", feature_state=state)
+
+        assert second['predictions'] == first['predictions']
@@ -0,0 +1,45 @@
+"""
+Unit tests for the forecast backtest benchmark (small profile)
+"""
+
+import csv
+from benchmarks.forecast_bench import run_benchmark, write_csv
+from benchmarks.mood_histories import generate_mood_histories
+
+
+class TestMoodHistories:
+    """Test the synthetic population"""
+
+    def test_daily_valid_scores(self):
+        """Test that every user logs one 1-10 score per day"""
+        histories = generate_mood_histories(n_users=5, days=30, seed=1)
+
+        assert len(histories) == 5
+        for history in histories.values():
+            assert len(history) == 30
+            assert all(1 <= e['mood_score'] <= 10 for e in history)
+            assert (history[1]['created_at'] - history[0]['created_at']).days == 1
+
+
+class TestForecastBench:
+    """Test the rolling-origin backtest"""
+
+    def test_small_profile(self, tmp_path):
+        """Test that each variant reports error, latency and memory"""
+        report = run_benchmark(profile="small", variants=["ladder", "baseline"], n_users=4,
+                               workers=1, memory_sample=2)
+        rows = {row['variant']: row for row in report['results']}
+
+        # 42 days, origins every 7 entries from 14 with 7 days ahead: 4 origins per user
+        assert rows['ladder']['forecasts'] == 16
+        assert rows['ladder']['baseline_forecasts'] == 0
+        assert rows['baseline']['baseline_forecasts'] == 16
+        assert len(rows['ladder']['mae_by_horizon']) == 7
+        assert rows['ladder']['fit_p50_ms'] > 0
+        assert rows['ladder']['model_kb'] > 0 and rows['baseline']['model_kb'] is None
+        assert rows['ladder']['peak_fit_kb'] > 0
+
+        path = tmp_path / "bench.csv"
+        write_csv(report, str(path))
+        with open(path) as f:
+            assert [r['variant'] for r in csv.DictReader(f)] == ["ladder", "baseline"]
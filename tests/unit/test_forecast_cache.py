@@ -0,0 +1,101 @@
+"""
+Unit tests for the forecast result cache
+"""
+
+import json
+from datetime import datetime, timedelta
+from src.ai.forecast_cache import ForecastCache, make_forecast_key
+
+
+def make_history(days, start=datetime(2024, 1, 1)):
+    """Daily mood entries"""
+    return [
+        {'mood_score': [6, 3, 8, 5, 9, 2, 7][i % 7], 'created_at': start + timedelta(days=i)}
+        for i in range(days)
+    ]
+
+
+class FakeRedis:
+    """Minimal in-memory stand-in for the redis client"""
+
+    def __init__(self):
+        self.hashes = {}
+
+    def hget(self, name, key):
+        return self.hashes.get(name, {}).get(key)
+
+    def hset(self, name, key, value):
+        self.hashes.setdefault(name, {})[key] = value
+
+    def expire(self, name, seconds):
+        pass
+
+    def delete(self, name):
+        self.hashes.pop(name, None)
+
+    def pipeline(self):
+        return self
+
+    def execute(self):
+        pass
+
+
+class TestForecastCache:
+    """Test per-user caching and invalidation"""
+
+    def test_lru_evicts_users(self):
+        """Test that the least recently used user is dropped"""
+        cache = ForecastCache(max_users=2)
+        for uid in ("a", "b"):
+            cache.set(uid, "k", {"success": True})
+        cache.get("a", "k")
+        cache.set("c", "k", {"success": True})
+
+        assert cache.get("b", "k") is None
+        assert cache.get("a", "k") is not None
+
+    def test_shared_tier(self):
+        """Test that another process's cache serves and invalidates forecasts"""
+        shared = FakeRedis()
+        ForecastCache(redis_client=shared).set("u1", "k", {"success": True})
+        other = ForecastCache(redis_client=shared)
+
+        assert other.get("u1", "k") == {"success": True}
+        assert other.get_stats()["shared_hits"] == 1
+
+        other.invalidate("u1")
+        assert ForecastCache(redis_client=shared).get("u1", "k") is None
+
+    def test_key_uses_timestamps(self):
+        """Test that datetimes and entry IDs both work as the latest entry"""
+        assert make_forecast_key(datetime(2024, 1, 1), 7, 1) == "2024-01-01T00:00:00|7|1"
+        assert make_forecast_key("entry123", 7, None) == "entry123|7|None"
+
+
+class TestPredictorCaching:
+    """Test that repeat forecasts skip the model"""
+
+    def test_repeat_forecast_is_cached(self, mood_predictor_factory):
+        """Test that an unchanged history is served from the cache"""
+        predictor = mood_predictor_factory()
+        history = make_history(30)
+        predictor.predict_mood(history, uid="u1")
+        predictor.scheduler.wait_idle(timeout=30)
+
+        first = predictor.predict_mood(history, uid="u1")
+        second = predictor.predict_mood(history, uid="u1")
+
+        assert second is first
+        assert first['model_version'] == 1
+        assert predictor.cache.get_stats()["memory_hits"] == 1
+
+    def test_new_entry_misses(self, mood_predictor_factory):
+        """Test that a new entry or invalidation forces a new forecast"""
+        predictor = mood_predictor_factory()
+        history = make_history(30)
+        first = predictor.predict_mood(history, uid="u1")
+
+        assert predictor.predict_mood(make_history(31), uid="u1") is not first
+        predictor.record_entry("u1", 7, history[-1]['created_at'])
+        assert predictor.predict_mood(history, uid="u1") is not first
+        assert json.loads(json.dumps(first)) == first
@@ -0,0 +1,42 @@
+"""
+Unit tests for the forecasting model ladder
+"""
+
+import numpy as np
+from src.ai.forecast_models import LONG_HISTORY_ENTRIES, RidgeForecaster, candidate_models, select_model
+
+
+class TestRidgeForecaster:
+    """Test the closed-form ridge model"""
+
+    def test_learns_weekday_profile(self):
+        """Test that one-hot weekdays capture a non-linear weekly pattern"""
+        weekdays = np.arange(70) % 7
+        X = np.column_stack([np.ones(70), weekdays])
+        y = np.where(weekdays == 3, 2.0, 8.0)
+
+        model = RidgeForecaster(alpha=0.01, weekday_column=1).fit(X, y)
+        predictions = model.predict(np.array([[1, 3], [1, 5]]))
+
+        assert predictions[0] < 3 and predictions[1] > 7
+
+
+class TestModelSelection:
+    """Test ladder selection by history length and backtest error"""
+
+    def test_short_histories_skip_boosting(self):
+        """Test that gradient boosting is only tried for long histories"""
+        assert "hist_gbm" not in candidate_models(30)
+        assert "hist_gbm" in candidate_models(LONG_HISTORY_ENTRIES)
+
+    def test_picks_lowest_backtest_error(self):
+        """Test that the winner has the lowest holdout error"""
+        rng = np.random.default_rng(0)
+        X = rng.normal(size=(40, 3))
+        y = X @ np.array([1.0, -2.0, 0.5]) + rng.normal(scale=0.1, size=40)
+
+        name, model, backtest_mae = select_model(X, y, np.arange(40), 40)
+
+        assert name == "ridge_0.3"
+        assert backtest_mae < 0.5
+        assert np.abs(model.predict(X) - y).mean() < 0.5
@@ -0,0 +1,76 @@
+"""
+Unit tests for lazy model proxies
+"""
+
+import subprocess
+import sys
+import threading
+from pathlib import Path
+import pytest
+from src.ai.lazy import LazyModel
+
+ROOT = Path(__file__).resolve().parents[2]
+
+
+class Model:
+    def __init__(self):
+        self.name = "sentiment"
+    
+    def analyze(self, text):
+        return text.upper()
+
+
+class TestLazyModel:
+    """Test background loading proxies"""
+    
+    def test_attribute_access_waits_for_load(self):
+        """Test that using the proxy loads and forwards to the target"""
+        proxy = LazyModel(Model, name="test")
+        
+        assert proxy.analyze("ok") == "OK"
+        assert proxy.is_ready()
+    
+    def test_not_ready_while_loading(self):
+        """Test readiness flag before the factory finishes"""
+        release = threading.Event()
+        
+        def factory():
+            release.wait(5)
+            return Model()
+        
+        proxy = LazyModel(factory, name="slow").start()
+        assert not proxy.is_ready()
+        assert proxy.status()["state"] == "loading"
+        
+        release.set()
+        assert proxy.wait(timeout=5).name == "sentiment"
+        assert proxy.is_ready()
+    
+    def test_load_failure_is_reported(self):
+        """Test that factory errors surface on use"""
+        def factory():
+            raise ValueError("no weights")
+        
+        proxy = LazyModel(factory, name="broken")
+        
+        with pytest.raises(RuntimeError):
+            proxy.wait(timeout=5)
+        assert proxy.status()["state"] == "failed"
+
+
+class TestPackageImport:
+    """Test that the src.ai package loads its exports on demand"""
+
+    def test_forecasting_does_not_load_nlp_stack(self):
+        """Test that a training worker's import skips transformers, torch and openai"""
+        pytest.importorskip("dotenv")  # needed by src.config in the child process
+        code = (
+            "import sys, src.ai.mood_predictor; "
+            "print(sorted(m for m in ('src.ai.sentiment_analyzer', 'src.ai.openai_client', "
+            "'transformers', 'torch', 'openai') if m in sys.modules))"
+        )
+
+        result = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True)
+
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.strip() == "[]"
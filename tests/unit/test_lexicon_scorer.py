@@ -0,0 +1,52 @@
+"""
+Unit tests for the lexicon sentiment scorer
+"""
+
+from src.ai.lexicon_scorer import LexiconSentimentScorer
+
+
+class TestLexiconSentimentScorer:
+    """Test the fast first stage of the sentiment cascade"""
+    
+    def test_clearly_positive(self):
+        """Test confident positive result"""
+        scorer = LexiconSentimentScorer()
+        result = scorer.score("Had a great day, feeling really happy and grateful")
+        
+        assert result["label"] == "POSITIVE"
+        assert result["score"] > 0.9
+    
+    def test_clearly_negative(self):
+        """Test confident negative result"""
+        scorer = LexiconSentimentScorer()
+        result = scorer.score("I feel so anxious and exhausted, everything is awful")
+        
+        assert result["label"] == "NEGATIVE"
+        assert result["score"] > 0.9
+    
+    def test_negation_flips_polarity(self):
+        """Test that negated words count against their polarity"""
+        scorer = LexiconSentimentScorer()
+        
+        assert scorer.score("I am not happy")["label"] == "NEGATIVE"
+    
+    def test_mixed_text_has_low_confidence(self):
+        """Test that mixed signals defer to the transformer"""
+        scorer = LexiconSentimentScorer()
+        result = scorer.score("Work was stressful but dinner with friends was nice")
+        
+        assert result["score"] < 0.9
+    
+    def test_result_schema(self):
+        """Test that analyze_text returns the analyzer result schema"""
+        scorer = LexiconSentimentScorer()
+        result = scorer.analyze_text("What a wonderful, amazing day")
+        
+        assert result["success"] is True
+        assert result["tier"] == "lexicon"
+        for key in ("sentiment", "confidence", "mood_score", "mood_label"):
+            assert key in result
+    
+    def test_empty_text(self):
+        """Test empty input"""
+        assert LexiconSentimentScorer().analyze_text("   ")["success"] is False
@@ -0,0 +1,86 @@
+"""
+Unit tests for the forecast materialization script
+"""
+
+from datetime import datetime, timedelta
+
+import scripts.materialize_forecasts as materialize
+import src.ai.mood_predictor as mood_predictor_module
+
+
+def make_history(days, start=datetime(2024, 1, 1)):
+    """Daily mood entries that dip every weekend, newest first (like get_mood_scores)"""
+    return [
+        {'mood_score': 4 if (start + timedelta(days=i)).weekday() >= 5 else 7,
+         'created_at': start + timedelta(days=i)}
+        for i in reversed(range(days))
+    ]
+
+
+class TestForecastUser:
+    """Test the per-user worker"""
+
+    def test_stores_model_forecasts(self, mood_predictor_factory, monkeypatch):
+        """Test that a fitted model's forecast becomes a fresh document"""
+        predictor = mood_predictor_factory()
+        monkeypatch.setattr(materialize, "_predictor", predictor)
+        history = make_history(42)
+
+        document = materialize._forecast_user("u1", history, None)
+
+        assert document['baseline'] is False
+        assert document['based_on_entry_at'] == history[0]['created_at']
+        assert not predictor.is_forecast_stale(document, history[0]['created_at'])
+
+    def test_skips_baseline_forecasts(self, mood_predictor_factory, monkeypatch):
+        """Test that a baseline is not stored (the dashboard would always reject it)"""
+        monkeypatch.setattr(materialize, "_predictor", mood_predictor_factory())
+        assert materialize._forecast_user("u1", make_history(8), None) is None
+
+    def test_restores_drift_state(self, mood_predictor_factory, monkeypatch):
+        """Test that a model whose stored drift state shows large errors is retrained"""
+        predictor = mood_predictor_factory()
+        monkeypatch.setattr(materialize, "_predictor", predictor)
+        history = make_history(42)
+        first = materialize._forecast_user("u1", history[1:], None)
+        drift_state = {'model_version': first['model_version'], 'pending': {}, 'errors': [4.0] * 5,
+                       'last_retrain_reason': None}
+
+        document = materialize._forecast_user("u1", history, None, drift_state)
+
+        assert document['model_version'] == first['model_version'] + 1
+        assert predictor.monitor.export_state("u1")['last_retrain_reason'] == "drift"
+
+
+class DriftStateClient:
+    """Firestore client stand-in holding drift states in memory"""
+
+    def __init__(self):
+        self.states = {}
+
+    def get_drift_state(self, uid):
+        return self.states.get(uid)
+
+    def save_drift_state(self, uid, state):
+        self.states[uid] = state
+        return True
+
+
+class TestRecordForecasts:
+    """Test that stored forecasts are tracked for drift"""
+
+    def test_written_forecasts_are_pending(self, mood_predictor_factory, monkeypatch):
+        """Test that each written forecast is added to the user's stored drift state"""
+        predictor = mood_predictor_factory()
+        monkeypatch.setattr(materialize, "_predictor", predictor)
+        monkeypatch.setattr(mood_predictor_module, "mood_predictor", predictor)
+        client = DriftStateClient()
+        client.states["u1"] = {'model_version': 1, 'pending': {}, 'errors': [0.5],
+                               'last_retrain_reason': "volume"}
+        document = materialize._forecast_user("u1", make_history(42), None)
+
+        materialize._record_forecasts(client, [("u1", document)])
+
+        state = client.states["u1"]
+        assert sorted(state['pending']) == [p['date'] for p in document['predictions']]
+        assert state['errors'] == [0.5] and state['last_retrain_reason'] == "volume"
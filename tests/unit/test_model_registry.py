@@ -0,0 +1,46 @@
+"""
+Unit tests for the model registry
+"""
+
+import pytest
+from src.ai.model_registry import ModelRegistry
+
+
+class TestModelRegistry:
+    """Test lazy loading and LRU eviction"""
+    
+    def test_loads_once(self):
+        """Test that a model is loaded on first use and reused afterwards"""
+        calls = []
+        registry = ModelRegistry()
+        registry.register("nli", lambda: calls.append(1) or object())
+        
+        first = registry.get("nli")
+        second = registry.get("nli")
+        
+        assert first is second
+        assert len(calls) == 1
+    
+    def test_lru_eviction_under_budget(self):
+        """Test that the least recently used model is evicted to fit a new one"""
+        registry = ModelRegistry(max_memory_mb=100)
+        registry.register("a", object, size_mb=60)
+        registry.register("b", object, size_mb=30)
+        registry.register("c", object, size_mb=40)
+        
+        registry.get("a")
+        registry.get("b")
+        registry.get("a")  # b is now least recently used
+        registry.get("c")
+        
+        assert registry.is_loaded("a")
+        assert not registry.is_loaded("b")
+        assert registry.is_loaded("c")
+        assert registry.memory_usage_mb() <= 100
+    
+    def test_unregistered_model(self):
+        """Test that unknown models raise KeyError"""
+        registry = ModelRegistry()
+        
+        with pytest.raises(KeyError):
+            registry.get("missing")
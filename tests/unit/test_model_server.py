@@ -0,0 +1,61 @@
+"""
+Unit tests for the shared model server
+"""
+
+import threading
+import time
+import pytest
+from src.ai.model_server import ModelServer, ModelServerClient
+
+
+class FakeAnalyzer:
+    """Stands in for SentimentAnalyzer(local=True)"""
+    model_name = "fake-model"
+    model_version = "test"
+    max_length = 512
+    zero_shot_model_name = "fake-nli"
+    
+    def _run_pipeline(self, texts):
+        return [{"label": "POSITIVE", "score": 0.9} for _ in texts]
+
+
+@pytest.fixture
+def server(tmp_path):
+    model_server = ModelServer(socket_path=str(tmp_path / "models.sock"), analyzer=FakeAnalyzer())
+    thread = threading.Thread(target=model_server.serve_forever, daemon=True)
+    thread.start()
+    
+    # Wait for the socket to appear
+    for _ in range(100):
+        if (tmp_path / "models.sock").exists():
+            break
+        time.sleep(0.01)
+    return model_server
+
+
+class TestModelServer:
+    """Test request handling over the Unix socket"""
+    
+    def test_sentiment_round_trip(self, server):
+        """Test that the client receives one result per text"""
+        client = ModelServerClient(server.socket_path, timeout=5)
+        
+        results = client.sentiment(["good day", "great day"])
+        
+        assert results == [{"label": "POSITIVE", "score": 0.9}] * 2
+    
+    def test_info_and_stats(self, server):
+        """Test metadata and metrics operations"""
+        client = ModelServerClient(server.socket_path, timeout=5)
+        client.sentiment(["text"])
+        
+        assert client.info()["model_name"] == "fake-model"
+        stats = client.stats()
+        assert stats["sentiment"]["items"] == 1
+        assert "queue_depth" in stats["sentiment"]
+    
+    def test_unknown_operation(self, server):
+        """Test that unknown operations are rejected"""
+        response = server.handle_request({"op": "explode"})
+        
+        assert response["ok"] is False
@@ -0,0 +1,171 @@
+"""
+Unit tests for per-user mood models
+"""
+
+import numpy as np
+from datetime import datetime, timedelta
+from src.ai.feature_store import build_feature_state
+from src.ai.mood_model_store import MoodModelStore
+from src.ai.mood_predictor import MoodPredictor, FEATURE_COLUMNS, HORIZON_COLUMNS
+
+
+def make_history(days, start=datetime(2024, 1, 1), offset=0):
+    """Daily mood entries with a weekly pattern"""
+    return [
+        {'mood_score': 5 + (i + offset) % 4, 'created_at': start + timedelta(days=i)}
+        for i in range(days)
+    ]
+
+
+class TestMoodModelStore:
+    """Test versioned storage and the LRU cache"""
+
+    def test_versions_increment_and_prune(self, tmp_path):
+        """Test that saves create new versions and old ones are pruned"""
+        store = MoodModelStore(store_dir=tmp_path, max_cached=2, keep_versions=2)
+
+        for i in range(3):
+            store.save("u1", {'model': i})
+
+        assert store.versions("u1") == [2, 3]
+        assert store.get("u1")['version'] == 3
+
+    def test_lru_reloads_from_disk(self, tmp_path):
+        """Test that evicted models are reloaded from disk"""
+        store = MoodModelStore(store_dir=tmp_path, max_cached=1)
+        store.save("u1", {'model': 'a'})
+        store.save("u2", {'model': 'b'})
+
+        assert store.get("u1")['model'] == 'a'
+        assert store.get_stats()['misses'] == 1
+
+    def test_sees_versions_saved_elsewhere(self, tmp_path):
+        """Test that a cached model is replaced once another process saves a newer one"""
+        store, worker = MoodModelStore(store_dir=tmp_path), MoodModelStore(store_dir=tmp_path)
+        store.save("u1", {'model': 'a'})
+        assert store.get("u1")['model'] == 'a'
+
+        worker.save("u1", {'model': 'b'})
+
+        assert store.get("u1") == {'model': 'b', 'version': 2}
+        assert store.get("u1")['model'] == 'b'
+        assert store.get_stats()['hits'] == 2
+
+    def test_listing_is_cached_until_directory_changes(self, tmp_path, monkeypatch):
+        """Test that repeated lookups do not list the user's directory"""
+        store = MoodModelStore(store_dir=tmp_path)
+        store.save("u1", {'model': 'a'})
+        listings = []
+        real = store.versions
+        monkeypatch.setattr(store, "versions", lambda uid: listings.append(uid) or real(uid))
+
+        for _ in range(5):
+            assert store.get("u1")['model'] == 'a'
+        MoodModelStore(store_dir=tmp_path).save("u1", {'model': 'b'})
+
+        assert store.get("u1")['model'] == 'b'
+        assert len(listings) == 2
+
+    def test_retries_version_pruned_after_listing(self, tmp_path, monkeypatch):
+        """Test that a reader whose listed version was pruned loads the newer one"""
+        reader = MoodModelStore(store_dir=tmp_path)
+        writer = MoodModelStore(store_dir=tmp_path, keep_versions=1)
+        writer.save("u1", {'model': 'a'})
+        assert reader.get("u1")['model'] == 'a'
+        writer.save("u1", {'model': 'b'})
+
+        # The reader listed version 2 just before another save pruned it
+        real = reader.latest_version
+        stale = iter([2])
+        monkeypatch.setattr(reader, "latest_version", lambda uid: next(stale, None) or real(uid))
+        writer.save("u1", {'model': 'c'})
+
+        assert reader.get("u1") == {'model': 'c', 'version': 3}
+
+    def test_concurrent_saves_get_distinct_versions(self, tmp_path, monkeypatch):
+        """Test that savers with a stale view of the directory never share a version"""
+        stores = [MoodModelStore(store_dir=tmp_path, keep_versions=10) for _ in range(3)]
+        for store in stores:
+            # Each store's first listing misses the versions saved by the others
+            def versions(uid, real=store.versions, calls=[]):
+                calls.append(uid)
+                return [] if len(calls) == 1 else real(uid)
+            monkeypatch.setattr(store, "versions", versions)
+
+        assert [store.save("u1", {'model': i}) for i, store in enumerate(stores)] == [1, 2, 3]
+        assert sorted(p.name for p in (tmp_path / "u1").iterdir()) == [
+            "v000001.joblib", "v000002.joblib", "v000003.joblib"
+        ]
+
+
+class TestPerUserPredictor:
+    """Test that forecasts use the requesting user's model"""
+
+    def test_models_are_per_user(self, mood_predictor_factory):
+        """Test that each user gets their own model"""
+        predictor = mood_predictor_factory()
+
+        predictor.predict_mood(make_history(30), uid="u1")
+        predictor.predict_mood(make_history(30, offset=2), uid="u2")
+        predictor.scheduler.wait_idle(timeout=30)
+
+        assert predictor.store.get("u1") is not predictor.store.get("u2")
+
+    def test_retrains_only_after_enough_new_entries(self, mood_predictor_factory):
+        """Test the retraining trigger"""
+        predictor = mood_predictor_factory()
+        predictor.retrain_min_new_entries = 5
+        history = make_history(40)
+
+        def forecast(n):
+            result = predictor.predict_mood(history[:n], uid="u1")
+            predictor.scheduler.wait_idle(timeout=30)
+            return result
+
+        forecast(30)
+        assert forecast(33)['model_version'] == 1
+        forecast(35)
+        assert forecast(35)['model_version'] == 2
+
+
+class TestBatchFeatures:
+    """Test vectorized multi-user feature engineering"""
+
+    def test_matches_per_user_features(self, tmp_path):
+        """Test that batch features equal the per-user ones"""
+        predictor = MoodPredictor(store=MoodModelStore(store_dir=tmp_path))
+        histories = {"u1": make_history(20), "u2": make_history(12, offset=1), "u3": make_history(5)}
+        entries = [dict(e, user_id=uid) for uid, history in histories.items() for e in history]
+
+        batch = predictor.prepare_features_batch(entries)
+
+        assert set(batch['user_id']) == {"u1", "u2"}
+        for uid in ("u1", "u2"):
+            expected = predictor.prepare_features(histories[uid])[FEATURE_COLUMNS].values
+            actual = batch[batch['user_id'] == uid][FEATURE_COLUMNS].values
+            assert np.allclose(actual, expected)
+
+    def test_batch_models_serve_from_feature_state(self, mood_predictor_factory):
+        """Test that batch-trained models record their entry count and are used without history"""
+        predictor = mood_predictor_factory()
+        histories = {"u1": make_history(20), "u2": make_history(5)}
+        entries = [dict(e, user_id=uid) for uid, history in histories.items() for e in history]
+
+        assert predictor.train_models_batch(entries) == {"u1": True}
+
+        artifact = predictor._get_cached_model("u1", build_feature_state(histories["u1"]))
+        assert artifact is not None and artifact['trained_count'] == 20
+
+    def test_pooled_matrices(self, tmp_path):
+        """Test pooled training matrices and that targets lie the row's horizon ahead"""
+        predictor = MoodPredictor(store=MoodModelStore(store_dir=tmp_path))
+        entries = [dict(e, user_id=uid) for uid in ("u1", "u2") for e in make_history(10)]
+
+        matrices = predictor.get_feature_matrices(predictor.prepare_features_batch(entries), pooled=True, horizons=7)
+
+        # 9 + 8 + ... + 3 (origin, target) pairs per user
+        assert matrices["X"].shape == (84, len(FEATURE_COLUMNS) + len(HORIZON_COLUMNS))
+        assert list(matrices["groups"]) == ["u1"] * 42 + ["u2"] * 42
+        day = matrices["X"][:, FEATURE_COLUMNS.index('day_of_month')]
+        horizon = matrices["X"][:, len(FEATURE_COLUMNS)]
+        assert np.array_equal(matrices["y"], 5 + (day - 1 + horizon) % 4)
@@ -0,0 +1,154 @@
+"""
+Unit tests for mood forecasting
+"""
+
+from datetime import datetime, timedelta
+from src.ai.mood_model_store import MoodModelStore
+from src.ai.mood_predictor import FEATURE_COLUMNS, build_training_rows
+
+
+def make_history(days, start=datetime(2024, 1, 1)):
+    """Daily mood entries that dip every weekend"""
+    return [
+        {'mood_score': 4 if (start + timedelta(days=i)).weekday() >= 5 else 7,
+         'created_at': start + timedelta(days=i)}
+        for i in range(days)
+    ]
+
+
+class CountingModel:
+    """Wraps a fitted model and counts predict calls"""
+
+    def __init__(self, model):
+        self.model = model
+        self.calls = 0
+
+    def predict(self, X):
+        self.calls += 1
+        return self.model.predict(X)
+
+
+class TestMultiHorizonForecast:
+    """Test direct multi-horizon forecasting"""
+
+    def test_single_predict_call(self, mood_predictor_factory):
+        """Test that every day ahead comes from one predict call"""
+        predictor = mood_predictor_factory()
+        history = make_history(42)
+        predictor.predict_mood(history, uid="u1")
+        predictor.scheduler.wait_idle(timeout=30)
+
+        artifact = predictor.store.get("u1")
+        artifact['model'] = CountingModel(artifact['model'])
+        result = predictor.predict_mood(history, days_ahead=7, uid="u1")
+
+        assert artifact['model'].calls == 1
+        assert len(result['predictions']) == 7
+        assert set(result['predictions'][0]) == {"date", "predicted_mood", "mood_label"}
+        assert result['predictions'][0]['date'] == "2024-02-12"
+
+    def test_learns_weekly_pattern(self, mood_predictor_factory):
+        """Test that forecasts follow the weekday of each target date"""
+        predictor = mood_predictor_factory()
+
+        result = predictor.predict_mood(make_history(56), days_ahead=7)
+        by_date = {p['date']: p['predicted_mood'] for p in result['predictions']}
+
+        # 2024-03-02 is a Saturday, 2024-02-27 a Tuesday
+        assert by_date["2024-03-02"] < by_date["2024-02-27"]
+
+    def test_old_artifacts_are_retrained(self, tmp_path, mood_predictor_factory):
+        """Test that models without horizons are replaced"""
+        store = MoodModelStore(store_dir=tmp_path)
+        store.save("u1", {'model': None, 'scaler': None, 'trained_through': None})
+        predictor = mood_predictor_factory(store=store)
+
+        predictor.predict_mood(make_history(30), uid="u1")
+        predictor.scheduler.wait_idle(timeout=30)
+
+        assert predictor.predict_mood(make_history(30), uid="u1")['model_version'] == 2
+
+
+class TestTrainingRows:
+    """Test that horizons are calendar days, not entry counts"""
+
+    def test_irregular_history(self, mood_predictor_factory):
+        """Test horizons and target weekdays with a skipped day and a doubled day"""
+        start = datetime(2024, 1, 1)
+        offsets = [0, 1, 3, 4, 4, 5, 8, 9, 10]  # day 2 skipped, day 4 twice, days 6-7 skipped
+        history = [{'mood_score': 5 + i % 3, 'created_at': start + timedelta(days=d, hours=i)}
+                   for i, d in enumerate(offsets)]
+        df = mood_predictor_factory().prepare_features(history)
+
+        X, y, target_index = build_training_rows(df, horizons=3)
+
+        horizon = X[:, len(FEATURE_COLUMNS)]
+        target_weekday = X[:, len(FEATURE_COLUMNS) + 1]
+        target_days = [offsets[i] for i in target_index]
+        assert set(horizon) == {1, 2, 3}
+        assert list(target_weekday) == [(start + timedelta(days=d)).weekday() for d in target_days]
+        # Both day-4 entries are targets one day after day 3 and origins one day before day 5;
+        # the two of them never pair with each other (same day)
+        assert sorted(target_index[horizon == 1]) == [1, 3, 4, 5, 5, 7, 8]
+        assert len(X) == len(y) == 14
+
+
+class TestBackgroundTraining:
+    """Test that fits run off the request path"""
+
+    def test_baseline_until_first_fit(self, mood_predictor_factory):
+        """Test that a baseline is served while the first model trains"""
+        predictor = mood_predictor_factory()
+        history = make_history(30)
+
+        first = predictor.predict_mood(history, uid="u1")
+        predictor.scheduler.wait_idle(timeout=30)
+        second = predictor.predict_mood(history, uid="u1")
+
+        assert first['baseline'] and first['model_version'] is None
+        assert len(first['predictions']) == 7
+        assert not second['baseline'] and second['model_version'] == 1
+
+    def test_metrics(self, mood_predictor_factory):
+        """Test queue length, fit duration and model age"""
+        predictor = mood_predictor_factory()
+        predictor.predict_mood(make_history(30), uid="u1")
+        predictor.scheduler.wait_idle(timeout=30)
+
+        stats = predictor.get_training_stats("u1")
+
+        assert stats['queue_length'] == 0
+        assert stats['completed'] == 1
+        assert stats['fit_seconds'] is not None
+        assert stats['model_age_seconds'] >= 0
+
+
+class TestForecastDocuments:
+    """Test materialized forecast documents"""
+
+    def test_round_trip(self, mood_predictor_factory):
+        """Test that a stored forecast expands to the original predictions"""
+        predictor = mood_predictor_factory()
+        history = make_history(30)
+        result = predictor.predict_mood(history, uid="u1", train_inline=True)
+
+        document = predictor.to_forecast_document(result, history[-1]['created_at'])
+        restored = predictor.from_forecast_document(document)
+
+        assert not result['baseline'] and result['model_version'] == 1
+        assert restored == result
+        assert predictor.scheduler.get_stats()['completed'] == 0
+
+    def test_staleness(self, mood_predictor_factory):
+        """Test that forecasts older than the latest entry are recomputed"""
+        predictor = mood_predictor_factory()
+        history = make_history(30)
+        latest = history[-1]['created_at']
+        document = predictor.to_forecast_document(
+            predictor.predict_mood(history, uid="u1", train_inline=True), latest
+        )
+
+        assert not predictor.is_forecast_stale(document, latest)
+        assert predictor.is_forecast_stale(document, latest + timedelta(hours=1))
+        assert predictor.is_forecast_stale(document, latest, days_ahead=14)
+        assert predictor.is_forecast_stale(None, latest)
@@ -0,0 +1,100 @@
+"""
+Unit tests for the ONNX Runtime sentiment backend (tiny random model, built locally)
+"""
+
+import pytest
+
+ort = pytest.importorskip("onnxruntime")
+pytest.importorskip("onnx")
+
+import torch  # noqa: E402
+import transformers  # noqa: E402
+from transformers import BertConfig, BertForSequenceClassification, BertTokenizer, pipeline  # noqa: E402
+
+import src.ai.onnx_backend as onnx_backend  # noqa: E402
+from src.ai.onnx_backend import OnnxSentimentModel, export_to_onnx  # noqa: E402
+
+VOCABULARY = ["today", "was", "a", "good", "bad", "day", "i", "feel", "tired", "happy", "very"]
+
+TEXTS = ["today was a good day", "i feel very tired", "bad day", "happy"]
+
+
+@pytest.fixture
+def tiny_model(tmp_path, monkeypatch):
+    """Directory holding a tiny randomly initialized sentiment model and its tokenizer"""
+    monkeypatch.setattr(onnx_backend, "ONNX_DIR", tmp_path / "onnx")
+
+    model_dir = tmp_path / "tiny-sentiment"
+    model_dir.mkdir()
+    vocab_file = tmp_path / "vocab.txt"
+    vocab_file.write_text("\n".join(["[PAD]", "[UNK]", "[CLS]", "[SEP]", "[MASK]"] + VOCABULARY))
+    BertTokenizer(vocab_file=str(vocab_file)).save_pretrained(model_dir)
+
+    torch.manual_seed(0)
+    config = BertConfig(
+        vocab_size=len(VOCABULARY) + 5, hidden_size=16, num_hidden_layers=1,
+        num_attention_heads=2, intermediate_size=32, max_position_embeddings=64,
+        id2label={0: "NEGATIVE", 1: "POSITIVE"}, label2id={"NEGATIVE": 0, "POSITIVE": 1}
+    )
+    BertForSequenceClassification(config).eval().save_pretrained(model_dir)
+    return str(model_dir)
+
+
+class TestExport:
+    """Test that exported and quantized models are reused"""
+
+    def test_export_is_cached(self, tiny_model, monkeypatch):
+        """Test that a second export reuses the file without loading the model"""
+        path = export_to_onnx(tiny_model)
+        mtime = path.stat().st_mtime_ns
+
+        def fail(*args, **kwargs):
+            raise AssertionError("model was exported again")
+
+        monkeypatch.setattr(transformers.AutoModelForSequenceClassification, "from_pretrained", fail)
+
+        assert export_to_onnx(tiny_model) == path
+        assert path.stat().st_mtime_ns == mtime
+
+    def test_quantized_copy_is_cached(self, tiny_model, monkeypatch):
+        """Test that the int8 model is written next to the fp32 one, once"""
+        path = export_to_onnx(tiny_model, quantize=True)
+
+        assert path.name == "model.int8.onnx"
+        assert (path.parent / "model.onnx").exists()
+
+        def fail(*args, **kwargs):
+            raise AssertionError("model was quantized again")
+
+        monkeypatch.setattr(onnx_backend, "quantize_dynamic", fail)
+
+        assert export_to_onnx(tiny_model, quantize=True) == path
+
+
+class TestOnnxSentimentModel:
+    """Test that ONNX serving matches the torch pipeline"""
+
+    def test_matches_torch_pipeline(self, tiny_model):
+        """Test that labels and scores agree with the transformers pipeline"""
+        tokenizer = transformers.AutoTokenizer.from_pretrained(tiny_model)
+        config = transformers.AutoConfig.from_pretrained(tiny_model)
+        torch_pipeline = pipeline("sentiment-analysis", model=tiny_model, tokenizer=tokenizer, device=-1)
+
+        onnx_model = OnnxSentimentModel(tiny_model, tokenizer, config.id2label, max_length=32)
+        expected = torch_pipeline(TEXTS, batch_size=2, truncation=True)
+        actual = onnx_model(TEXTS, batch_size=2)
+
+        assert [r["label"] for r in actual] == [r["label"] for r in expected]
+        for a, e in zip(actual, expected):
+            assert a["score"] == pytest.approx(e["score"], abs=1e-4)
+
+    def test_int8_output_format(self, tiny_model):
+        """Test that the quantized model returns one valid label and score per text"""
+        tokenizer = transformers.AutoTokenizer.from_pretrained(tiny_model)
+        config = transformers.AutoConfig.from_pretrained(tiny_model)
+
+        results = OnnxSentimentModel(tiny_model, tokenizer, config.id2label, quantize=True)(TEXTS)
+
+        assert len(results) == len(TEXTS)
+        assert all(r["label"] in ("NEGATIVE", "POSITIVE") for r in results)
+        assert all(0.5 <= r["score"] <= 1.0 for r in results)
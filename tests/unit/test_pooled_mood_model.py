@@ -0,0 +1,71 @@
+"""
+Unit tests for the out-of-core pooled mood model
+"""
+
+from datetime import datetime, timedelta
+from src.ai.feature_store import build_feature_state
+from src.ai.pooled_mood_model import iter_user_histories, train_pooled_model
+
+
+def make_entries(n_users, days, start=datetime(2024, 1, 1)):
+    """Entries ordered by user, then date; every user dips at weekends"""
+    return [
+        {'user_id': f"u{u:03d}", 'created_at': start + timedelta(days=d),
+         'mood_score': 4 if (start + timedelta(days=d)).weekday() >= 5 else 7}
+        for u in range(n_users) for d in range(days)
+    ]
+
+
+def paged(entries, page_size=50):
+    """Split entries into pages like the Firestore stream"""
+    return lambda: (entries[i:i + page_size] for i in range(0, len(entries), page_size))
+
+
+class TestPooledTraining:
+    """Test streaming training over many users"""
+
+    def test_groups_users_across_pages(self):
+        """Test that a user split over page boundaries is yielded once"""
+        histories = list(iter_user_histories(paged(make_entries(3, 40), page_size=7)()))
+
+        assert [uid for uid, _ in histories] == ["u000", "u001", "u002"]
+        assert all(len(history) == 40 for _, history in histories)
+
+    def test_trains_in_batches(self, mood_predictor_factory):
+        """Test that mini-batches cover every user"""
+        predictor = mood_predictor_factory()
+
+        artifact = train_pooled_model(paged(make_entries(9, 28)), predictor, epochs=2, batch_users=4)
+
+        assert artifact['n_users'] == 9
+        assert artifact['version'] == 1
+        assert predictor.has_pooled_model()
+
+
+class TestPooledForecasts:
+    """Test forecasts for users without a personal model"""
+
+    def test_new_user_gets_forecast(self, mood_predictor_factory):
+        """Test that a user with two entries gets a pooled forecast"""
+        predictor = mood_predictor_factory()
+        history = make_entries(1, 2, start=datetime(2024, 3, 4))
+
+        assert predictor.predict_mood(history, uid="new") is None
+
+        train_pooled_model(paged(make_entries(20, 56)), predictor, epochs=5)
+        result = predictor.predict_mood(history, uid="new", feature_state=build_feature_state(history))
+
+        assert result['baseline'] and result['model_version'] == 1
+        assert len(result['predictions']) == 7
+
+    def test_replaces_baseline_while_training(self, mood_predictor_factory):
+        """Test that the pooled model stands in until the personal model is trained"""
+        predictor = mood_predictor_factory()
+        train_pooled_model(paged(make_entries(20, 56)), predictor, epochs=5)
+
+        result = predictor.predict_mood(make_entries(1, 30), uid="u1")
+        by_date = {p['date']: p['predicted_mood'] for p in result['predictions']}
+
+        assert result['baseline'] and result['model_version'] == 1
+        # 2024-02-03 is a Saturday, 2024-02-06 a Tuesday
+        assert by_date["2024-02-03"] < by_date["2024-02-06"]
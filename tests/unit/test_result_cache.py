@@ -0,0 +1,53 @@
+"""
+Unit tests for the sentiment result cache
+"""
+
+import time
+from src.ai.result_cache import ResultCache, make_cache_key
+
+
+class TestResultCache:
+    """Test two-tier result caching"""
+    
+    def test_key_normalizes_whitespace(self):
+        """Test that whitespace differences share a key"""
+        key1 = make_cache_key("  Had a  good day\n", "model", "v1")
+        key2 = make_cache_key("Had a good day", "model", "v1")
+        
+        assert key1 == key2
+    
+    def test_key_depends_on_model_version(self):
+        """Test that model version is part of the key"""
+        assert make_cache_key("text", "model", "v1") != make_cache_key("text", "model", "v2")
+    
+    def test_hit_and_miss_counters(self, tmp_path):
+        """Test hit/miss accounting"""
+        cache = ResultCache(tmp_path / "cache.sqlite3")
+        key = make_cache_key("text", "model", "v1")
+        
+        assert cache.get(key) is None
+        cache.set(key, {"success": True, "mood_score": 8})
+        assert cache.get(key) == {"success": True, "mood_score": 8}
+        
+        stats = cache.get_stats()
+        assert stats["misses"] == 1
+        assert stats["memory_hits"] == 1
+    
+    def test_disk_tier_persists(self, tmp_path):
+        """Test that results survive a new cache instance"""
+        key = make_cache_key("text", "model", "v1")
+        ResultCache(tmp_path / "cache.sqlite3").set(key, {"success": True})
+        
+        cache = ResultCache(tmp_path / "cache.sqlite3")
+        
+        assert cache.get(key) == {"success": True}
+        assert cache.get_stats()["disk_hits"] == 1
+    
+    def test_entries_expire(self, tmp_path):
+        """Test TTL expiry"""
+        cache = ResultCache(tmp_path / "cache.sqlite3", ttl_seconds=0)
+        key = make_cache_key("text", "model", "v1")
+        cache.set(key, {"success": True})
+        time.sleep(0.01)
+        
+        assert cache.get(key) is None
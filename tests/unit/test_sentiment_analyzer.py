@@ -0,0 +1,251 @@
+"""
+Unit tests for the sentiment analyzer (stub models, nothing is downloaded)
+"""
+
+import pytest
+from types import SimpleNamespace
+import src.ai.sentiment_analyzer as analyzer_module
+from src.config import settings
+from src.ai.model_registry import ModelRegistry
+from src.ai.sentiment_analyzer import SentimentAnalyzer, EMOTION_LABELS, TRIGGER_LABELS
+
+
+class WordTokenizer:
+    """Whitespace tokenizer standing in for the Hugging Face one (one token per word)"""
+
+    def __init__(self, model_max_length=512):
+        self.model_max_length = model_max_length
+
+    def __call__(self, text, add_special_tokens=False, verbose=False):
+        return {'input_ids': text.split()}
+
+    def num_special_tokens_to_add(self):
+        return 2
+
+    def decode(self, ids):
+        return " ".join(ids)
+
+
+class FakePipeline:
+    """Sentiment pipeline that is positive when the text mentions "good" and records its batches"""
+
+    def __init__(self):
+        self.batches = []
+
+    def __call__(self, texts, batch_size=None, truncation=True):
+        self.batches.append(list(texts))
+        return [
+            {"label": "POSITIVE", "score": 0.8} if "good" in text else {"label": "NEGATIVE", "score": 0.7}
+            for text in texts
+        ]
+
+
+class FakeClassifier:
+    """Zero-shot pipeline that scores a label high when the text contains it"""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, text, labels, multi_label=True, batch_size=None):
+        self.calls.append(list(labels))
+        return {
+            "labels": list(labels),
+            "scores": [0.9 if label in text else 0.1 for label in labels]
+        }
+
+
+@pytest.fixture
+def make_analyzer(monkeypatch):
+    """Build SentimentAnalyzers around stub models"""
+    def factory(pipeline=None, classifier=None, max_length=512, overlap=0, cascade=False, cache_dir=None,
+                zero_shot_mode="nli"):
+        monkeypatch.setattr(settings, "MODEL_SERVER_SOCKET", None)
+        monkeypatch.setattr(settings, "ENABLE_SENTIMENT_CACHE", cache_dir is not None)
+        monkeypatch.setattr(settings, "ENABLE_SENTIMENT_CASCADE", cascade)
+        if cache_dir is not None:
+            monkeypatch.setattr(analyzer_module, "DATA_DIR", cache_dir)
+        monkeypatch.setattr(settings, "SENTIMENT_WINDOW_OVERLAP", overlap)
+        monkeypatch.setattr(settings, "ZERO_SHOT_MODE", zero_shot_mode)
+        monkeypatch.setattr(analyzer_module, "model_registry", ModelRegistry())
+        monkeypatch.setattr(analyzer_module, "_load_zero_shot_pipeline", lambda: classifier or FakeClassifier())
+
+        def initialize(self):
+            self.tokenizer = WordTokenizer(max_length)
+            self.max_length = min(self.max_length, max_length)
+            self.model = None
+            self.sentiment_pipeline = pipeline or FakePipeline()
+            self.model_version = "test"
+
+        monkeypatch.setattr(SentimentAnalyzer, "_initialize_model", initialize)
+        return SentimentAnalyzer(local=True)
+
+    return factory
+
+
+class TestAnalyzeAffect:
+    """Test single-pass emotion and trigger detection"""
+
+    def test_one_zero_shot_pass(self, make_analyzer):
+        """Test that emotions and triggers share one classifier call"""
+        classifier = FakeClassifier()
+        analyzer = make_analyzer(classifier=classifier)
+
+        result = analyzer.analyze_affect("work stress and anxiety all week")
+
+        assert result["success"] is True
+        assert classifier.calls == [EMOTION_LABELS + TRIGGER_LABELS]
+        assert [e["emotion"] for e in result["emotions"]] == ["anxiety"]
+        assert [t["trigger"] for t in result["triggers"]] == ["work stress"]
+
+    def test_matches_separate_calls(self, make_analyzer):
+        """Test that the combined result equals extract_emotions plus detect_triggers"""
+        analyzer = make_analyzer()
+        text = "calm after the family conflict, some loneliness and joy"
+
+        affect = analyzer.analyze_affect(text)
+        emotions = analyzer.extract_emotions(text)
+        triggers = analyzer.detect_triggers(text)
+
+        assert affect["emotions"] == emotions["emotions"]
+        assert affect["all_scores"] == emotions["all_scores"]
+        assert affect["triggers"] == triggers["triggers"]
+        assert set(affect["all_scores"]) == set(EMOTION_LABELS)
+
+    def test_failure_is_reported(self, make_analyzer):
+        """Test that classifier errors are returned, not raised"""
+        def broken(text, labels, multi_label=True, batch_size=None):
+            raise RuntimeError("model crashed")
+
+        result = make_analyzer(classifier=broken).analyze_affect("anything")
+
+        assert result == {"success": False, "error": "model crashed"}
+
+    def test_embedding_mode_has_own_thresholds(self, make_analyzer, monkeypatch):
+        """Test that embedding scores are cut off with the embedding-mode settings"""
+        monkeypatch.setattr(settings, "ZERO_SHOT_EMBEDDING_EMOTION_THRESHOLD", 0.5)
+        monkeypatch.setattr(settings, "ZERO_SHOT_EMBEDDING_TRIGGER_THRESHOLD", 0.6)
+        scores = {"anxiety": 0.55, "calm": 0.45, "work stress": 0.65, "loneliness": 0.5}
+
+        def classify(texts, labels):
+            return [{label: scores.get(label, 0.1) for label in labels}]
+
+        monkeypatch.setattr(analyzer_module, "embedding_zero_shot", SimpleNamespace(classify=classify))
+
+        result = make_analyzer(zero_shot_mode="embedding").analyze_affect("anything")
+
+        assert [e["emotion"] for e in result["emotions"]] == ["anxiety"]
+        assert [t["trigger"] for t in result["triggers"]] == ["work stress"]
+
+
+class TestLongTexts:
+    """Test token windows and their length-weighted aggregate"""
+
+    def test_short_text_is_one_window(self, make_analyzer):
+        """Test that text within the context is not split"""
+        analyzer = make_analyzer(max_length=12)
+        text = " ".join(["word"] * 10)  # exactly fills the 12 - 2 special tokens
+
+        assert analyzer._chunk_text(text) == [(text, 10)]
+
+    def test_one_token_over_splits(self, make_analyzer):
+        """Test the boundary where a second window starts"""
+        analyzer = make_analyzer(max_length=12)
+        words = [f"w{i}" for i in range(11)]
+
+        chunks = analyzer._chunk_text(" ".join(words))
+
+        assert chunks == [(" ".join(words[:10]), 10), ("w10", 1)]
+
+    def test_windows_overlap_and_cover_text(self, make_analyzer):
+        """Test window stride with overlap and that the last window ends at the text end"""
+        analyzer = make_analyzer(max_length=12, overlap=4)
+        words = [f"w{i}" for i in range(20)]
+
+        chunks = analyzer._chunk_text(" ".join(words))
+
+        assert [n for _, n in chunks] == [10, 10, 8]
+        assert [text.split()[0] for text, _ in chunks] == ["w0", "w6", "w12"]
+        assert chunks[-1][0].split()[-1] == "w19"
+
+    def test_single_window_passes_through(self, make_analyzer):
+        """Test that one window is returned unchanged"""
+        raw = {"label": "NEGATIVE", "score": 0.6}
+
+        assert make_analyzer()._aggregate_chunks([raw], [7]) is raw
+
+    def test_aggregate_is_length_weighted(self, make_analyzer):
+        """Test that longer windows dominate the positive-class average"""
+        analyzer = make_analyzer()
+        raw = [{"label": "POSITIVE", "score": 0.9}, {"label": "NEGATIVE", "score": 0.8}]
+
+        positive = analyzer._aggregate_chunks(raw, [30, 10])
+        negative = analyzer._aggregate_chunks(raw, [10, 30])
+
+        assert positive["label"] == "POSITIVE"
+        assert positive["score"] == pytest.approx((30 * 0.9 + 10 * 0.2) / 40)
+        assert negative["label"] == "NEGATIVE"
+        assert negative["score"] == pytest.approx(1 - (10 * 0.9 + 30 * 0.2) / 40)
+
+    def test_aggregate_other_labels_by_weighted_vote(self, make_analyzer):
+        """Test label sets other than POSITIVE/NEGATIVE"""
+        raw = [{"label": "joy", "score": 0.6}, {"label": "anger", "score": 0.9}, {"label": "joy", "score": 0.5}]
+
+        result = make_analyzer()._aggregate_chunks(raw, [10, 5, 5])
+
+        assert result == {"label": "joy", "score": pytest.approx((10 * 0.6 + 5 * 0.5) / 20)}
+
+    def test_long_text_windows_share_batches(self, make_analyzer):
+        """Test that every window is scored and per-window detail is returned on request"""
+        pipeline = FakePipeline()
+        analyzer = make_analyzer(pipeline=pipeline, max_length=12)
+        long_text = " ".join(["good"] * 25)
+
+        result = analyzer.analyze_texts([long_text, "bad day"], return_chunks=True)
+
+        assert [len(batch) for batch in pipeline.batches] == [4]
+        assert [c["tokens"] for c in result[0]["chunks"]] == [10, 10, 5]
+        assert result[0]["sentiment"] == "positive"
+        assert "chunks" not in analyzer.analyze_texts([long_text])[0]
+
+
+class TestCascade:
+    """Test the lexicon first stage"""
+
+    CONFIDENT = "Had a great day, feeling really happy and grateful"
+
+    def test_confident_text_skips_transformer(self, make_analyzer):
+        """Test that confident lexicon results are returned without a forward pass"""
+        pipeline = FakePipeline()
+        analyzer = make_analyzer(pipeline=pipeline, cascade=True)
+
+        result = analyzer.analyze_texts([self.CONFIDENT])[0]
+
+        assert result["tier"] == "lexicon"
+        assert pipeline.batches == []
+        assert analyzer.get_tier_stats() == {"lexicon": 1, "transformer": 0}
+
+    def test_cascade_can_be_bypassed(self, make_analyzer):
+        """Test that use_cascade=False always runs the transformer"""
+        pipeline = FakePipeline()
+        analyzer = make_analyzer(pipeline=pipeline, cascade=True)
+
+        assert analyzer.analyze_texts([self.CONFIDENT], use_cascade=False)[0]["tier"] == "transformer"
+        assert analyzer.analyze_text(self.CONFIDENT, use_cascade=False)["tier"] == "transformer"
+        assert sum(len(batch) for batch in pipeline.batches) == 2
+
+    def test_lexicon_results_are_not_cached(self, make_analyzer, tmp_path):
+        """Test that the transformer's cache key never holds a lexicon result"""
+        analyzer = make_analyzer(cascade=True, cache_dir=tmp_path)
+
+        analyzer.analyze_text(self.CONFIDENT)
+
+        assert analyzer._cache_get(self.CONFIDENT) is None
+        assert analyzer.analyze_text(self.CONFIDENT, use_cascade=False)["tier"] == "transformer"
+        assert analyzer._cache_get(self.CONFIDENT)["tier"] == "transformer"
+
+    def test_lexicon_fallback_accepts_analyzer_arguments(self):
+        """Test that the warm-up fallback takes the same keyword arguments"""
+        from src.ai.lexicon_scorer import lexicon_scorer
+
+        assert lexicon_scorer.analyze_text(self.CONFIDENT, return_chunks=True)["success"] is True
+        assert len(lexicon_scorer.analyze_texts([self.CONFIDENT], return_chunks=True, use_cascade=False)) == 1
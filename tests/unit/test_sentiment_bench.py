@@ -0,0 +1,68 @@
+"""
+Unit tests for the sentiment benchmark (stub analyzer, tiny corpus)
+"""
+
+from benchmarks.corpus import generate_corpus
+from benchmarks.sentiment_bench import bench_sentiment, bench_zero_shot, current_rss_mb
+
+
+class StubAnalyzer:
+    """Analyzer that records its calls and can hold on to a buffer once"""
+
+    def __init__(self, allocate_mb=0):
+        self.allocate_mb = allocate_mb
+        self.buffers = []
+        self.batches = []
+        self.batch_size = None
+
+    def _maybe_allocate(self):
+        if self.allocate_mb and not self.buffers:
+            self.buffers.append(b"x" * (self.allocate_mb * 1024 * 1024))
+
+    def analyze_text(self, text):
+        self.batches.append([text])
+        self._maybe_allocate()
+        return {"success": True}
+
+    def analyze_texts(self, texts):
+        self.batches.append(list(texts))
+        self._maybe_allocate()
+        return [{"success": True} for _ in texts]
+
+    def extract_emotions(self, text):
+        self._maybe_allocate()
+        return {"success": True}
+
+
+class TestSentimentBench:
+    """Test one tiny configuration of each benchmark"""
+
+    TEXTS = generate_corpus(n_texts=10, seed=1)
+
+    def test_batched_sentiment(self):
+        """Test that texts are batched and every configuration reports latency and memory"""
+        analyzer = StubAnalyzer()
+
+        row = bench_sentiment(analyzer, self.TEXTS, batch_size=4)
+
+        assert analyzer.batch_size == 4
+        assert [len(batch) for batch in analyzer.batches] == [4, 4, 4, 2]  # warm-up, then 3 batches
+        assert (row["calls"], row["texts"]) == (3, 10)
+        assert row["p50_ms"] <= row["p99_ms"]
+        assert row["rss_mb"] > 0 and row["rss_delta_mb"] is not None
+
+    def test_single_text_and_zero_shot(self):
+        """Test the per-text paths"""
+        assert bench_sentiment(StubAnalyzer(), self.TEXTS, batch_size=1)["calls"] == 10
+        assert bench_zero_shot(StubAnalyzer(), self.TEXTS, "extract_emotions")["calls"] == 10
+
+    def test_memory_is_per_configuration(self):
+        """Test that growth is attributed to the configuration that caused it only"""
+        analyzer = StubAnalyzer(allocate_mb=64)
+
+        first = bench_sentiment(analyzer, self.TEXTS, batch_size=1)
+        second = bench_sentiment(analyzer, self.TEXTS, batch_size=1)
+
+        assert first["rss_delta_mb"] >= 48
+        assert second["rss_delta_mb"] < 16
+        assert abs(current_rss_mb() - second["rss_mb"]) < 16
@@ -0,0 +1,104 @@
+"""
+Unit tests for streaming mood statistics
+"""
+
+import random
+import numpy as np
+import pytest
+from src.ai.mood_model_store import MoodModelStore
+from src.ai.mood_predictor import MoodPredictor
+from src.ai.streaming_stats import StreamingMoodStats
+
+
+def reference_insights(mood_scores):
+    """get_mood_insights as computed with NumPy before streaming statistics"""
+    mood_scores = np.asarray(mood_scores)
+    std = np.std(mood_scores)
+    insights = {
+        "success": True,
+        "average_mood": round(float(np.mean(mood_scores)), 2),
+        "mood_std": round(float(std), 2),
+        "min_mood": int(np.min(mood_scores)),
+        "max_mood": int(np.max(mood_scores)),
+        "median_mood": round(float(np.median(mood_scores)), 2),
+        "mood_volatility": "high" if std > 2 else "moderate" if std > 1 else "low",
+        "total_entries": len(mood_scores)
+    }
+    if len(mood_scores) >= 7:
+        recent_avg = np.mean(mood_scores[-7:])
+        older_avg = np.mean(mood_scores[:-7]) if len(mood_scores) > 7 else recent_avg
+        insights["trend"] = (
+            "improving" if recent_avg > older_avg + 0.5
+            else "declining" if recent_avg < older_avg - 0.5
+            else "stable"
+        )
+    else:
+        insights["trend"] = "insufficient_data"
+    return insights
+
+
+def random_scores(rng):
+    """Random history, sometimes two-valued so std lands exactly on a threshold"""
+    low = rng.randint(1, 10)
+    high = rng.randint(low, 10)
+    n = rng.randint(1, 60)
+    if rng.random() < 0.3:
+        return [rng.choice([low, high]) for _ in range(n)]
+    return [rng.randint(low, high) for _ in range(n)]
+
+
+class TestStreamingMoodStats:
+    """Test one-pass statistics against the NumPy implementation"""
+
+    def test_matches_numpy(self):
+        """Test identical insights on random histories"""
+        rng = random.Random(0)
+        for _ in range(2000):
+            scores = random_scores(rng)
+            assert StreamingMoodStats.from_scores(scores).insights() == reference_insights(scores)
+
+    def test_merge_matches_single_pass(self):
+        """Test that merging pages gives the same insights as one pass"""
+        rng = random.Random(1)
+        for _ in range(500):
+            scores = random_scores(rng)
+            split = rng.randint(0, len(scores))
+            merged = StreamingMoodStats.from_scores(scores[:split]).merge(
+                StreamingMoodStats.from_scores(scores[split:])
+            )
+            assert merged.insights() == reference_insights(scores)
+
+    def test_non_integer_scores(self):
+        """Test scores outside the histogram"""
+        scores = [2.5, 7, 11, 4.25, 6, 6, 9, 1.5]
+        stats = StreamingMoodStats.from_scores(scores)
+
+        assert stats.std == pytest.approx(float(np.std(scores)))
+        assert stats.insights() == reference_insights(scores)
+
+
+class TestMoodInsights:
+    """Test MoodPredictor.get_mood_insights"""
+
+    def test_uses_entry_order(self):
+        """Test that the trend compares the last entries given with the rest"""
+        history = [{'mood_score': s} for s in [3] * 7 + [8] * 7]
+        insights = MoodPredictor(store=MoodModelStore()).get_mood_insights(history)
+
+        assert insights == reference_insights([3] * 7 + [8] * 7)
+        assert insights['trend'] == "improving"
+
+    def test_missing_scores(self):
+        """Test entries without scores"""
+        insights = MoodPredictor(store=MoodModelStore()).get_mood_insights([{'note': 'x'}])
+
+        assert insights == {"success": False, "error": "No mood scores found"}
+
+    def test_mixed_history_skips_unscored_entries(self):
+        """Test that entries without a score are ignored, not fatal"""
+        scores = [3] * 7 + [8] * 7
+        history = [{'mood_score': s} for s in scores]
+        history[2:2] = [{'note': 'x'}, {'mood_score': None}]
+        insights = MoodPredictor(store=MoodModelStore()).get_mood_insights(history)
+
+        assert insights == reference_insights(scores)